@@ -5,12 +5,121 @@ import zipfile
 import shutil
 import app.core.config as config
 from app.core.errors import to_http_error
-import json
+from app.utils.paths import invalidate_collection_cache
+from app.utils.zip_utils import extract_members_parallel, stream_extract, STREAM_UNZIP_AVAILABLE
+import orjson
 from datetime import datetime, UTC
 from fastapi.responses import JSONResponse
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import os
+import re
 
 router = APIRouter(prefix="/collections", tags=["collections"])
 
+# System/metadata entries skipped during extraction (at any depth):
+# macOS resource forks (._*), Office lock files (~$*), .DS_Store, Thumbs.db
+_SKIP_RE = re.compile(r'(?:^|/)(?:\._|~\$)|(?:^|/)(?:\.DS_Store|Thumbs\.db)$')
+
+# Thread pool for ZIP extraction so large uploads don't block the event loop
+extraction_executor = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="extract")
+
+# Single background thread that deletes discarded collections
+cleanup_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cleanup")
+
+
+def _discard_collection(collection_root: Path) -> None:
+    """
+    Remove a failed collection without waiting for the delete.
+    
+    The directory is renamed into a trash dir next to COLLECTIONS_ROOT (O(1)
+    on the same filesystem) and removed on ``cleanup_executor``, so the
+    error response isn't held up by rmtree of partially extracted files.
+    """
+    # Existence checks are cached on the resolved root; drop it before the path goes away
+    invalidate_collection_cache(collection_root.resolve())
+    trash = config.COLLECTIONS_ROOT.parent / ".trash" / uuid.uuid4().hex
+    try:
+        trash.parent.mkdir(parents=True, exist_ok=True)
+        os.rename(collection_root, trash)
+    except OSError:
+        # Different filesystem or rename not permitted - delete in place
+        shutil.rmtree(collection_root, ignore_errors=True)
+        return
+    cleanup_executor.submit(shutil.rmtree, trash, True)
+
+
+def _do_extract(collection_root: Path, zip_stream, company_id: str, collection_id: str) -> None:
+    """
+    Extract the uploaded ZIP into input/raw and write collection metadata.
+    
+    Reads the archive straight from the spooled upload, so no temp.zip copy
+    is written. Runs in ``extraction_executor``; everything here is blocking I/O.
+    
+    Raises:
+        ValueError: If the ZIP is invalid or contains no valid files
+    """
+    raw_dir = collection_root / "input" / "raw"
+    
+    # Extract ZIP (skip macOS resource fork files and other metadata)
+    try:
+        zip_stream.seek(0)
+        with zipfile.ZipFile(zip_stream, 'r') as zf:
+            skipped_files = []
+            to_extract = []
+            for member in zf.namelist():
+                # Skip macOS resource fork files (._*), .DS_Store, and other metadata
+                if _SKIP_RE.search(member):
+                    skipped_files.append(member)
+                    continue
+                # Skip directory entries
+                if member.endswith('/'):
+                    continue
+                to_extract.append(member)
+            
+            # Extract files in parallel (failures are logged and skipped)
+            failed = extract_members_parallel(zf, to_extract, raw_dir)
+            skipped_files.extend(failed)
+            extracted_count = len(to_extract) - len(failed)
+        
+        if skipped_files:
+            print(f"Note: Skipped {len(skipped_files)} metadata/system files (e.g., macOS resource forks)")
+    except zipfile.BadZipFile:
+        # No readable central directory - try a sequential pass over local headers
+        if not STREAM_UNZIP_AVAILABLE:
+            _discard_collection(collection_root)
+            raise ValueError("Invalid ZIP file")
+        try:
+            zip_stream.seek(0)
+            extracted_count, skipped_files = stream_extract(zip_stream, raw_dir, skip=_SKIP_RE.search)
+        except ValueError as e:
+            # Truncated upload: never keep a partial collection
+            _discard_collection(collection_root)
+            raise ValueError(f"Invalid ZIP file: {e}")
+        except Exception:
+            _discard_collection(collection_root)
+            raise ValueError("Invalid ZIP file")
+        if skipped_files:
+            print(f"Note: Skipped {len(skipped_files)} metadata/system files (e.g., macOS resource forks)")
+    
+    # Check if ZIP was empty (after filtering) - metadata files were never extracted,
+    # so the extraction count is authoritative and no directory rescan is needed
+    if extracted_count == 0:
+        _discard_collection(collection_root)
+        raise ValueError("ZIP file is empty or contains no valid resume files")
+    
+    # Create collection metadata
+    meta = {
+        "collection_id": collection_id,
+        "company_id": company_id,
+        "created_at": datetime.now(UTC).isoformat(),
+        "upload_status": "uploaded"
+    }
+    
+    meta_file = collection_root / "collection_meta.json"
+    meta_file.write_bytes(orjson.dumps(meta, option=orjson.OPT_INDENT_2))
+
+
 @router.post("/create")
 async def create_collection(
     company_id: str = Form(...),
@@ -29,68 +138,18 @@ async def create_collection(
         raw_dir = collection_root / "input" / "raw"
         raw_dir.mkdir(parents=True, exist_ok=True)
         
-        # Save uploaded ZIP temporarily
-        temp_zip = collection_root / "temp.zip"
-        with open(temp_zip, 'wb') as f:
-            content = await zip_file.read()
-            f.write(content)
-        
-        # Extract ZIP (skip macOS resource fork files and other metadata)
+        # Extract + validate + write metadata off the event loop (30 minutes max)
+        extraction = extraction_executor.submit(
+            _do_extract, collection_root, zip_file.file, company_id, collection_id
+        )
         try:
-            with zipfile.ZipFile(temp_zip, 'r') as zf:
-                skipped_files = []
-                extracted_count = 0
-                for member in zf.namelist():
-                    # Skip macOS resource fork files (._*), .DS_Store, and other metadata
-                    if (member.startswith('._') or 
-                        member.endswith('/.DS_Store') or 
-                        member == '.DS_Store' or
-                        member == 'Thumbs.db' or
-                        member.startswith('~$')):
-                        skipped_files.append(member)
-                        continue
-                    # Skip directory entries
-                    if member.endswith('/'):
-                        continue
-                    # Extract file
-                    try:
-                        zf.extract(member, raw_dir)
-                        extracted_count += 1
-                    except Exception as e:
-                        # Log but continue with other files
-                        print(f"Warning: Failed to extract {member}: {e}")
-                        skipped_files.append(member)
-                
-                if skipped_files:
-                    print(f"Note: Skipped {len(skipped_files)} metadata/system files (e.g., macOS resource forks)")
-        except zipfile.BadZipFile:
-            # Clean up and raise error
-            shutil.rmtree(collection_root)
-            raise ValueError("Invalid ZIP file")
-        finally:
-            # Remove temp ZIP
-            if temp_zip.exists():
-                temp_zip.unlink()
-        
-        # Check if ZIP was empty (after filtering)
-        valid_files = [f for f in raw_dir.rglob("*") 
-                      if f.is_file() 
-                      and not f.name.startswith('._')
-                      and f.name != '.DS_Store']
-        if not valid_files:
-            shutil.rmtree(collection_root)
-            raise ValueError("ZIP file is empty or contains no valid resume files")
-        
-        # Create collection metadata
-        meta = {
-            "collection_id": collection_id,
-            "company_id": company_id,
-            "created_at": datetime.now(UTC).isoformat(),
-            "upload_status": "uploaded"
-        }
-        
-        meta_file = collection_root / "collection_meta.json"
-        meta_file.write_text(json.dumps(meta, indent=2), encoding='utf-8')
+            # shield: a timeout must not detach us from the still-running worker
+            await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(extraction)), timeout=1800.0)  # 30 minutes
+        except asyncio.TimeoutError:
+            # The worker can't be interrupted; once it stops, drop whatever it
+            # extracted so the failed upload leaves no orphaned collection
+            extraction.add_done_callback(lambda _: _discard_collection(collection_root))
+            raise ValueError("ZIP extraction timed out after 30 minutes. Please try a smaller archive.")
         
         return {
             "status": "uploaded",
@@ -1,12 +1,13 @@
 """RAG evaluation API endpoints."""
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from typing import Optional
 from app.models.evaluation_schemas import (
     EvaluationRequest, EvaluationResponse, CollectionEvaluationSummary
 )
 from app.models.rag_schemas import RAGQueryRequest
 from app.services.evaluation_service import (
-    evaluate_rag_query, compute_collection_summary, load_evaluation_records
+    evaluate_rag_query, compute_collection_summary, load_evaluation_records_raw
 )
 from app.utils.paths import get_collection_root, assert_collection_exists
 from app.core.errors import to_http_error
@@ -36,7 +37,7 @@ async def evaluate_rag_endpoint(
         assert_collection_exists(collection_root)
         
         # Run evaluation
-        record = evaluate_rag_query(
+        record = await evaluate_rag_query(
             company_id=request.company_id,
             collection_id=collection_id,
             question=request.question,
@@ -85,7 +86,8 @@ async def get_evaluation_summary(
         collection_root = get_collection_root(company_id, collection_id)
         assert_collection_exists(collection_root)
         
-        summary = compute_collection_summary(company_id, collection_id)
+        # File I/O (and a one-off legacy migration) runs off the event loop
+        summary = await asyncio.to_thread(compute_collection_summary, company_id, collection_id)
         
         if not summary:
             raise HTTPException(
@@ -106,7 +108,7 @@ async def get_evaluation_records(
     collection_id: str,
     company_id: str = Query(..., description="Company identifier"),
     limit: int = Query(50, ge=1, le=100)
-) -> dict:
+) -> ORJSONResponse:
     """
     Get evaluation records for a collection.
     
@@ -122,12 +124,16 @@ async def get_evaluation_records(
         collection_root = get_collection_root(company_id, collection_id)
         assert_collection_exists(collection_root)
         
-        records = load_evaluation_records(company_id, collection_id)
+        # Only the newest `limit` lines of the log are parsed
+        total, records = await asyncio.to_thread(
+            load_evaluation_records_raw, company_id, collection_id, limit
+        )
         
-        return {
-            "total": len(records),
-            "records": [r.model_dump() for r in records[:limit]]
-        }
+        # Stored records are already schema-shaped dicts; orjson serializes them directly
+        return ORJSONResponse({
+            "total": total,
+            "records": records
+        })
         
     except Exception as exc:
         raise to_http_error(exc)
\ No newline at end of file
@@ -1,15 +1,62 @@
 from fastapi import APIRouter, HTTPException
 from app.models.api_schemas import ProcessRequest, StandardResponse
 from app.utils.paths import get_collection_root, assert_collection_exists
+from app.utils.filesystem import dir_has_entries
 from app.services.processing_service import process_collection
 from app.core.errors import to_http_error
 import asyncio
+import os
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 
 router = APIRouter(prefix="/collections", tags=["processing"])
 
-# Thread pool for CPU-intensive processing with timeout protection
-executor = ThreadPoolExecutor(max_workers=1)
+# Thread pool for CPU-intensive processing with timeout protection.
+# Sized so independent collections can be processed concurrently.
+executor = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 2), thread_name_prefix="proc")
+
+# Cap concurrent processing runs per company so one tenant can't occupy every worker
+PER_COMPANY_CONCURRENCY = 2
+
+
+class _CompanySlots:
+    """A company's run semaphore and how many requests hold or await it."""
+    
+    __slots__ = ("semaphore", "users")
+    
+    def __init__(self) -> None:
+        self.semaphore = asyncio.Semaphore(PER_COMPANY_CONCURRENCY)
+        self.users = 0
+
+
+# Only companies with runs in flight or queued have an entry (touched on the event loop only)
+_company_slots: dict[str, _CompanySlots] = {}
+
+
+async def _acquire_company_slot(company_id: str) -> None:
+    slots = _company_slots.get(company_id)
+    if slots is None:
+        slots = _company_slots[company_id] = _CompanySlots()
+    slots.users += 1
+    try:
+        await slots.semaphore.acquire()
+    except BaseException:
+        # Cancelled while queued: leave without holding a slot
+        _leave_company_slots(company_id, slots)
+        raise
+
+
+def _release_company_slot(company_id: str) -> None:
+    slots = _company_slots[company_id]
+    slots.semaphore.release()
+    _leave_company_slots(company_id, slots)
+
+
+def _leave_company_slots(company_id: str, slots: _CompanySlots) -> None:
+    slots.users -= 1
+    if slots.users == 0:
+        # Idle companies are evicted so the table doesn't grow with every company seen
+        del _company_slots[company_id]
+
 
 @router.post("/{collection_id}/process")
 async def process_collection_endpoint(
@@ -38,16 +85,23 @@ async def process_collection_endpoint(
         
         # Check for raw files
         input_dir = collection_root / "input" / "raw"
-        if not input_dir.exists() or not list(input_dir.glob("*")):
+        if not dir_has_entries(input_dir):
             raise ValueError("No resume files found in collection")
         
         # 3. Run processing in executor with timeout (30 minutes max)
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
+        company_id = request.company_id
+        await _acquire_company_slot(company_id)
+        try:
+            future = executor.submit(process_collection, company_id, collection_id)
+        except BaseException:
+            _release_company_slot(company_id)
+            raise
+        # The slot is freed when the run ends, not when we stop waiting for it,
+        # so a timed-out run still counts against the company's cap
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(_release_company_slot, company_id))
         try:
-            result = await asyncio.wait_for(
-                loop.run_in_executor(executor, process_collection, request.company_id, collection_id),
-                timeout=1800.0  # 30 minutes
-            )
+            result = await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout=1800.0)  # 30 minutes
         except asyncio.TimeoutError:
             raise ValueError("Processing timed out after 30 minutes. Please try again or check for problematic files.")
         
@@ -1,10 +1,10 @@
 """RAG API endpoints."""
 import uuid
 import asyncio
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Query
+from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import StreamingResponse
-from typing import Dict
-from asyncio import Queue
+from collections import OrderedDict, deque
+from typing import Dict, List, Tuple
 from app.models.rag_schemas import (
     RAGQueryRequest, RAGStatusResponse, RAGQueryResponse,
     RAGInitializeRequest, RAGInitializeResponse
@@ -18,7 +18,143 @@ from app.core.errors import to_http_error
 router = APIRouter(prefix="/collections", tags=["rag"])
 
 # In-memory task storage (for production, use Redis or database)
-_active_tasks: Dict[str, Dict] = {}
+# Bounded: oldest tasks are evicted past MAX_ACTIVE_TASKS, finished tasks expire after TASK_TTL_SECONDS
+MAX_ACTIVE_TASKS = 1024
+TASK_TTL_SECONDS = 300
+_active_tasks: "OrderedDict[str, Dict]" = OrderedDict()
+# Strong references to running query tasks (the loop only keeps weak ones)
+_running_tasks: set = set()
+
+
+# Max chunks retained per task for replay to reconnecting SSE clients
+RAG_CHUNK_BUFFER_SIZE = 4096
+
+# SSE micro-batching: after the first chunk, linger this long (or until this many
+# characters) so one frame carries several LLM tokens
+SSE_FLUSH_SECONDS = 0.015
+SSE_FLUSH_CHARS = 1024
+# Chunks with this prefix are errors; they are never coalesced with content, so
+# the client's startsWith("Error:") check sees them at the start of a frame
+SSE_ERROR_PREFIX = "Error:"
+
+
+def _cut_at_error(
+    batch: List[Tuple[int, str]], done: bool, frame_start: bool
+) -> Tuple[List[Tuple[int, str]], bool, bool]:
+    """
+    Truncate ``batch`` so an error chunk ends up alone in its own frame.
+    
+    An error at the very start of a frame is kept (and ends it); any later one
+    is left for the next read.
+    
+    Returns:
+        Tuple of (kept chunks, done, whether an error ended the frame)
+    """
+    for i, (_, chunk) in enumerate(batch):
+        if chunk.startswith(SSE_ERROR_PREFIX):
+            end = 1 if i == 0 and frame_start else i
+            return batch[:end], done and end == len(batch), True
+    return batch, done, False
+
+
+class ChunkBroadcast:
+    """
+    Append-only chunk log shared by every SSE client of a RAG task.
+    
+    Chunks keep absolute indices (used as SSE event ids), so a client that
+    reconnects with Last-Event-ID resumes from its cursor. Only the last
+    ``maxlen`` chunks are retained.
+    """
+    
+    def __init__(self, maxlen: int = RAG_CHUNK_BUFFER_SIZE) -> None:
+        self._chunks: deque = deque(maxlen=maxlen)
+        self._total = 0
+        self._cond = asyncio.Condition()
+        self.done = False
+    
+    async def append(self, chunk: str) -> None:
+        async with self._cond:
+            self._chunks.append(chunk)
+            self._total += 1
+            self._cond.notify_all()
+    
+    async def close(self) -> None:
+        async with self._cond:
+            self.done = True
+            self._cond.notify_all()
+    
+    async def read_from(self, cursor: int, timeout: float) -> Tuple[List[Tuple[int, str]], bool]:
+        """
+        Wait until chunks past ``cursor`` exist (or the stream is done).
+        
+        Returns:
+            Tuple of ([(event_id, chunk), ...], done)
+        
+        Raises:
+            asyncio.TimeoutError: If nothing arrives within ``timeout`` seconds
+        """
+        async with self._cond:
+            await asyncio.wait_for(
+                self._cond.wait_for(lambda: self._total > cursor or self.done),
+                timeout=timeout
+            )
+            first = self._total - len(self._chunks)
+            start = max(cursor, first)
+            batch = [(i, self._chunks[i - first]) for i in range(start, self._total)]
+            return batch, self.done
+    
+    async def read_batch(
+        self,
+        cursor: int,
+        timeout: float,
+        linger: float = SSE_FLUSH_SECONDS,
+        max_chars: int = SSE_FLUSH_CHARS
+    ) -> Tuple[int, str, bool]:
+        """
+        Wait for chunks past ``cursor``, then linger briefly to coalesce more.
+        
+        Error chunks (``SSE_ERROR_PREFIX``) are never joined with content: the
+        batch stops before one, and one at the cursor is returned on its own.
+        
+        Returns:
+            Tuple of (last event id or -1 if none, joined text, done)
+        
+        Raises:
+            asyncio.TimeoutError: If nothing arrives within ``timeout`` seconds
+        """
+        batch, done = await self.read_from(cursor, timeout)
+        batch, done, stop = _cut_at_error(batch, done, frame_start=True)
+        size = sum(len(chunk) for _, chunk in batch)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + linger
+        while batch and not done and not stop and size < max_chars:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                more, done = await self.read_from(batch[-1][0] + 1, remaining)
+            except asyncio.TimeoutError:
+                break
+            more, done, stop = _cut_at_error(more, done, frame_start=False)
+            batch += more
+            size += sum(len(chunk) for _, chunk in more)
+        last_id = batch[-1][0] if batch else -1
+        return last_id, "".join(chunk for _, chunk in batch), done
+
+
+def _register_task(task_id: str, task: Dict) -> None:
+    """Store a new task, evicting (and cancelling) the oldest entries when over capacity."""
+    _active_tasks[task_id] = task
+    while len(_active_tasks) > MAX_ACTIVE_TASKS:
+        _, evicted = _active_tasks.popitem(last=False)
+        runner = evicted.get("task")
+        if runner is not None and not runner.done():
+            runner.cancel()
+
+
+def _expire_task_later(task_id: str) -> None:
+    """Drop a finished task after TASK_TTL_SECONDS so late SSE clients can still read its status."""
+    asyncio.get_running_loop().call_later(TASK_TTL_SECONDS, _active_tasks.pop, task_id, None)
 
 
 async def _run_rag_query(
@@ -30,11 +166,15 @@ async def _run_rag_query(
     filters: dict,
     include_context: bool,
     use_ranking: bool,
-    queue: Queue
+    chunks: ChunkBroadcast
 ) -> None:
     """Background task for RAG query processing."""
+    # Keep a direct reference: the registry entry may be evicted while we run
+    task = _active_tasks.get(task_id)
+    if task is None:
+        return
     try:
-        _active_tasks[task_id]["status"] = "processing"
+        task["status"] = "processing"
         async for chunk in process_rag_query(
             company_id=company_id,
             collection_id=collection_id,
@@ -44,14 +184,19 @@ async def _run_rag_query(
             include_context=include_context,
             use_ranking=use_ranking
         ):
-            await queue.put(chunk)
+            await chunks.append(chunk)
         
-        await queue.put(None)  # Signal completion
-        _active_tasks[task_id]["status"] = "completed"
+        task["status"] = "completed"
+    except asyncio.CancelledError:
+        task["status"] = "failed"
+        task["error"] = "Task cancelled"
+        raise
     except Exception as e:
-        await queue.put(None)  # Signal error
-        _active_tasks[task_id]["status"] = "failed"
-        _active_tasks[task_id]["error"] = str(e)
+        task["status"] = "failed"
+        task["error"] = str(e)
+    finally:
+        await chunks.close()  # Signal completion (or error) to every reader
+        _expire_task_later(task_id)
 
 
 @router.post("/{collection_id}/rag/initialize", response_model=RAGInitializeResponse)
@@ -113,8 +258,7 @@ async def get_rag_status_endpoint(
 @router.post("/{collection_id}/rag/query", response_model=RAGQueryResponse)
 async def query_rag(
     collection_id: str,
-    request: RAGQueryRequest,
-    background_tasks: BackgroundTasks
+    request: RAGQueryRequest
 ) -> RAGQueryResponse:
     """
     Submit RAG query (async, returns task_id).
@@ -122,7 +266,6 @@ async def query_rag(
     Args:
         collection_id: Collection identifier
         request: RAG query request
-        background_tasks: FastAPI background tasks
         
     Returns:
         Task ID for streaming endpoint
@@ -146,18 +289,17 @@ async def query_rag(
                 "required_skills": request.filters.required_skills or []
             }
         
-        # Initialize task with queue
-        queue: Queue = Queue()
-        _active_tasks[task_id] = {
+        # Initialize task with a replayable chunk buffer
+        chunks = ChunkBroadcast()
+        _register_task(task_id, {
             "status": "queued",
             "company_id": request.company_id,
             "collection_id": collection_id,
-            "queue": queue
-        }
+            "chunks": chunks
+        })
         
-        # Queue background task
-        background_tasks.add_task(
-            _run_rag_query,
+        # Start immediately rather than after the response is sent
+        runner = asyncio.create_task(_run_rag_query(
             task_id=task_id,
             company_id=request.company_id,
             collection_id=collection_id,
@@ -166,8 +308,11 @@ async def query_rag(
             filters=filters_dict,
             include_context=request.include_context,
             use_ranking=filters_dict.get("use_ranking", True),
-            queue=queue
-        )
+            chunks=chunks
+        ))
+        _active_tasks[task_id]["task"] = runner
+        _running_tasks.add(runner)
+        runner.add_done_callback(_running_tasks.discard)
         
         return RAGQueryResponse(task_id=task_id, status="queued")
         
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, HTTPException
 from app.models.api_schemas import RankRequest, StandardResponse
 from app.utils.paths import get_collection_root, assert_collection_exists
+from app.utils.filesystem import dir_has_entries
 from app.services.ranking_service import rank_collection
 from app.core.errors import to_http_error
 
@@ -35,7 +36,7 @@ async def rank_collection_endpoint(
         
         # 4. Guard: ensure Phase 2 completed
         processed_dir = collection_root / "processed"
-        if not processed_dir.exists() or not list(processed_dir.glob("*.txt")):
+        if not dir_has_entries(processed_dir, ".txt"):
             raise ValueError("Run processing first - no processed resumes found")
         
         # 5. Call ranking service
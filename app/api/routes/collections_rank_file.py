@@ -1,9 +1,15 @@
+import asyncio
+from pathlib import Path
+
 from fastapi import APIRouter, File, Form, UploadFile
 from app.models.api_schemas import StandardResponse
 from app.utils.paths import get_collection_root, assert_collection_exists
+from app.utils.filesystem import dir_has_entries
 from app.core.errors import to_http_error
-from app.utils.jd_io import save_jd_file
-from app.utils.text_extraction import extract_text
+from app.utils.jd_io import MAX_JD_FILE_BYTES, jd_file_path, save_jd_bytes
+from app.utils.text_extraction import (
+    BYTES_EXTRACTABLE_SUFFIXES, extract_text, extract_text_from_bytes
+)
 from app.services.ranking_service import rank_collection
 
 router = APIRouter(prefix="/collections", tags=["ranking"])
@@ -38,20 +44,31 @@ async def rank_collection_from_file(
 
         # 2) Guard: require processed resumes
         processed_dir = collection_root / "processed"
-        if not processed_dir.exists() or not list(processed_dir.glob("*.txt")):
+        if not dir_has_entries(processed_dir, ".txt"):
             raise ValueError("Run processing first - no processed resumes found")
 
-        # 3) Save JD file to input/jd.<ext>
-        saved_jd_path = save_jd_file(
-            collection_root=collection_root,
-            filename=jd_file.filename or "jd.txt",
-            file_stream=jd_file.file,
-        )
+        # 3) Read JD upload (bounded) and validate type
+        filename = jd_file.filename or "jd.txt"
+        saved_jd_path = jd_file_path(collection_root, filename)
+        data = await jd_file.read(MAX_JD_FILE_BYTES + 1)
+        if len(data) > MAX_JD_FILE_BYTES:
+            raise ValueError(f"JD file too large (max {MAX_JD_FILE_BYTES // (1024 * 1024)} MB)")
 
-        # 4) Extract JD text
-        jd_text = extract_text(saved_jd_path).strip()
-        if not jd_text:
-            raise ValueError("JD has no extractable text")
+        # 4) Extract JD text. TXT/DOCX are parsed in memory and saved to
+        # input/jd.<ext> while ranking runs; PDFs (OCR needs a file) are saved first.
+        save_future = None
+        if Path(filename).suffix.lower() in BYTES_EXTRACTABLE_SUFFIXES:
+            jd_text = extract_text_from_bytes(data, filename).strip()
+            if not jd_text:
+                raise ValueError("JD has no extractable text")
+            save_future = asyncio.get_running_loop().run_in_executor(
+                None, save_jd_bytes, collection_root, filename, data
+            )
+        else:
+            save_jd_bytes(collection_root, filename, data)
+            jd_text = extract_text(saved_jd_path).strip()
+            if not jd_text:
+                raise ValueError("JD has no extractable text")
 
         # 5) Reuse existing ranking service (Phase 3)
         result = rank_collection(
@@ -60,6 +77,8 @@ async def rank_collection_from_file(
             jd_text=jd_text,
             top_k=top_k,
         )
+        if save_future is not None:
+            await save_future
 
         return StandardResponse(
             status="completed",
@@ -1,20 +1,30 @@
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
+import orjson
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 import logging
+import os
+import urllib.parse
 from app.utils.paths import get_collection_root, assert_collection_exists
-from app.utils.io_reports import read_json_file, get_report_paths
+from app.utils.io_reports import read_json_file, read_json_files, get_report_paths
 from app.core.errors import to_http_error
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/collections", tags=["reports"])
 
+# Report path keys read by get_collection_report, in unpacking order
+_REPORT_KEYS = ("meta", "validation", "duplicates", "ranking_summary", "latency")
+_REPORT_KEYS_WITH_RESULTS = _REPORT_KEYS + ("ranking_json",)
+
 @router.get("/{collection_id}/report")
 async def get_collection_report(
     collection_id: str,
     company_id: str = Query(..., description="Company identifier"),
     include_results: bool = Query(False, description="Include full ranking results")
-) -> dict:
+) -> ORJSONResponse:
     """
     Return aggregated reports for a collection.
     
@@ -37,68 +47,112 @@ async def get_collection_report(
         # Get report paths
         paths = get_report_paths(collection_root)
         
-        # Build response
+        # Read all reports in one batch; missing or invalid files come back as None
+        keys = _REPORT_KEYS_WITH_RESULTS if include_results else _REPORT_KEYS
+        meta, validation, duplicates, ranking_summary, latency, *results = await read_json_files(
+            [paths[key] for key in keys]
+        )
+        
+        # Build response in one expression once all reads have resolved
+        phase3 = {"ranking_summary": ranking_summary}
+        if results and results[0] is not None:
+            phase3["ranking_results"] = results[0]
         response = {
             "collection_id": collection_id,
             "company_id": company_id,
-            "meta": None,
+            "meta": meta,
             "phase2": {
-                "validation_report": None,
-                "duplicate_report": None
-            },
-            "phase3": {
-                "ranking_summary": None
+                "validation_report": validation,
+                "duplicate_report": duplicates
             },
-            "latency": None,
+            "phase3": phase3,
+            # Latency report (p50 / p95 / p99 per stage)
+            "latency": latency,
         }
         
-        # Read meta if exists
-        try:
-            response["meta"] = read_json_file(paths["meta"])
-        except ValueError:
-            pass
-        
-        # Read Phase 2 reports if exist
-        try:
-            response["phase2"]["validation_report"] = read_json_file(paths["validation"])
-        except ValueError:
-            pass
-        
-        try:
-            response["phase2"]["duplicate_report"] = read_json_file(paths["duplicates"])
-        except ValueError:
-            pass
-        
-        # Read Phase 3 reports if exist
-        try:
-            response["phase3"]["ranking_summary"] = read_json_file(paths["ranking_summary"])
-        except ValueError:
-            pass
+        # Report payloads are plain JSON data; orjson skips jsonable_encoder + json.dumps
+        return ORJSONResponse(response)
         
-        # Latency report (p50 / p95 / p99 per stage)
+    except ValueError as exc:
+        raise to_http_error(exc)
+
+
+# Report sections emitted by /report/stream, in order: (section name, report path key)
+_STREAM_SECTIONS = [
+    ("meta", "meta"),
+    ("validation_report", "validation"),
+    ("duplicate_report", "duplicates"),
+    ("ranking_summary", "ranking_summary"),
+    ("latency", "latency"),
+]
+
+# Ranking rows serialized per yielded chunk
+_STREAM_ROWS_PER_CHUNK = 256
+
+
+def _ndjson_line(section: str, data) -> bytes:
+    return orjson.dumps({"section": section, "data": data}) + b"\n"
+
+
+def _iter_report_ndjson(paths: dict, include_results: bool):
+    """Yield report sections as NDJSON; ranking results go out one row per line."""
+    for section, key in _STREAM_SECTIONS:
         try:
-            response["latency"] = read_json_file(paths["latency"])
+            data = read_json_file(paths[key])
         except ValueError:
-            pass
-        
-        # Include full results if requested
-        if include_results:
-            try:
-                response["phase3"]["ranking_results"] = read_json_file(paths["ranking_json"])
-            except ValueError:
-                pass
-        
-        return response
-        
-    except Exception as exc:
+            data = None
+        yield _ndjson_line(section, data)
+    
+    if not include_results:
+        return
+    try:
+        results = read_json_file(paths["ranking_json"])
+    except ValueError:
+        return
+    for start in range(0, len(results), _STREAM_ROWS_PER_CHUNK):
+        yield b"".join(
+            _ndjson_line("ranking_results", row)
+            for row in results[start:start + _STREAM_ROWS_PER_CHUNK]
+        )
+
+
+@router.get("/{collection_id}/report/stream")
+async def stream_collection_report(
+    collection_id: str,
+    company_id: str = Query(..., description="Company identifier"),
+    include_results: bool = Query(False, description="Include full ranking results")
+) -> StreamingResponse:
+    """
+    Stream aggregated reports as NDJSON.
+    
+    Each line is ``{"section": <name>, "data": <report>}`` for meta,
+    validation_report, duplicate_report, ranking_summary and latency
+    (data is null when missing), followed by one ``ranking_results`` line per
+    ranked resume when include_results is set, so clients can consume rows
+    before the whole payload is sent.
+    
+    Raises:
+        HTTPException: 404 if collection not found
+    """
+    try:
+        collection_root = get_collection_root(company_id, collection_id)
+        assert_collection_exists(collection_root)
+        paths = get_report_paths(collection_root)
+    except ValueError as exc:
         raise to_http_error(exc)
+    
+    # Sync generator: Starlette iterates it on the threadpool, keeping reads off the loop
+    return StreamingResponse(
+        _iter_report_ndjson(paths, include_results),
+        media_type="application/x-ndjson"
+    )
 
 
 @router.get("/{collection_id}/latency")
-async def get_latency_report(
+def get_latency_report(
     collection_id: str,
     company_id: str = Query(..., description="Company identifier"),
-) -> dict:
+) -> ORJSONResponse:
     """
     Return per-stage latency percentiles (p50 / p95 / p99) for a collection.
 
@@ -109,21 +163,19 @@ async def get_latency_report(
         assert_collection_exists(collection_root)
         paths = get_report_paths(collection_root)
         report = read_json_file(paths["latency"])
-        return {"collection_id": collection_id, "company_id": company_id, "latency": report}
+        return ORJSONResponse({"collection_id": collection_id, "company_id": company_id, "latency": report})
     except ValueError:
         raise HTTPException(
             status_code=404,
             detail="Latency report not found. Run Phase 2 processing first.",
         )
-    except Exception as exc:
-        raise to_http_error(exc)
 
 
 @router.get("/{collection_id}/outputs")
-async def get_collection_outputs(
+def get_collection_outputs(
     collection_id: str,
     company_id: str = Query(..., description="Company identifier")
-) -> dict:
+) -> ORJSONResponse:
     """
     Return file availability for collection outputs.
     
@@ -145,23 +197,54 @@ async def get_collection_outputs(
         # Get report paths
         paths = get_report_paths(collection_root)
         
-        # Check file availability
+        # Check file availability with one directory read (sync endpoint: runs on the threadpool)
+        try:
+            with os.scandir(paths["ranking_json"].parent) as it:
+                names = {entry.name for entry in it}
+        except FileNotFoundError:
+            names = set()
         outputs = {
-            "ranking_results.json": paths["ranking_json"].exists(),
-            "ranking_results.csv": paths["ranking_csv"].exists()
+            "ranking_results.json": paths["ranking_json"].name in names,
+            "ranking_results.csv": paths["ranking_csv"].name in names
         }
         
-        return {"outputs": outputs}
+        return ORJSONResponse({"outputs": outputs})
         
-    except Exception as exc:
+    except ValueError as exc:
         raise to_http_error(exc)
 
+# Suffix of per-resume NER output files in processed/
+_ENTITIES_SUFFIX = "_entities.json"
+
+
+def _stem(name: str) -> str:
+    """Same result as Path(name).stem for a bare filename, without building a Path."""
+    dot = name.rfind(".")
+    return name[:dot] if 0 < dot < len(name) - 1 else name
+
+
+@lru_cache(maxsize=256)
+def _entities_index(processed_dir: str, mtime_ns: int) -> dict[str, Path]:
+    """
+    Map resume base name -> entities file for a processed directory.
+    
+    Keyed by the directory mtime, which changes whenever files are added or
+    removed, so the index is rebuilt only after processing writes new output.
+    """
+    with os.scandir(processed_dir) as it:
+        return {
+            entry.name[:-len(_ENTITIES_SUFFIX)]: Path(entry.path)
+            for entry in it
+            if entry.name.endswith(_ENTITIES_SUFFIX)
+        }
+
+
 @router.get("/{collection_id}/entities/{filename}")
-async def get_resume_entities(
+def get_resume_entities(
     collection_id: str,
     filename: str,
     company_id: str = Query(..., description="Company identifier")
-) -> dict:
+) -> ORJSONResponse:
     """
     Get NER entities for a specific resume.
     
@@ -193,73 +276,45 @@ async def get_resume_entities(
         # 2. Use that as base for entities file
         
         # URL decode the filename in case it's encoded
-        import urllib.parse
         filename = urllib.parse.unquote(filename)
         
-        logger.debug(f"Looking for entities for filename: {filename}")
-        
-        filename_path = Path(filename)
+        logger.debug("Looking for entities for filename: %s", filename)
         
-        # If filename ends with .txt, remove it (it's the processed .txt file)
-        if filename_path.suffix == ".txt":
-            base_name = filename_path.stem  # This removes .txt, leaving original name (e.g., "resume.pdf")
-        else:
-            # It's the original filename, use as is
-            base_name = filename_path.stem
+        # "resume.pdf.txt" -> "resume.pdf" (processed file); "resume.pdf" -> "resume"
+        base_name = _stem(filename.rsplit("/", 1)[-1])
         
-        logger.debug(f"Extracted base name: {base_name}")
+        logger.debug("Extracted base name: %s", base_name)
         
-        # Try to find entities file
-        entities_file = processed_dir / f"{base_name}_entities.json"
-        logger.debug(f"Looking for entities file: {entities_file}")
+        # O(1) lookup in the cached base-name index (rebuilt when the dir changes)
+        index = _entities_index(str(processed_dir), processed_dir.stat().st_mtime_ns)
+        entities_file = index.get(base_name)
         
-        # If not found, try alternative patterns
-        if not entities_file.exists():
-            # Try with the full filename stem (in case there are multiple dots)
-            alt_file = processed_dir / f"{filename_path.stem}_entities.json"
-            if alt_file.exists():
-                logger.debug(f"Found alternative entities file: {alt_file}")
-                entities_file = alt_file
+        # If not found, provide helpful error
+        if entities_file is None:
+            error_msg = (
+                f"Entities file not found for filename '{filename}'. "
+                f"Tried base name: '{base_name}'. "
+            )
+            if index:
+                error_msg += f"Available entities files (first 10): {list(islice(index, 10))}"
             else:
-                # Try searching for any entities file that matches
-                # List all entities files
-                available_entities = list(processed_dir.glob("*_entities.json"))
-                logger.debug(f"Found {len(available_entities)} total entities files")
-                
-                # Try to find a match by comparing base names
-                for entity_file in available_entities:
-                    entity_base = entity_file.stem.replace("_entities", "")
-                    # Check if the base name matches (handling different extensions)
-                    if entity_base == base_name or entity_base == filename_path.stem:
-                        logger.debug(f"Matched entities file: {entity_file}")
-                        entities_file = entity_file
-                        break
-                
-                # If still not found, provide helpful error
-                if not entities_file.exists():
-                    available_names = [f.stem.replace("_entities", "") for f in available_entities[:10]]
-                    error_msg = (
-                        f"Entities file not found for filename '{filename}'. "
-                        f"Tried base name: '{base_name}'. "
-                    )
-                    if available_entities:
-                        error_msg += f"Available entities files (first 10): {available_names}"
-                    else:
-                        error_msg += (
-                            "No entities files found in processed directory. "
-                            "This usually means processing failed or entities extraction was not completed. "
-                            "Please re-run processing (Phase 2) to generate entities files."
-                        )
-                    logger.warning(error_msg)
-                    raise ValueError(error_msg)
+                error_msg += (
+                    "No entities files found in processed directory. "
+                    "This usually means processing failed or entities extraction was not completed. "
+                    "Please re-run processing (Phase 2) to generate entities files."
+                )
+            logger.warning(error_msg)
+            raise ValueError(error_msg)
+        
+        logger.debug("Matched entities file: %s", entities_file)
         
         # Read entities JSON
         entities_data = read_json_file(entities_file)
         
-        return {
+        return ORJSONResponse({
             "filename": filename,
             "entities": entities_data
-        }
+        })
         
-    except Exception as exc:
+    except ValueError as exc:
         raise to_http_error(exc)
@@ -63,3 +63,22 @@ TEXT_MIN_CHARS_PER_PAGE = int(os.getenv("TEXT_MIN_CHARS_PER_PAGE", "50"))
 OCR_PRIMARY = os.getenv("OCR_PRIMARY", "tesseract").lower()
 OCR_TIMEOUT_SECONDS = int(os.getenv("OCR_TIMEOUT_SECONDS", "30"))
 OCR_MAX_RETRIES = int(os.getenv("OCR_MAX_RETRIES", "2"))
+
+# Documents per spaCy nlp.pipe minibatch during Phase 2 NER
+SPACY_BATCH_SIZE = int(os.getenv("SPACY_BATCH_SIZE", "64"))
+
+# Sentence-transformer encode batch size for RAG index builds
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "64"))
+# "torch" (default; fp16 on CUDA) or "onnx" (int8-quantized ONNX Runtime on CPU,
+# needs optimum[onnxruntime]); falls back to torch if the backend can't load
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "torch").lower()
+# torch intra-op threads for embedding encodes; half the cores by default so
+# concurrent requests don't oversubscribe the CPU (0 keeps torch's default)
+EMBEDDING_TORCH_THREADS = int(os.getenv("EMBEDDING_TORCH_THREADS", str(max(1, (os.cpu_count() or 2) // 2))))
+# Load and warm up the embedding model at app startup instead of on first query
+EMBEDDING_PREWARM = os.getenv("EMBEDDING_PREWARM", "true").lower() in ("1", "true", "yes")
+
+# Ragas evaluation: judge model and on-disk cache of LLM/embedding responses
+RAGAS_LLM_MODEL = os.getenv("RAGAS_LLM_MODEL", "gpt-4o-mini")
+RAGAS_EMBEDDING_MODEL = os.getenv("RAGAS_EMBEDDING_MODEL", "text-embedding-3-small")
+RAGAS_CACHE_DIR = os.getenv("RAGAS_CACHE_DIR", str(BASE_STORAGE_PATH / ".ragas_cache"))
@@ -1,5 +1,14 @@
 from fastapi import HTTPException
 
+
+class CollectionNotFoundError(ValueError):
+    """Raised when a collection directory does not exist."""
+
+
+class ReportNotFoundError(ValueError):
+    """Raised when a requested report file does not exist."""
+
+
 def to_http_error(exc: Exception) -> HTTPException:
     """
     Convert internal exceptions to safe HTTP responses.
@@ -10,17 +19,13 @@ def to_http_error(exc: Exception) -> HTTPException:
     Returns:
         HTTPException with appropriate status code
     """
+    # Missing collections/reports are 404
+    if isinstance(exc, (CollectionNotFoundError, ReportNotFoundError)):
+        return HTTPException(status_code=404, detail=str(exc))
+    
+    # All other ValueErrors are 400
     if isinstance(exc, ValueError):
-        error_msg = str(exc)
-        
-        # Map specific error messages to 404
-        if "collection not found" in error_msg.lower():
-            return HTTPException(status_code=404, detail=error_msg)
-        if "report not found" in error_msg.lower():
-            return HTTPException(status_code=404, detail=error_msg)
-        
-        # All other ValueErrors are 400
-        return HTTPException(status_code=400, detail=error_msg)
+        return HTTPException(status_code=400, detail=str(exc))
     
     # Generic server error (no stack trace leak)
     return HTTPException(status_code=500, detail="Internal server error")
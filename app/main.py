@@ -1,4 +1,4 @@
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, Header, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, StreamingResponse
@@ -9,6 +9,7 @@ from app.api.routes.v2 import companies, jobs, dashboard, resumes, pipeline
 import asyncio
 import logging
 import os
+import threading
 import traceback
 from pathlib import Path
 
@@ -26,6 +27,17 @@ try:
 except ImportError:
     pass
 
+# Pre-encoded SSE framing for the /rag/stream hot loop
+SSE_DATA_PREFIX = b"data: "
+SSE_DATA_NEWLINE = "\ndata: "
+SSE_FRAME_END = b"\n\n"
+
+
+def _sse_frame(text: str, event_id: int | None = None) -> bytes:
+    # Multi-line payloads need one "data:" line per line; EventSource rejoins them with "\n"
+    frame = SSE_DATA_PREFIX + text.replace("\n", SSE_DATA_NEWLINE).encode("utf-8") + SSE_FRAME_END
+    return frame if event_id is None else b"id: %d\n" % event_id + frame
+
 
 def _cors_origins() -> list[str]:
     origins = [
@@ -49,12 +61,19 @@ app = FastAPI(
 
 @app.on_event("startup")
 def _startup_init() -> None:
+    import app.core.config as config
     from app.models.db import init_db
     from app.utils.model_cache import ModelCache
 
     init_db()
     ModelCache.get_instance()
 
+    if config.EMBEDDING_PREWARM:
+        from app.utils.embeddings import warmup_embedding_model
+
+        # Kept resident afterwards; warming in the background doesn't delay startup
+        threading.Thread(target=warmup_embedding_model, name="embedding-warmup", daemon=True).start()
+
 
 app.add_middleware(
     CORSMiddleware,
@@ -144,45 +163,52 @@ async def health_models():
 
 
 @app.get("/rag/stream/{task_id}")
-async def stream_rag_response(task_id: str):
+async def stream_rag_response(
+    task_id: str,
+    last_event_id: str | None = Header(None, alias="Last-Event-ID"),
+):
     from app.api.routes.collections_rag import _active_tasks
 
     if task_id not in _active_tasks:
         raise HTTPException(status_code=404, detail="Task not found")
 
+    # Reconnecting EventSource clients resume after the last event they saw
+    try:
+        cursor = int(last_event_id) + 1 if last_event_id else 0
+    except ValueError:
+        cursor = 0
+
     async def event_generator():
+        nonlocal cursor
         task = _active_tasks[task_id]
-        queue = task.get("queue")
+        chunks = task.get("chunks")
 
-        if not queue:
-            yield f"data: Error: Task queue not found\n\n"
-            return
-
-        wait_count = 0
-        while task["status"] == "queued" and wait_count < 20:
-            await asyncio.sleep(0.5)
-            wait_count += 1
-
-        if task["status"] == "queued":
-            yield f"data: Error: Task timeout\n\n"
+        if not chunks:
+            yield _sse_frame("Error: Task stream not found")
             return
 
+        # Bound once so the per-frame loop does no attribute or global lookups
+        read_batch = chunks.read_batch
+        sse_frame = _sse_frame
         while True:
             try:
-                chunk = await asyncio.wait_for(queue.get(), timeout=60.0)
-                if chunk is None:
-                    break
-                yield f"data: {chunk}\n\n"
+                last_id, text, done = await read_batch(cursor, timeout=60.0)
             except asyncio.TimeoutError:
-                yield f"data: Error: Stream timeout\n\n"
+                yield _sse_frame("Error: Stream timeout")
                 break
             except Exception as e:
-                yield f"data: Error: {str(e)}\n\n"
+                yield _sse_frame(f"Error: {str(e)}")
+                break
+            if last_id >= 0:
+                # One frame per coalesced batch; its id lets a reconnect resume after it
+                yield sse_frame(text, last_id)
+                cursor = last_id + 1
+            if done:
                 break
 
         if task.get("status") == "failed":
             error = task.get("error", "Unknown error")
-            yield f"data: Error: {error}\n\n"
+            yield _sse_frame(f"Error: {error}")
 
     return StreamingResponse(
         event_generator(),
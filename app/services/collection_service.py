@@ -1,4 +1,4 @@
-import json
+import orjson
 import uuid
 import shutil
 from datetime import datetime, UTC
@@ -71,8 +71,7 @@ def create_collection(company_id: str, zip_file) -> dict:
     }
     
     metadata_path = base_path / "collection_meta.json"
-    with open(metadata_path, 'w') as f:
-        json.dump(metadata, f, indent=2)
+    metadata_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
     logger.info(f"Created metadata: {metadata_path}")
     
     # 8. Return response
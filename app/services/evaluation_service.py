@@ -1,6 +1,12 @@
 """RAG evaluation service using Ragas."""
-import json
+import asyncio
+import mmap
+import orjson
+import os
+import re
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
@@ -12,6 +18,7 @@ from app.models.evaluation_schemas import (
     EvaluationRecord, CollectionEvaluationSummary, EvaluationMetrics
 )
 from app.utils.paths import get_collection_root
+import app.core.config as config
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +26,30 @@ logger = logging.getLogger(__name__)
 FAITHFULNESS_THRESHOLD = 0.85
 MIN_CONTEXT_RECALL = 0.0  # Will fail if no supporting context
 
+# Tech terms that must not appear in an answer unless the context mentions them
+SUSPICIOUS_TERMS = ("aws", "kubernetes", "docker", "python", "java", "react", "node.js")
+# All terms matched in a single pass; the lookahead also reports overlapping hits
+_SUSPICIOUS_TERMS_RE = re.compile("(?=(" + "|".join(map(re.escape, SUSPICIOUS_TERMS)) + "))")
+
+# Append-only record log (one JSON record per line, oldest first)
+RECORDS_FILE = "records.jsonl"
+# Rolling counts/sums so the summary never re-reads the log
+AGGREGATE_FILE = "aggregate.json"
+
+# Threads used to read per-record JSON files when migrating older collections
+LEGACY_READ_WORKERS = 16
+
+# Serializes log appends and aggregate read-modify-write
+_eval_write_lock = threading.Lock()
+
+# Ragas judge LLM/embeddings sharing a disk cache; built on first evaluation
+_ragas_models: Optional[Tuple] = None
+_ragas_models_lock = threading.Lock()
+
+# Ragas micro-batching: queries arriving within the wait window share one evaluate() call
+EVAL_BATCH_MAX_SIZE = 16
+EVAL_BATCH_MAX_WAIT_SECONDS = 0.05
+
 
 def get_evaluation_path(company_id: str, collection_id: str) -> Path:
     """Get evaluation storage path."""
@@ -26,6 +57,108 @@ def get_evaluation_path(company_id: str, collection_id: str) -> Path:
     return collection_root / "rag" / "evaluations"
 
 
+def _get_ragas_models() -> Tuple:
+    """
+    Build the Ragas judge LLM and embeddings with a shared DiskCacheBackend.
+    
+    Identical (prompt, model) calls are served from the cache, so re-running an
+    evaluation set costs no provider round trips. Falls back to Ragas defaults
+    (uncached) when no OpenAI key is configured or construction fails.
+    
+    Returns:
+        Tuple of (llm, embeddings), either of which may be None
+    """
+    global _ragas_models
+    if _ragas_models is not None:
+        return _ragas_models
+    with _ragas_models_lock:
+        if _ragas_models is None:
+            llm = embeddings = None
+            api_key = os.getenv("OPENAI_API_KEY")
+            if api_key:
+                try:
+                    from openai import AsyncOpenAI
+                    from ragas.cache import DiskCacheBackend
+                    from ragas.embeddings.base import embedding_factory
+                    from ragas.llms import llm_factory
+                    
+                    cache = DiskCacheBackend(cache_dir=config.RAGAS_CACHE_DIR)
+                    client = AsyncOpenAI(api_key=api_key)
+                    llm = llm_factory(config.RAGAS_LLM_MODEL, client=client, cache=cache)
+                    embeddings = embedding_factory(
+                        "openai", model=config.RAGAS_EMBEDDING_MODEL, client=client, cache=cache
+                    )
+                except Exception as e:
+                    logger.warning(f"Ragas cache setup failed, using uncached defaults: {e}")
+                    llm = embeddings = None
+            _ragas_models = (llm, embeddings)
+    return _ragas_models
+
+
+def _default_scores() -> Dict[str, float]:
+    return {
+        "faithfulness": 0.0,
+        "context_recall": 0.0,
+        "answer_relevance": 0.0
+    }
+
+
+def evaluate_rag_batch(
+    rows: List[Tuple[str, str, List[str], Optional[str]]]
+) -> List[Dict[str, float]]:
+    """
+    Evaluate several RAG responses with a single Ragas run.
+    
+    Rows with and without a ground truth are evaluated as separate datasets,
+    since every row in a Dataset must share the same columns.
+    
+    Args:
+        rows: ``(question, answer, contexts, ground_truth)`` tuples
+        
+    Returns:
+        Metric score dicts in the same order as ``rows``
+    """
+    scores: List[Dict[str, float]] = [_default_scores() for _ in rows]
+    groups = (
+        [i for i, row in enumerate(rows) if row[3]],
+        [i for i, row in enumerate(rows) if not row[3]],
+    )
+    metrics = [faithfulness, context_recall, answer_relevancy]
+    llm, embeddings = _get_ragas_models()
+    
+    for with_ground_truth, indices in zip((True, False), groups):
+        if not indices:
+            continue
+        try:
+            # Prepare dataset for Ragas
+            data_dict = {
+                "question": [rows[i][0] for i in indices],
+                "answer": [rows[i][1] for i in indices],
+                "contexts": [rows[i][2] for i in indices]
+            }
+            if with_ground_truth:
+                data_dict["ground_truth"] = [rows[i][3] for i in indices]
+            
+            # Run evaluation
+            results = evaluate(
+                Dataset.from_dict(data_dict), metrics=metrics, llm=llm, embeddings=embeddings
+            )
+            
+            # Extract per-row scores (ragas returns 'answer_relevancy' but we use 'answer_relevance' in our schema)
+            for row, i in enumerate(indices):
+                scores[i] = {
+                    "faithfulness": float(results["faithfulness"][row]) if "faithfulness" in results else 0.0,
+                    "context_recall": float(results["context_recall"][row]) if "context_recall" in results else 0.0,
+                    "answer_relevance": float(results["answer_relevancy"][row]) if "answer_relevancy" in results else 0.0
+                }
+        except Exception as e:
+            # Default scores for this group on error
+            logger.error(f"Ragas evaluation error: {e}", exc_info=True)
+    
+    logger.info(f"Ragas evaluation completed for {len(rows)} queries")
+    return scores
+
+
 def evaluate_rag(
     question: str,
     answer: str,
@@ -44,41 +177,75 @@ def evaluate_rag(
     Returns:
         Dictionary with metric scores
     """
-    try:
-        # Prepare dataset for Ragas
-        data_dict = {
-            "question": [question],
-            "answer": [answer],
-            "contexts": [contexts]
-        }
-        
-        if ground_truth:
-            data_dict["ground_truth"] = [ground_truth]
-        
-        dataset = Dataset.from_dict(data_dict)
-        
-        # Run evaluation
-        metrics = [faithfulness, context_recall, answer_relevancy]
-        results = evaluate(dataset, metrics=metrics)
-        
-        # Extract scores (ragas returns 'answer_relevancy' but we use 'answer_relevance' in our schema)
-        scores = {
-            "faithfulness": float(results["faithfulness"][0]) if "faithfulness" in results else 0.0,
-            "context_recall": float(results["context_recall"][0]) if "context_recall" in results else 0.0,
-            "answer_relevance": float(results["answer_relevancy"][0]) if "answer_relevancy" in results else 0.0
-        }
-        
-        logger.info(f"Ragas evaluation completed: {scores}")
-        return scores
-        
-    except Exception as e:
-        logger.error(f"Ragas evaluation error: {e}", exc_info=True)
-        # Return default scores on error
-        return {
-            "faithfulness": 0.0,
-            "context_recall": 0.0,
-            "answer_relevance": 0.0
-        }
+    return evaluate_rag_batch([(question, answer, contexts, ground_truth)])[0]
+
+
+class EvaluationBatcher:
+    """
+    Coalesce concurrent evaluation requests into batched Ragas runs.
+    
+    Callers await ``submit``; a background task drains up to ``max_size``
+    queued rows (waiting at most ``max_wait`` seconds after the first) and
+    scores them with one ``evaluate_rag_batch`` call in a worker thread.
+    """
+    
+    def __init__(self, max_size: int = EVAL_BATCH_MAX_SIZE, max_wait: float = EVAL_BATCH_MAX_WAIT_SECONDS):
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    async def submit(
+        self,
+        question: str,
+        answer: str,
+        contexts: List[str],
+        ground_truth: Optional[str] = None
+    ) -> Dict[str, float]:
+        """Queue one row and wait for its scores."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            # Queue and worker are bound to the loop that created them
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run(self._queue))
+        future = loop.create_future()
+        self._queue.put_nowait(((question, answer, contexts, ground_truth), future))
+        return await future
+    
+    async def _run(self, queue: asyncio.Queue) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                scores = await asyncio.to_thread(evaluate_rag_batch, [row for row, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, future), row_scores in zip(batch, scores):
+                if not future.done():
+                    future.set_result(row_scores)
+
+
+_evaluation_batcher = EvaluationBatcher()
+
+
+def _resume_stem(filename: str) -> str:
+    """Lowercased resume name without .txt/.pdf extensions, as it would appear in an answer."""
+    return filename.replace(".txt", "").replace(".pdf", "").lower()
 
 
 def check_auto_fail(
@@ -112,27 +279,32 @@ def check_auto_fail(
         failure_reasons.append("No relevant context retrieved (context_recall = 0)")
     
     # Rule 3: Answer mentions facts not in contexts
-    context_text = " ".join(contexts).lower()
     answer_lower = answer.lower()
     
-    # Check for common skill/tech mentions not in context
+    # Check for common skill/tech mentions not in context (one scan per text);
+    # the joined context is only built when the answer mentions a term at all
     suspicious_terms = []
-    for term in ["aws", "kubernetes", "docker", "python", "java", "react", "node.js"]:
-        if term in answer_lower and term not in context_text:
-            suspicious_terms.append(term)
+    answer_hits = set(_SUSPICIOUS_TERMS_RE.findall(answer_lower))
+    if answer_hits:
+        context_hits = set(_SUSPICIOUS_TERMS_RE.findall(" ".join(contexts).lower()))
+        suspicious_terms = [
+            term for term in SUSPICIOUS_TERMS
+            if term in answer_hits and term not in context_hits
+        ]
     
     if suspicious_terms:
         failure_reasons.append(f"Answer mentions terms not in context: {', '.join(suspicious_terms)}")
     
     # Rule 4: Answer mentions resume not in retrieved set
-    # Extract resume mentions from answer (simple heuristic)
-    for resume in retrieved_resumes:
-        if resume.replace(".txt", "").replace(".pdf", "") in answer:
-            continue
     # If expected resumes provided, check if answer mentions non-retrieved ones
+    # (compared by lowercased stem, so "resume.pdf" matches a retrieved "resume.pdf.txt")
     if expected_resumes:
-        mentioned_resumes = [r for r in expected_resumes if r.replace(".txt", "").replace(".pdf", "") in answer_lower]
-        missing_resumes = [r for r in mentioned_resumes if r not in retrieved_resumes]
+        retrieved_stems = {_resume_stem(r) for r in retrieved_resumes}
+        expected_stems = {_resume_stem(r): r for r in expected_resumes}
+        missing_resumes = [
+            name for stem, name in expected_stems.items()
+            if stem in answer_lower and stem not in retrieved_stems
+        ]
         if missing_resumes:
             failure_reasons.append(f"Answer references resumes not retrieved: {', '.join(missing_resumes[:3])}")
     
@@ -140,73 +312,218 @@ def check_auto_fail(
     return auto_fail, failure_reasons
 
 
+def _empty_aggregate() -> Dict[str, float]:
+    return {
+        "count": 0,
+        "sum_faithfulness": 0.0,
+        "sum_context_recall": 0.0,
+        "sum_answer_relevance": 0.0,
+        "failed_count": 0,
+        "hallucination_count": 0
+    }
+
+
+def _fold_into_aggregate(agg: Dict[str, float], record: Dict) -> None:
+    metrics = record["metrics"]
+    agg["count"] += 1
+    agg["sum_faithfulness"] += metrics["faithfulness"]
+    agg["sum_context_recall"] += metrics["context_recall"]
+    agg["sum_answer_relevance"] += metrics["answer_relevance"]
+    if record.get("auto_fail"):
+        agg["failed_count"] += 1
+    if metrics["faithfulness"] < FAITHFULNESS_THRESHOLD:
+        agg["hallucination_count"] += 1
+
+
+def _rebuild_aggregate(eval_path: Path) -> Dict[str, float]:
+    """Recompute the aggregate from the record log (recovery path)."""
+    agg = _empty_aggregate()
+    records_file = eval_path / RECORDS_FILE
+    if records_file.exists():
+        with open(records_file, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    _fold_into_aggregate(agg, orjson.loads(line))
+    (eval_path / AGGREGATE_FILE).write_bytes(orjson.dumps(agg))
+    return agg
+
+
+def _read_legacy_record(record_file: Path) -> Optional[Dict]:
+    try:
+        return orjson.loads(record_file.read_bytes())
+    except Exception as e:
+        logger.warning(f"Failed to load evaluation record {record_file}: {e}")
+        return None
+
+
+def _migrate_legacy_records(eval_path: Path) -> None:
+    """
+    Fold per-record ``<question_id>.json`` files into the JSONL log.
+    
+    Older collections stored one file per record; they are appended in
+    timestamp order and removed, and the aggregate is rebuilt. Files that
+    can't be read are kept, renamed to ``*.json.bad``, instead of deleted.
+    """
+    legacy_files = list(eval_path.glob("*.json"))
+    legacy_files = [f for f in legacy_files if f.name != AGGREGATE_FILE]
+    if not legacy_files:
+        return
+    
+    # Many small files: overlap the open/read latency across a few threads
+    with ThreadPoolExecutor(max_workers=min(LEGACY_READ_WORKERS, len(legacy_files))) as pool:
+        loaded = list(zip(legacy_files, pool.map(_read_legacy_record, legacy_files)))
+    records = sorted(
+        (record for _, record in loaded if record is not None),
+        key=lambda r: r.get("timestamp", "")
+    )
+    
+    with open(eval_path / RECORDS_FILE, 'ab') as f:
+        for record in records:
+            f.write(orjson.dumps(record) + b"\n")
+    # Only files whose record is now in the log are removed
+    for record_file, record in loaded:
+        if record is not None:
+            record_file.unlink(missing_ok=True)
+            continue
+        try:
+            record_file.rename(record_file.with_name(record_file.name + ".bad"))
+        except OSError as e:
+            logger.warning(f"Failed to set aside unreadable evaluation record {record_file}: {e}")
+    _rebuild_aggregate(eval_path)
+    logger.info(f"Migrated {len(records)} legacy evaluation records in {eval_path}")
+
+
+def _prepare_eval_path(company_id: str, collection_id: str) -> Path:
+    eval_path = get_evaluation_path(company_id, collection_id)
+    if eval_path.exists() and not (eval_path / RECORDS_FILE).exists():
+        with _eval_write_lock:
+            _migrate_legacy_records(eval_path)
+    return eval_path
+
+
+def _load_aggregate(eval_path: Path) -> Dict[str, float]:
+    try:
+        return orjson.loads((eval_path / AGGREGATE_FILE).read_bytes())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        with _eval_write_lock:
+            return _rebuild_aggregate(eval_path)
+
+
 def save_evaluation_record(
     company_id: str,
     collection_id: str,
     record: EvaluationRecord
 ) -> None:
-    """Save evaluation record to disk."""
-    eval_path = get_evaluation_path(company_id, collection_id)
+    """Append evaluation record to the collection log and update the aggregate."""
+    eval_path = _prepare_eval_path(company_id, collection_id)
     eval_path.mkdir(parents=True, exist_ok=True)
     
-    record_file = eval_path / f"{record.question_id}.json"
-    with open(record_file, 'w') as f:
-        json.dump(record.model_dump(), f, indent=2)
+    # Serialized in pydantic-core directly (compact, so it stays one line);
+    # the aggregate only needs the metrics and auto_fail flag
+    line = record.model_dump_json().encode() + b"\n"
+    data = {"metrics": record.metrics.model_dump(), "auto_fail": record.auto_fail}
+    with _eval_write_lock:
+        with open(eval_path / RECORDS_FILE, 'ab') as f:
+            f.write(line)
+        
+        aggregate_file = eval_path / AGGREGATE_FILE
+        try:
+            agg = orjson.loads(aggregate_file.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            # Log already holds this record, so a rebuild includes it
+            _rebuild_aggregate(eval_path)
+        else:
+            _fold_into_aggregate(agg, data)
+            aggregate_file.write_bytes(orjson.dumps(agg))
     
-    logger.info(f"Saved evaluation record: {record_file}")
+    logger.info(f"Saved evaluation record {record.question_id} to {eval_path / RECORDS_FILE}")
 
 
-def load_evaluation_records(
+def load_evaluation_records_raw(
     company_id: str,
-    collection_id: str
-) -> List[EvaluationRecord]:
-    """Load all evaluation records for a collection."""
-    eval_path = get_evaluation_path(company_id, collection_id)
+    collection_id: str,
+    limit: Optional[int] = None
+) -> Tuple[int, List[Dict]]:
+    """
+    Load the newest evaluation records as plain dicts.
+    
+    Only the last ``limit`` lines of the log are located (scanning backwards
+    through a memory map) and parsed; the total comes from the aggregate.
+    
+    Args:
+        company_id: Company identifier
+        collection_id: Collection identifier
+        limit: Maximum number of records (None for all)
+        
+    Returns:
+        Tuple of (total record count, records newest first)
+    """
+    eval_path = _prepare_eval_path(company_id, collection_id)
+    records_file = eval_path / RECORDS_FILE
+    
+    if not records_file.exists() or records_file.stat().st_size == 0:
+        return 0, []
     
-    if not eval_path.exists():
-        return []
+    lines = []
+    with open(records_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        end = len(mm)
+        while end > 0 and (limit is None or len(lines) < limit):
+            # Skip the trailing newline of the current line
+            start = mm.rfind(b"\n", 0, end - 1) + 1
+            line = mm[start:end].strip()
+            if line:
+                lines.append(line)
+            end = start
     
     records = []
-    for record_file in eval_path.glob("*.json"):
+    for line in lines:
         try:
-            with open(record_file, 'r') as f:
-                data = json.load(f)
-                records.append(EvaluationRecord(**data))
-        except Exception as e:
-            logger.warning(f"Failed to load evaluation record {record_file}: {e}")
+            records.append(orjson.loads(line))
+        except orjson.JSONDecodeError as e:
+            logger.warning(f"Skipping corrupt evaluation record in {records_file}: {e}")
     
-    return sorted(records, key=lambda x: x.timestamp, reverse=True)
+    if limit is None:
+        total = len(records)
+    else:
+        total = _load_aggregate(eval_path)["count"]
+    return total, records
+
+
+def load_evaluation_records(
+    company_id: str,
+    collection_id: str,
+    limit: Optional[int] = None
+) -> List[EvaluationRecord]:
+    """Load evaluation records for a collection, newest first."""
+    _, records = load_evaluation_records_raw(company_id, collection_id, limit)
+    return [EvaluationRecord.model_validate(data) for data in records]
 
 
 def compute_collection_summary(
     company_id: str,
     collection_id: str
 ) -> Optional[CollectionEvaluationSummary]:
-    """Compute aggregated evaluation summary for a collection."""
-    records = load_evaluation_records(company_id, collection_id)
+    """Compute aggregated evaluation summary for a collection from the rolling aggregate."""
+    eval_path = _prepare_eval_path(company_id, collection_id)
     
-    if not records:
+    if not (eval_path / RECORDS_FILE).exists():
         return None
     
-    total = len(records)
+    agg = _load_aggregate(eval_path)
+    total = agg["count"]
     
-    # Aggregate metrics
-    total_faithfulness = sum(r.metrics.faithfulness for r in records)
-    total_context_recall = sum(r.metrics.context_recall for r in records)
-    total_answer_relevance = sum(r.metrics.answer_relevance for r in records)
+    if not total:
+        return None
     
     avg_metrics = EvaluationMetrics(
-        faithfulness=total_faithfulness / total,
-        context_recall=total_context_recall / total,
-        answer_relevance=total_answer_relevance / total
+        faithfulness=agg["sum_faithfulness"] / total,
+        context_recall=agg["sum_context_recall"] / total,
+        answer_relevance=agg["sum_answer_relevance"] / total
     )
     
     # Compute failure rates
-    failed_count = sum(1 for r in records if r.auto_fail)
-    hallucination_count = sum(1 for r in records if r.metrics.faithfulness < FAITHFULNESS_THRESHOLD)
-    
-    failure_rate = failed_count / total
-    hallucination_rate = hallucination_count / total
+    failure_rate = agg["failed_count"] / total
+    hallucination_rate = agg["hallucination_count"] / total
     
     # Compute RAG score
     rag_score = (
@@ -225,7 +542,7 @@ def compute_collection_summary(
     )
 
 
-def evaluate_rag_query(
+async def evaluate_rag_query(
     company_id: str,
     collection_id: str,
     question: str,
@@ -251,8 +568,8 @@ def evaluate_rag_query(
     Returns:
         Evaluation record
     """
-    # Run Ragas evaluation
-    scores = evaluate_rag(question, answer, contexts, ground_truth)
+    # Run Ragas evaluation (batched with other in-flight queries)
+    scores = await _evaluation_batcher.submit(question, answer, contexts, ground_truth)
     
     metrics = EvaluationMetrics(
         faithfulness=scores["faithfulness"],
@@ -281,7 +598,7 @@ def evaluate_rag_query(
     )
     
     # Save record
-    save_evaluation_record(company_id, collection_id, record)
+    await asyncio.to_thread(save_evaluation_record, company_id, collection_id, record)
     
     logger.info(f"Evaluation completed for {question_id}: auto_fail={auto_fail}, metrics={metrics}")
     
@@ -3,40 +3,96 @@ import json
 import logging
 import os
 import time
+from functools import lru_cache
 from typing import AsyncGenerator, Optional
+import httpx
+import anthropic
 import openai
 from anthropic import Anthropic
 from app.utils.latency_tracker import LatencyRecorder, STAGE_LLM
 
 logger = logging.getLogger(__name__)
 
-# Initialize clients (lazy)
-_openai_client: Optional[openai.AsyncOpenAI] = None
-_anthropic_client: Optional[Anthropic] = None
+# HTTP/2 multiplexes concurrent streams over one connection; needs the optional h2 package
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
+# Connection pool for provider APIs: keep plenty of warm connections for bursts of
+# concurrent SSE streams so requests don't pay a fresh TCP + TLS handshake.
+# Passed through the SDKs' Default*HttpxClient, which keep their own defaults otherwise
+LLM_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=200, max_connections=400)
+LLM_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
 
+# Provider tokens are coalesced before yielding: flush at this many characters,
+# or once this long has passed since the previous flush
+LLM_FLUSH_CHARS = 256
+LLM_FLUSH_SECONDS = 0.02
+
+
+class _ChunkBuffer:
+    """Accumulates streamed tokens and releases them in size/time-bounded batches."""
+
+    def __init__(self):
+        self._parts: list[str] = []
+        self._size = 0
+        self._last_flush = time.monotonic()
+
+    def add(self, text: str) -> Optional[str]:
+        """Buffer ``text``; return the joined batch if it is due, else None."""
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= LLM_FLUSH_CHARS or time.monotonic() - self._last_flush >= LLM_FLUSH_SECONDS:
+            return self.flush()
+        return None
+
+    def flush(self) -> Optional[str]:
+        """Return everything buffered (None if empty) and reset."""
+        self._last_flush = time.monotonic()
+        if not self._parts:
+            return None
+        batch = "".join(self._parts)
+        self._parts.clear()
+        self._size = 0
+        return batch
+
+
+@lru_cache(maxsize=1)
 def _get_openai_client() -> Optional[openai.AsyncOpenAI]:
-    """Get OpenAI client if API key is available."""
-    global _openai_client
+    """Get OpenAI client if API key is available (env is read once, on first call)."""
     api_key = os.getenv("OPENAI_API_KEY")
     if api_key:
-        if _openai_client is None:
-            _openai_client = openai.AsyncOpenAI(api_key=api_key)
-        return _openai_client
+        return openai.AsyncOpenAI(
+            api_key=api_key,
+            http_client=openai.DefaultAsyncHttpxClient(
+                http2=HTTP2_AVAILABLE, limits=LLM_HTTP_LIMITS, timeout=LLM_HTTP_TIMEOUT
+            )
+        )
     return None
 
 
+@lru_cache(maxsize=1)
 def _get_anthropic_client() -> Optional[Anthropic]:
-    """Get Anthropic client if API key is available."""
-    global _anthropic_client
+    """Get Anthropic client if API key is available (env is read once, on first call)."""
     api_key = os.getenv("ANTHROPIC_API_KEY")
     if api_key:
-        if _anthropic_client is None:
-            _anthropic_client = Anthropic(api_key=api_key)
-        return _anthropic_client
+        return Anthropic(
+            api_key=api_key,
+            http_client=anthropic.DefaultHttpxClient(
+                http2=HTTP2_AVAILABLE, limits=LLM_HTTP_LIMITS, timeout=LLM_HTTP_TIMEOUT
+            )
+        )
     return None
 
 
+def invalidate_llm_clients() -> None:
+    """Drop cached clients so the next call re-reads the API key env vars (e.g. in tests)."""
+    _get_openai_client.cache_clear()
+    _get_anthropic_client.cache_clear()
+
+
 def detect_free_tier_limit(provider: str) -> bool:
     """
     Detect if using free tier (basic heuristic).
@@ -67,9 +123,10 @@ async def stream_llm_response(
         provider: "openai" or "anthropic"
         
     Yields:
-        Chunks of text
+        Chunks of text (provider tokens batched up to LLM_FLUSH_CHARS / LLM_FLUSH_SECONDS)
     """
     start = time.perf_counter()
+    buffer = _ChunkBuffer()
     try:
         if provider == "openai":
             client = _get_openai_client()
@@ -90,9 +147,18 @@ async def stream_llm_response(
                 
                 async for chunk in stream:
                     if chunk.choices and chunk.choices[0].delta.content:
-                        yield chunk.choices[0].delta.content
+                        batch = buffer.add(chunk.choices[0].delta.content)
+                        if batch:
+                            yield batch
+                
+                batch = buffer.flush()
+                if batch:
+                    yield batch
                         
             except Exception as e:
+                batch = buffer.flush()
+                if batch:
+                    yield batch
                 logger.error(f"OpenAI API error: {e}")
                 error_msg = str(e)
                 if "rate limit" in error_msg.lower() or "quota" in error_msg.lower():
@@ -116,9 +182,18 @@ async def stream_llm_response(
                     messages=[{"role": "user", "content": user_prompt}]
                 ) as stream:
                     for text in stream.text_stream:
-                        yield text
+                        batch = buffer.add(text)
+                        if batch:
+                            yield batch
+                
+                batch = buffer.flush()
+                if batch:
+                    yield batch
                         
             except Exception as e:
+                batch = buffer.flush()
+                if batch:
+                    yield batch
                 logger.error(f"Anthropic API error: {e}")
                 error_msg = str(e)
                 if "rate limit" in error_msg.lower() or "quota" in error_msg.lower():
@@ -343,20 +343,47 @@ def _tesseract_ocr(pdf_path: Path, dpi: int = 150, lang: str = "eng") -> str:
     if not images:
         raise ValueError("pdf2image produced no pages")
 
-    parts: list[str] = []
-    for index, image in enumerate(images):
-        try:
-            page_text = pytesseract.image_to_string(image, lang=lang)
-            if page_text and page_text.strip():
-                parts.append(page_text.strip())
-        except Exception as exc:
-            logger.warning("Tesseract failed on page %d of %s: %s", index + 1, pdf_path.name, exc)
+    try:
+        parts = _tesseract_pages_single_call(images, lang)
+    except Exception as exc:
+        logger.warning(
+            "Multi-page Tesseract call failed for %s (%s); retrying page by page",
+            pdf_path.name,
+            exc,
+        )
+        parts = []
+        for index, image in enumerate(images):
+            try:
+                page_text = pytesseract.image_to_string(image, lang=lang)
+                if page_text and page_text.strip():
+                    parts.append(page_text.strip())
+            except Exception as page_exc:
+                logger.warning("Tesseract failed on page %d of %s: %s", index + 1, pdf_path.name, page_exc)
 
     if not parts:
         raise ValueError("Tesseract OCR produced no text")
     return " ".join(parts).strip()
 
 
+def _tesseract_pages_single_call(images: list, lang: str) -> list[str]:
+    """
+    OCR all pages with one Tesseract process via a multi-page TIFF.
+
+    Tesseract's startup (loading the language model) is a fixed cost per
+    invocation, so one call per document instead of one per page matters on
+    multi-page scans. Pages come back separated by form feeds.
+    """
+    import tempfile
+
+    import pytesseract
+
+    with tempfile.TemporaryDirectory(prefix="ocr_") as tmp_dir:
+        tiff_path = Path(tmp_dir) / "pages.tif"
+        images[0].save(tiff_path, format="TIFF", save_all=True, append_images=images[1:])
+        text = pytesseract.image_to_string(str(tiff_path), lang=lang)
+    return [page.strip() for page in text.split("\f") if page and page.strip()]
+
+
 def _easyocr_ocr(pdf_path: Path, dpi: int = 150) -> str:
     try:
         import easyocr
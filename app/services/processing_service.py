@@ -1,13 +1,16 @@
 from pathlib import Path
 from datetime import datetime, UTC
-import json
 import logging
 import os
-from multiprocessing import Pool, cpu_count, Manager
+import threading
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from app.models.enums import ResumeStatus
 from app.utils.ner.spacy_ner import _get_spacy_model
 from app.utils.latency_tracker import LatencyRecorder, save_latency_report
-from app.workers.resume_worker import process_resume_file
+from app.utils.filesystem import prefetch_files
+from app.utils.hashing import compute_file_fingerprint
+from app.workers.resume_worker import extract_resume_file, persist_resume_batch
 import app.core.config as config
 #Phase 2 guarantees:
 #- No network calls
@@ -16,15 +19,367 @@ import app.core.config as config
 #- Same input → same JSON
 logger = logging.getLogger(__name__)
 
+# Write buffer for streamed report files
+REPORT_WRITE_BUFFER = 1 << 20
 
-def _init_worker():
+# Per-collection record of each input's (mtime_ns, size) and last outcome, so
+# re-runs skip files that haven't changed (stored under artifacts/)
+PROCESSING_CACHE_FILE = "processing_cache.json"
+# Extraction-stage result fields kept in the processing cache
+_CACHED_EXTRACT_FIELDS = ("filename", "status", "reason", "content_hash", "extraction")
+
+# Input scan: extensions Phase 2 extracts, and OS metadata files to ignore
+SUPPORTED_RESUME_SUFFIXES = frozenset({'.pdf', '.docx', '.txt'})
+SKIPPED_NAME_PREFIXES = ('._', '~$')  # macOS resource forks, Windows temp files
+SKIPPED_NAMES = frozenset({'.DS_Store', 'Thumbs.db'})
+
+# Threads hashing raw resume bytes before extraction (hashing releases the GIL)
+RAW_HASH_WORKERS = 8
+
+
+def _name_suffix(name: str) -> str:
+    # Same result as Path(name).suffix.lower() without building a Path
+    i = name.rfind('.')
+    return name[i:].lower() if 0 < i < len(name) - 1 else ''
+
+
+def _scan_input_dir(input_dir: Path) -> tuple[list[Path], dict[str, int]]:
+    """
+    Walk the input tree once, collecting resume files and unsupported types.
+    
+    Uses ``os.scandir`` so type checks come from the directory entries, and a
+    ``Path`` is only built for files that are kept.
+    
+    Returns:
+        Tuple of (sorted resume files, count of unsupported files by extension)
+    """
+    resume_files = []
+    unsupported_types = {}
+    stack = [str(input_dir)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    continue
+                if not entry.is_file():
+                    continue
+                name = entry.name
+                ext = _name_suffix(name)
+                if ext in SUPPORTED_RESUME_SUFFIXES:
+                    if name not in SKIPPED_NAMES and not name.startswith(SKIPPED_NAME_PREFIXES):
+                        resume_files.append(Path(entry.path))
+                elif ext != '.zip':
+                    key = ext or '(no extension)'
+                    unsupported_types[key] = unsupported_types.get(key, 0) + 1
+    return sorted(resume_files), unsupported_types
+
+
+def _write_validation_report(path: Path, stats: dict, files: list[dict]) -> None:
+    """
+    Write ``{**stats, "files": [...]}`` without building the whole document.
+    
+    Each entry is serialized and written on its own through a 1 MiB buffer, so
+    peak memory is the entry list plus one buffer rather than a second full
+    JSON copy of the report.
+    """
+    with open(path, "wb", buffering=REPORT_WRITE_BUFFER) as f:
+        f.write(orjson.dumps(stats)[:-1] + b',"files":[')
+        for i, entry in enumerate(files):
+            if i:
+                f.write(b",")
+            f.write(orjson.dumps(entry))
+        f.write(b"]}")
+
+
+def _group_byte_duplicates(resume_files: list[Path]) -> dict[int, int]:
+    """
+    Find files whose raw bytes match an earlier file.
+    
+    Returns:
+        Mapping of file index -> index of the first file with identical bytes
+    """
+    if len(resume_files) < 2:
+        return {}
+    with ThreadPoolExecutor(max_workers=RAW_HASH_WORKERS) as pool:
+        raw_hashes = list(pool.map(_safe_file_fingerprint, resume_files))
+    first_seen = {}
+    copies = {}
+    for i, raw_hash in enumerate(raw_hashes):
+        if raw_hash is None:
+            continue
+        first = first_seen.setdefault(raw_hash, i)
+        if first != i:
+            copies[i] = first
+    return copies
+
+
+def _safe_file_fingerprint(path: Path) -> bytes | None:
+    try:
+        return compute_file_fingerprint(path)
+    except OSError:
+        # Unreadable files go through extraction, which reports the failure
+        return None
+
+
+def _plan_extraction(resume_files: list[Path]) -> tuple[dict[int, int], list[Path]]:
+    """Split files into byte-identical copies and the files that need extracting."""
+    copies = _group_byte_duplicates(resume_files)
+    if copies:
+        logger.info(f"Skipping extraction for {len(copies)} byte-identical duplicate files")
+    return copies, [f for i, f in enumerate(resume_files) if i not in copies]
+
+
+def _merge_byte_duplicates(
+    resume_files: list[Path],
+    extracted: list[dict],
+    copies: dict[int, int]
+) -> list[dict]:
+    """
+    Expand results for extracted files back to one result per resume file.
+    
+    A byte-identical copy reuses its original's result under its own filename,
+    so text-hash dedupe then marks it a duplicate of that original (or gives it
+    the same EMPTY/FAILED outcome).
+    """
+    results = []
+    it = iter(extracted)
+    for i, resume_file in enumerate(resume_files):
+        original = copies.get(i)
+        if original is None:
+            results.append(next(it))
+        else:
+            results.append({
+                **results[original],
+                "filename": resume_file.name,
+                "text": None,
+                "latency_samples": None,
+            })
+    return results
+
+
+def _file_signature(path: Path) -> list[int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _extract_largest_first(executor: ThreadPoolExecutor, files: list[Path]) -> list[dict]:
+    """
+    Run ``extract_resume_file`` over files, submitting the largest first.
+    
+    Extraction time varies by orders of magnitude (scanned PDFs go through
+    OCR), so a big file submitted last would set the tail of the whole stage.
+    Results are returned in the original file order.
+    """
+    def size(i: int) -> int:
+        signature = _file_signature(files[i])
+        return signature[1] if signature else 0
+    
+    order = sorted(range(len(files)), key=size, reverse=True)
+    futures = {i: executor.submit(extract_resume_file, files[i]) for i in order}
+    return [futures[i].result() for i in range(len(files))]
+
+
+def _load_processing_cache(cache_file: Path) -> dict:
+    try:
+        return orjson.loads(cache_file.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+
+def _cached_status(value: str | None) -> ResumeStatus | None:
+    return ResumeStatus(value) if value else None
+
+
+def _cache_keys(resume_files: list[Path], input_dir: Path) -> list[str]:
+    """
+    Processing cache key per file: its path relative to the input dir, so
+    same-named files in different subdirectories get separate entries.
+    """
+    return [resume_file.relative_to(input_dir).as_posix() for resume_file in resume_files]
+
+
+def _reuse_cached_results(
+    cache_keys: list[str],
+    signatures: list[list[int] | None],
+    cache: dict
+) -> tuple[list[dict | None], list[int]]:
     """
-    Initialize worker process - preload spaCy model once per process.
-    This is called once when each worker process starts.
+    Fill in extraction results for files whose (mtime, size) match the cache.
+    
+    Returns:
+        Tuple of (results in file order, None where extraction is still needed;
+        indices of those pending files)
+    """
+    results = []
+    pending = []
+    for i, (cache_key, signature) in enumerate(zip(cache_keys, signatures)):
+        entry = cache.get(cache_key)
+        if signature is None or not entry or entry.get("signature") != signature:
+            results.append(None)
+            pending.append(i)
+            continue
+        extract = entry["extract"]
+        content_hash = extract["content_hash"]
+        results.append({
+            **extract,
+            "status": _cached_status(extract["status"]),
+            "content_hash": bytes.fromhex(content_hash) if content_hash else None,
+            "duplicate_of": None,
+            "latency_samples": None,
+            "text": None,
+            "cached": True,
+        })
+    return results, pending
+
+
+def _run_stages(
+    extract,
+    resume_files: list[Path],
+    cache_keys: list[str],
+    pending: list[int],
+    results: list[dict | None],
+    processed_dir: Path,
+    cache: dict,
+    duplicates: list[dict]
+) -> tuple[list[dict], list[dict], list[dict], list[int]]:
+    """
+    Extract pending files, dedupe everything, then persist unique resumes.
+    
+    Extraction (stage A) is I/O- and OCR-bound and runs through ``extract``;
+    NER and writes (stage B) run in this process with one batched spaCy pass.
+    
+    Args:
+        extract: ``extract(files) -> list`` mapping ``extract_resume_file``
+            over files on the stage A thread pool
+        resume_files: All resume files, sorted
+        cache_keys: Processing cache key per file (see ``_cache_keys``)
+        pending: Indices of files without a usable cached result
+        results: Per-file results from ``_reuse_cached_results`` (filled in place)
+        processed_dir: Output directory for persisted artifacts
+        cache: Loaded processing cache
+        duplicates: Receives duplicate report entries
+        
+    Returns:
+        Tuple of (unique OK results, their persist outcomes, extraction-stage
+        snapshots for every file, file index of each unique result)
     """
-    # Preload spaCy model in this worker process
-    _get_spacy_model()
-    logger.debug(f"Worker process {os.getpid()} initialized with spaCy model")
+    # Extract: byte-identical copies among pending files reuse their original's result
+    pending_files = [resume_files[i] for i in pending]
+    copies, to_extract = _plan_extraction(pending_files)
+    extracted = _merge_byte_duplicates(pending_files, extract(to_extract), copies)
+    for i, result in zip(pending, extracted):
+        results[i] = result
+    snapshots = [_cache_snapshot(result) for result in results]
+    
+    unique = _dedupe_results(results, duplicates)
+    # Deduping leaves exactly the unique results OK, in file order
+    unique_indices = [i for i, result in enumerate(results) if result["status"] == ResumeStatus.OK]
+    
+    # Persist: unchanged resumes whose outputs are still on disk keep their last outcome
+    persisted: list[dict | None] = [None] * len(unique)
+    refetch = []
+    for j, result in enumerate(unique):
+        if not result.get("cached"):
+            continue
+        previous = cache[cache_keys[unique_indices[j]]].get("persist")
+        if previous and (processed_dir / f"{result['filename']}.txt").exists():
+            persisted[j] = {
+                "status": _cached_status(previous["status"]),
+                "reason": previous["reason"],
+                "latency_samples": None,
+            }
+        else:
+            refetch.append(j)
+    
+    # Unchanged but never persisted (e.g. was a duplicate last run): the text is needed again
+    if refetch:
+        fresh = extract([resume_files[unique_indices[j]] for j in refetch])
+        for j, result in zip(refetch, fresh):
+            if result["status"] == ResumeStatus.OK:
+                unique[j]["text"] = result["text"]
+            else:
+                persisted[j] = result
+    
+    todo = [j for j in range(len(unique)) if persisted[j] is None]
+    outcomes = persist_resume_batch(
+        ([(unique[j]["filename"], unique[j].pop("text")) for j in todo], processed_dir)
+    ) if todo else []
+    for j, outcome in zip(todo, outcomes):
+        persisted[j] = outcome
+    return unique, persisted, snapshots, unique_indices
+
+
+def _cache_snapshot(result: dict) -> dict:
+    """Extraction-stage fields of a result, with the digest hex-encoded for JSON."""
+    snapshot = {key: result[key] for key in _CACHED_EXTRACT_FIELDS}
+    if snapshot["content_hash"]:
+        snapshot["content_hash"] = snapshot["content_hash"].hex()
+    return snapshot
+
+
+def _save_processing_cache(
+    cache_file: Path,
+    cache_keys: list[str],
+    signatures: list[list[int] | None],
+    snapshots: list[dict],
+    unique_indices: list[int],
+    persisted: list[dict]
+) -> None:
+    """Record each input's signature, extraction result and persist outcome for the next run."""
+    outcomes = {
+        i: {"status": outcome["status"], "reason": outcome["reason"]}
+        for i, outcome in zip(unique_indices, persisted)
+    }
+    cache = {
+        cache_key: {
+            "signature": signature,
+            "extract": snapshot,
+            "persist": outcomes.get(i),
+        }
+        for i, (cache_key, signature, snapshot) in enumerate(zip(cache_keys, signatures, snapshots))
+        if signature is not None
+    }
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(orjson.dumps(cache, default=str))
+    except OSError as e:
+        logger.warning(f"Could not write processing cache {cache_file}: {e}")
+
+
+def _dedupe_results(results: list[dict], duplicates: list[dict]) -> list[dict]:
+    """
+    Mark duplicate resumes by content hash, first file (in sorted order) wins.
+    
+    Runs serially in the parent so no cross-process registry is needed and the
+    duplicate report is deterministic. The registry is keyed by raw 32-byte
+    digests rather than hex strings.
+    
+    Args:
+        results: Extraction results in file order (updated in place)
+        duplicates: Receives one ``{"filename", "duplicate_of"}`` entry per duplicate
+        
+    Returns:
+        OK results whose content is unique, in file order
+    """
+    hash_registry = {}
+    unique = []
+    for result in results:
+        if result["status"] != ResumeStatus.OK:
+            continue
+        original = hash_registry.setdefault(result["content_hash"], result["filename"])
+        if original != result["filename"]:
+            result["status"] = ResumeStatus.DUPLICATE
+            result["reason"] = f"Duplicate of {original}"
+            result["duplicate_of"] = original
+            result["text"] = None
+            duplicates.append({"filename": result["filename"], "duplicate_of": original})
+        else:
+            unique.append(result)
+    return unique
 
 
 def process_collection(company_id: str, collection_id: str) -> dict:
@@ -60,18 +415,9 @@ def process_collection(company_id: str, collection_id: str) -> dict:
         logger.error(f"Input directory does not exist: {input_dir}")
         raise ValueError(f"Input directory not found: {input_dir}")
     
-    resume_files = list(input_dir.rglob("*"))
-    # Filter out system/metadata files (macOS resource forks, .DS_Store, Thumbs.db, etc.)
-    resume_files = [
-        f for f in resume_files 
-        if f.is_file() 
-        and f.suffix.lower() in ['.pdf', '.docx', '.txt']
-        and not f.name.startswith('._')  # macOS resource fork files
-        and f.name != '.DS_Store'  # macOS metadata
-        and f.name != 'Thumbs.db'  # Windows metadata
-        and not f.name.startswith('~$')  # Windows temp files
-    ]
-    resume_files = sorted(resume_files)
+    # Single scandir pass; system/metadata files (resource forks, .DS_Store,
+    # Thumbs.db, Office temp files) are filtered out
+    resume_files, unsupported_types = _scan_input_dir(input_dir)
     
     # Log file type distribution for debugging
     file_types = {}
@@ -83,32 +429,24 @@ def process_collection(company_id: str, collection_id: str) -> dict:
     logger.info(f"File type distribution: {file_types}")
     
     # Check for unsupported file types (especially .doc files)
-    all_files = [f for f in input_dir.rglob("*") if f.is_file()]
-    unsupported = [f for f in all_files if f.suffix.lower() not in ['.pdf', '.docx', '.txt', '.zip']]
-    if unsupported:
-        unsupported_types = {}
-        for f in unsupported:
-            ext = f.suffix.lower() or '(no extension)'
-            unsupported_types[ext] = unsupported_types.get(ext, 0) + 1
-        logger.warning(f"Found {len(unsupported)} unsupported files (types: {unsupported_types})")
+    if unsupported_types:
+        logger.warning(f"Found {sum(unsupported_types.values())} unsupported files (types: {unsupported_types})")
         if '.doc' in unsupported_types:
             logger.warning(f"Note: {unsupported_types['.doc']} .doc files found. Only .docx (newer Word format) is supported.")
     
     if len(resume_files) == 0:
         logger.warning(f"No resume files found in {input_dir}. All files: {list(input_dir.rglob('*'))}")
     
-    # 3. Initialize shared hash registry for duplicate detection
-    # Use Manager for thread-safe shared dictionary across processes
-    manager = Manager()
-    shared_hash_registry = manager.dict()
-    
-    # 4. Prepare file processing arguments
-    file_args = [(resume_file, processed_dir, shared_hash_registry) for resume_file in resume_files]
-    
-    # 5. Process files in parallel using multiprocessing (or sequential for small batches)
-    # For very few files, sequential processing avoids multiprocessing overhead
-    use_multiprocessing = len(resume_files) > 2
+    # 3. Reuse results for inputs unchanged since the last run (incremental mode)
+    cache_file = collection_root / "artifacts" / PROCESSING_CACHE_FILE
+    cache = _load_processing_cache(cache_file)
+    cache_keys = _cache_keys(resume_files, input_dir)
+    signatures = [_file_signature(f) for f in resume_files]
+    results, pending = _reuse_cached_results(cache_keys, signatures, cache)
+    if len(pending) < len(resume_files):
+        logger.info(f"Reusing cached results for {len(resume_files) - len(pending)} unchanged files")
     
+    # 4. Extract text on a thread pool, then run NER and writes in this process
     validation_files = []
     duplicates = []
     stats = {
@@ -122,21 +460,33 @@ def process_collection(company_id: str, collection_id: str) -> dict:
     latency_report_path = None
     
     try:
-        if use_multiprocessing:
-            # Determine optimal worker count (balance CPU cores vs memory)
-            num_workers = min(8, max(2, cpu_count() - 1))  # Leave 1 core free, max 8 workers
-            logger.info(f"Processing {len(resume_files)} files with {num_workers} worker processes")
+        # Extraction waits on disk, PDF libraries and OCR subprocesses, so threads
+        # overlap it without a per-process copy of the spaCy model
+        num_workers = max(1, min(os.cpu_count() or 1, len(pending)))
+        logger.info(f"Extracting {len(pending)} files with {num_workers} threads")
+        
+        if pending:
+            pending_files = [resume_files[i] for i in pending]
+            # Queue readahead for every resume, and load spaCy while extraction runs
+            threading.Thread(target=prefetch_files, args=(pending_files,), daemon=True).start()
+            threading.Thread(target=_get_spacy_model, daemon=True).start()
+        
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            def extract(files):
+                return _extract_largest_first(executor, files)
             
-            # Use multiprocessing Pool with initializer to preload spaCy model per worker
-            with Pool(processes=num_workers, initializer=_init_worker) as pool:
-                # Process files in parallel
-                results = pool.map(process_resume_file, file_args)
-        else:
-            # Sequential processing for small batches (avoids multiprocessing overhead)
-            logger.info(f"Processing {len(resume_files)} files sequentially (small batch)")
-            # Preload spaCy model in main process
-            _get_spacy_model()
-            results = [process_resume_file(args) for args in file_args]
+            unique, persisted, snapshots, unique_indices = _run_stages(
+                extract, resume_files, cache_keys, pending, results, processed_dir, cache, duplicates
+            )
+        
+        for result, outcome in zip(unique, persisted):
+            result["status"] = outcome["status"]
+            result["reason"] = outcome["reason"]
+            samples = outcome.get("latency_samples")
+            if samples:
+                latency_recorder.merge_samples(samples)
+        
+        _save_processing_cache(cache_file, cache_keys, signatures, snapshots, unique_indices, persisted)
         
         # Merge per-file latency samples
         for result in results:
@@ -174,10 +524,6 @@ def process_collection(company_id: str, collection_id: str) -> dict:
                 stats["failed"] += 1
             elif status == ResumeStatus.DUPLICATE:
                 stats["duplicate"] += 1
-                duplicates.append({
-                    "filename": filename,
-                    "duplicate_of": result["duplicate_of"]
-                })
         
         logger.info(f"Processing completed: {stats['ok']} OK, {stats['failed']} failed, "
                    f"{stats['empty']} empty, {stats['duplicate']} duplicates")
@@ -186,27 +532,14 @@ def process_collection(company_id: str, collection_id: str) -> dict:
         logger.warning("Processing interrupted by user")
         raise
     except Exception as e:
-        logger.error(f"Multiprocessing error: {e}", exc_info=True)
+        logger.error(f"Processing error: {e}", exc_info=True)
         raise
     
-    # 5. Generate reports
-    validation_report = {
-        **stats,
-        "files": validation_files
-    }
-    
-    duplicate_report = {
-        "duplicates": duplicates
-    }
-    
-    (reports_dir / "validation_report.json").write_text(
-        json.dumps(validation_report, indent=2),
-        encoding='utf-8'
-    )
+    # 5. Generate reports (compact JSON; the per-file list is streamed entry by entry)
+    _write_validation_report(reports_dir / "validation_report.json", stats, validation_files)
     
-    (reports_dir / "duplicate_report.json").write_text(
-        json.dumps(duplicate_report, indent=2),
-        encoding='utf-8'
+    (reports_dir / "duplicate_report.json").write_bytes(
+        orjson.dumps({"duplicates": duplicates})
     )
     
     # 5b. Persist latency report (p50 / p95 / p99 per stage)
@@ -220,12 +553,12 @@ def process_collection(company_id: str, collection_id: str) -> dict:
     
     # 6. Update collection_meta.json
     meta_file = collection_root / "collection_meta.json"
-    meta = json.loads(meta_file.read_text()) if meta_file.exists() else {}
+    meta = orjson.loads(meta_file.read_bytes()) if meta_file.exists() else {}
     meta.update({
         "processing_status": "completed",
         "processed_at": datetime.now(UTC).isoformat()
     })
-    meta_file.write_text(json.dumps(meta, indent=2), encoding='utf-8')
+    meta_file.write_bytes(orjson.dumps(meta, option=orjson.OPT_INDENT_2))
     
     logger.info("Phase-2 processing completed")
     
@@ -242,5 +575,5 @@ def process_collection(company_id: str, collection_id: str) -> dict:
         "reports_generated": reports_generated,
     }
     if latency_report_path and latency_report_path.exists():
-        response["latency"] = json.loads(latency_report_path.read_text(encoding="utf-8"))
+        response["latency"] = orjson.loads(latency_report_path.read_bytes())
     return response
\ No newline at end of file
@@ -1,14 +1,19 @@
 """RAG service for index building and query processing."""
 import asyncio
-import json
-import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, AsyncGenerator
 from datetime import datetime, UTC, timedelta
 import numpy as np
+import orjson
 from app.core.config import COLLECTIONS_ROOT
 from app.utils.paths import get_collection_root, assert_collection_exists
+from app.utils.io_reports import read_json_file
+from app.utils.hashing import compute_sha256
 from app.utils.embeddings import generate_embeddings
 from app.utils.faiss_index import (
     build_index, load_index, load_resume_mapping,
@@ -30,6 +35,19 @@ logger = logging.getLogger(__name__)
 RAG_CHUNK_MAX_CHARS = 2000
 RAG_CHUNK_OVERLAP = 200
 
+# Cached query responses expire after this long
+RAG_CACHE_TTL_SECONDS = 3600
+# In-process LRU of cached responses in front of the on-disk cache files
+RAG_MEMORY_CACHE_SIZE = 1024
+
+# Loaded (FAISS index, resume mapping) pairs kept for repeat queries; keyed by
+# file mtimes, so a rebuilt index is picked up on the next query
+RAG_INDEX_CACHE_SIZE = 16
+
+# cache file path -> (monotonic expiry, response)
+_response_cache: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
 
 def _chunk_text(text: str, max_chars: int = RAG_CHUNK_MAX_CHARS, overlap: int = RAG_CHUNK_OVERLAP) -> List[str]:
     """Split long resume text into overlapping chunks for embedding."""
@@ -53,8 +71,8 @@ def _persist_rag_latency(collection_root: Path, recorder: LatencyRecorder, label
     save_latency_report(reports_dir, recorder, label="combined_pipeline", filename="latency_report.json")
     # RAG-only snapshot for this operation (no sidecar double-merge)
     rag_report = recorder.summary(label=label)
-    (reports_dir / "latency_report_rag.json").write_text(
-        json.dumps(rag_report, indent=2), encoding="utf-8"
+    (reports_dir / "latency_report_rag.json").write_bytes(
+        orjson.dumps(rag_report, option=orjson.OPT_INDENT_2)
     )
 
 
@@ -65,13 +83,10 @@ def get_rag_base_path(company_id: str, collection_id: str) -> Path:
 
 
 def is_phase2_complete(collection_root: Path) -> bool:
-    """Check if Phase 2 processing is complete."""
+    """Check if Phase 2 processing is complete (meta parse is cached by mtime)."""
     meta_file = collection_root / "collection_meta.json"
-    if not meta_file.exists():
-        return False
-    
     try:
-        meta = json.loads(meta_file.read_text())
+        meta = read_json_file(meta_file)
         return meta.get("processing_status") == "completed"
     except Exception:
         return False
@@ -142,7 +157,8 @@ def build_rag_index(company_id: str, collection_id: str) -> dict:
     # Build and save index
     with recorder.stage(STAGE_DB_WRITES):
         build_index(embeddings, resume_mapping, index_path, mapping_path, meta_path)
-        np.save(embeddings_backup, embeddings)
+        # The backup is only for rebuilds; float16 halves it on disk
+        np.save(embeddings_backup, embeddings.astype(np.float16))
     
     _persist_rag_latency(collection_root, recorder, label="rag_index_build")
     logger.info(f"RAG index built successfully for {collection_id}")
@@ -199,34 +215,58 @@ def get_rag_status(company_id: str, collection_id: str) -> dict:
 
 def hash_query(query: str) -> str:
     """Hash query for cache key."""
-    return hashlib.sha256(query.encode('utf-8')).hexdigest()
+    return compute_sha256(query)
+
+
+def _remember_response(key: str, response: str, ttl: float) -> None:
+    with _response_cache_lock:
+        _response_cache[key] = (time.monotonic() + ttl, response)
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > RAG_MEMORY_CACHE_SIZE:
+            _response_cache.popitem(last=False)
 
 
 def get_cached_response(cache_path: Path, query_hash: str) -> Optional[str]:
-    """Get cached response if valid."""
+    """
+    Get cached response if valid.
+    
+    Checks the in-process LRU first; the cache file (shared with other
+    workers) is only read on a miss.
+    """
     cache_file = cache_path / f"{query_hash}.json"
+    key = str(cache_file)
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                _response_cache.move_to_end(key)
+                return entry[1]
+            del _response_cache[key]
+    
     if not cache_file.exists():
         return None
     
     try:
-        with open(cache_file, 'r') as f:
-            cache_data = json.load(f)
+        cache_data = orjson.loads(cache_file.read_bytes())
         
         # Check TTL (1 hour)
         cached_at = datetime.fromisoformat(cache_data.get("cached_at", ""))
-        if datetime.now(UTC) - cached_at > timedelta(hours=1):
+        age = datetime.now(UTC) - cached_at
+        if age > timedelta(seconds=RAG_CACHE_TTL_SECONDS):
             cache_file.unlink()  # Delete expired cache
             return None
         
-        return cache_data.get("response", "")
+        response = cache_data.get("response", "")
+        _remember_response(key, response, RAG_CACHE_TTL_SECONDS - age.total_seconds())
+        return response
     except Exception:
         return None
 
 
 def save_cached_response(cache_path: Path, query_hash: str, response: str) -> None:
-    """Save response to cache."""
-    cache_path.mkdir(parents=True, exist_ok=True)
+    """Save response to cache (in-process LRU and cache file)."""
     cache_file = cache_path / f"{query_hash}.json"
+    _remember_response(str(cache_file), response, RAG_CACHE_TTL_SECONDS)
     
     cache_data = {
         "query_hash": query_hash,
@@ -234,8 +274,28 @@ def save_cached_response(cache_path: Path, query_hash: str, response: str) -> No
         "response": response
     }
     
-    with open(cache_file, 'w') as f:
-        json.dump(cache_data, f, indent=2)
+    payload = orjson.dumps(cache_data)
+    try:
+        cache_file.write_bytes(payload)
+    except FileNotFoundError:
+        # First response for this collection: create the cache dir once
+        cache_path.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(payload)
+
+
+def _load_search_index(index_path: Path, mapping_path: Path):
+    """Load a collection's FAISS index and mapping, reusing them until either file changes."""
+    return _load_search_index_cached(
+        str(index_path),
+        index_path.stat().st_mtime_ns,
+        str(mapping_path),
+        mapping_path.stat().st_mtime_ns,
+    )
+
+
+@lru_cache(maxsize=RAG_INDEX_CACHE_SIZE)
+def _load_search_index_cached(index_path: str, _index_mtime_ns: int, mapping_path: str, _mapping_mtime_ns: int):
+    return load_index(Path(index_path)), load_resume_mapping(Path(mapping_path))
 
 
 async def _stream_text_chunks(text: str, chunk_size: int = 24) -> AsyncGenerator[str, None]:
@@ -283,12 +343,12 @@ async def process_rag_query(
         rag_base = get_rag_base_path(company_id, collection_id)
         if not is_index_built(rag_base):
             logger.info(f"Index not found, building for {collection_id}")
-            build_rag_index(company_id, collection_id)
+            await asyncio.to_thread(build_rag_index, company_id, collection_id)
         
-        # Check cache
+        # Check cache (blocking file and model work below runs off the event loop)
         cache_path = rag_base / "cache"
         query_hash = hash_query(query)
-        cached = get_cached_response(cache_path, query_hash)
+        cached = await asyncio.to_thread(get_cached_response, cache_path, query_hash)
         if cached:
             logger.info(f"Using cached response for query hash: {query_hash[:8]}")
             async for piece in _stream_text_chunks(cached):
@@ -299,15 +359,15 @@ async def process_rag_query(
         index_path = rag_base / "index" / "faiss_index.index"
         mapping_path = rag_base / "index" / "resume_mapping.json"
         
-        index = load_index(index_path)
-        resume_mapping = load_resume_mapping(mapping_path)
+        index, resume_mapping = await asyncio.to_thread(_load_search_index, index_path, mapping_path)
         
         # Generate query embedding
         from app.utils.embeddings import generate_query_embedding
-        query_embedding = generate_query_embedding(query, recorder=recorder)
+        query_embedding = await asyncio.to_thread(generate_query_embedding, query, recorder=recorder)
         
         # Retrieve candidates
-        candidates = retrieve_candidates(
+        candidates = await asyncio.to_thread(
+            retrieve_candidates,
             index=index,
             query=query,
             query_embedding=query_embedding,
@@ -345,9 +405,9 @@ async def process_rag_query(
         # Cache response
         if full_response and not full_response.startswith("Error:"):
             with recorder.stage(STAGE_DB_WRITES):
-                save_cached_response(cache_path, query_hash, full_response)
+                await asyncio.to_thread(save_cached_response, cache_path, query_hash, full_response)
         
-        _persist_rag_latency(collection_root, recorder, label="rag_query")
+        await asyncio.to_thread(_persist_rag_latency, collection_root, recorder, "rag_query")
         
     except Exception as e:
         logger.error(f"RAG query error: {e}", exc_info=True)
@@ -1,8 +1,16 @@
 from pathlib import Path
 from datetime import datetime, UTC
-import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from operator import itemgetter
 import csv
 import logging
+import multiprocessing
+import os
+import threading
+import numpy as np
+import orjson
 import app.core.config as config
 from app.utils.jd_io import save_jd_text, load_jd_text
 from app.utils.vectorization import (
@@ -11,8 +19,8 @@ from app.utils.vectorization import (
     transform_text,
     cosine_similarities
 )
-from app.utils.skills import SKILLS, extract_skills, skill_overlap_score
-from app.utils.scoring import combine_scores, build_explainability
+from app.utils.skills import SKILLS, extract_jd_skills, extract_skills, skill_overlap_score
+from app.utils.scoring import combine_score_arrays, build_explainability
 from app.utils.artifacts import (
     ensure_artifacts_dir,
     save_vectorizer,
@@ -20,12 +28,11 @@ from app.utils.artifacts import (
     save_resume_index,
     save_rank_config
 )
-from app.utils.section_parser import parse_sections
+from app.utils.section_parser import ResumeSections, parse_sections
 from app.utils.tfidf_builder import (
     build_section_aware_tfidf,
-    transform_sections,
     transform_jd_sections,
-    compute_section_aware_similarity
+    compute_section_aware_similarities
 )
 from app.utils.ner.base import ExtractedEntities
 from app.utils.latency_tracker import (
@@ -37,6 +44,117 @@ from app.utils.latency_tracker import (
 
 logger = logging.getLogger(__name__)
 
+# Threads reading processed resumes and their Phase 2 JSON sidecars
+RESUME_READ_WORKERS = 32
+
+# Resumes needing vocabulary skill extraction before it moves to a process pool;
+# below this, pickling texts to workers costs more than the matching it spreads
+SKILL_EXTRACTION_PARALLEL_MIN = 32
+
+# Shared skill-extraction pool, created on first use. Workers come from a
+# forkserver (spawn where unavailable): forking the multi-threaded API process
+# per request could deadlock and copies the whole process each time
+_skill_pool: ProcessPoolExecutor | None = None
+_skill_pool_lock = threading.Lock()
+
+
+def _get_skill_pool() -> ProcessPoolExecutor:
+    global _skill_pool
+    if _skill_pool is None:
+        with _skill_pool_lock:
+            if _skill_pool is None:
+                start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                _skill_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count() or 1,
+                    mp_context=multiprocessing.get_context(start_method)
+                )
+    return _skill_pool
+
+
+def _reset_skill_pool() -> None:
+    global _skill_pool
+    with _skill_pool_lock:
+        pool, _skill_pool = _skill_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _load_resume(
+    resume_file: Path,
+    processed_dir: Path
+) -> tuple[str, ResumeSections | None, ExtractedEntities | None]:
+    """Read one processed resume with its Phase 2 sections and entities (None if unavailable)."""
+    text = resume_file.read_text(encoding='utf-8', errors='ignore')
+    
+    # Try to load sections from JSON (if available from Phase 2)
+    sections = None
+    sections_file = processed_dir / f"{resume_file.stem}_sections.json"
+    try:
+        sections_dict = orjson.loads(sections_file.read_bytes())
+        sections = ResumeSections(
+            summary=sections_dict.get("summary", ""),
+            experience=sections_dict.get("experience", ""),
+            skills=sections_dict.get("skills", ""),
+            education=sections_dict.get("education", ""),
+            projects=sections_dict.get("projects", ""),
+            other=sections_dict.get("other", "")
+        )
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Failed to load sections for {resume_file.name}: {e}")
+    
+    # Try to load entities from JSON (if available from Phase 2)
+    entities = None
+    entities_file = processed_dir / f"{resume_file.stem}_entities.json"
+    try:
+        entities = ExtractedEntities.from_dict(orjson.loads(entities_file.read_bytes()))
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Failed to load entities for {resume_file.name}: {e}")
+    
+    return text, sections, entities
+
+
+def _resolve_resume_skills(
+    resume_texts: list[str],
+    resume_entities_list: list[ExtractedEntities | None],
+    skills_vocab: list[str]
+) -> list[list[str]]:
+    """
+    Skills per resume: Phase 2 entity skills when present, else vocabulary matching.
+    
+    Vocabulary matching is CPU-bound Python, so when many resumes lack entity
+    skills it is spread across processes.
+    """
+    resume_skills: list[list[str] | None] = [
+        list(entities.skills.keys()) if entities and entities.skills else None
+        for entities in resume_entities_list
+    ]
+    missing = [i for i, skills in enumerate(resume_skills) if skills is None]
+    if not missing:
+        return resume_skills
+    
+    texts = [resume_texts[i] for i in missing]
+    extract = partial(extract_skills, skills_vocab=skills_vocab)
+    if len(missing) < SKILL_EXTRACTION_PARALLEL_MIN:
+        extracted = [extract(text) for text in texts]
+    else:
+        workers = os.cpu_count() or 1
+        try:
+            extracted = list(_get_skill_pool().map(extract, texts, chunksize=max(1, len(texts) // (4 * workers))))
+        except BrokenProcessPool as e:
+            # A dead worker breaks the pool for good: drop it (the next request
+            # starts a fresh one) and finish this request in-process
+            logger.warning(f"Skill extraction pool failed ({e}), extracting in-process")
+            _reset_skill_pool()
+            extracted = [extract(text) for text in texts]
+    for i, skills in zip(missing, extracted):
+        resume_skills[i] = skills
+    return resume_skills
+
+
 def rank_collection(company_id: str, collection_id: str, jd_text: str, top_k: int | None = None) -> dict:
     """Core Phase-3 ranking orchestration."""
     logger.info(f"Ranking collection {collection_id}")
@@ -60,55 +178,28 @@ def rank_collection(company_id: str, collection_id: str, jd_text: str, top_k: in
     if not resume_files:
         raise ValueError("No processed resumes found")
     
-    # Load resume texts and sections
+    # Load resume texts, sections and entities (file reads overlap on a thread pool)
+    with ThreadPoolExecutor(max_workers=min(RESUME_READ_WORKERS, len(resume_files))) as executor:
+        loaded = list(executor.map(partial(_load_resume, processed_dir=processed_dir), resume_files))
+    
     resume_texts = []
     resume_filenames = []
     resume_sections_list = []
     resume_entities_list = []
     
-    for resume_file in resume_files:
-        text = resume_file.read_text(encoding='utf-8', errors='ignore')
+    for resume_file, (text, sections, entities) in zip(resume_files, loaded):
         resume_texts.append(text)
         resume_filenames.append(resume_file.name)
         
-        # Try to load sections from JSON (if available from Phase 2)
-        sections = None
-        sections_file = processed_dir / f"{resume_file.stem}_sections.json"
-        if sections_file.exists():
-            try:
-                sections_dict = json.loads(sections_file.read_text(encoding='utf-8'))
-                from app.utils.section_parser import ResumeSections
-                sections = ResumeSections(
-                    summary=sections_dict.get("summary", ""),
-                    experience=sections_dict.get("experience", ""),
-                    skills=sections_dict.get("skills", ""),
-                    education=sections_dict.get("education", ""),
-                    projects=sections_dict.get("projects", ""),
-                    other=sections_dict.get("other", "")
-                )
-            except Exception as e:
-                logger.warning(f"Failed to load sections for {resume_file.name}: {e}")
-        
         # Parse sections if not loaded
         if sections is None:
             with recorder.stage(STAGE_PARSING):
                 sections = parse_sections(text)
         resume_sections_list.append(sections)
-        
-        # Try to load entities from JSON (if available from Phase 2)
-        entities = None
-        entities_file = processed_dir / f"{resume_file.stem}_entities.json"
-        if entities_file.exists():
-            try:
-                entities_dict = json.loads(entities_file.read_text(encoding='utf-8'))
-                entities = ExtractedEntities.from_dict(entities_dict)
-            except Exception as e:
-                logger.warning(f"Failed to load entities for {resume_file.name}: {e}")
-        
         resume_entities_list.append(entities)
     
     skills_vocab = SKILLS
-    jd_skills = extract_skills(jd_text, skills_vocab)
+    jd_skills = extract_jd_skills(jd_text, skills_vocab)
     jd_skills_set = set(jd_skills)
     
     # Use section-aware TF-IDF if sections are available
@@ -122,16 +213,12 @@ def rank_collection(company_id: str, collection_id: str, jd_text: str, top_k: in
         # Transform JD
         jd_vectors = transform_jd_sections(jd_text, section_vectorizers, skills_vocab)
         
-        # Compute TF-IDF scores using section-aware similarity
-        tfidf_scores = []
-        for sections, resume_text in zip(resume_sections_list, resume_texts):
-            resume_vectors = transform_sections(sections, section_vectorizers, skills_vocab)
-            similarity = compute_section_aware_similarity(
-                resume_vectors, jd_vectors, 
-                resume_text=resume_text, jd_text=jd_text, 
-                skills_vocab=skills_vocab
-            )
-            tfidf_scores.append(similarity)
+        # Compute TF-IDF scores for all resumes in one batched pass per section
+        tfidf_scores = compute_section_aware_similarities(
+            resume_sections_list, section_vectorizers, jd_vectors,
+            resume_texts=resume_texts, jd_text=jd_text,
+            skills_vocab=skills_vocab
+        ).tolist()
     else:
         logger.info("Falling back to standard TF-IDF (sections not available)")
         # Fallback to standard TF-IDF
@@ -140,66 +227,57 @@ def rank_collection(company_id: str, collection_id: str, jd_text: str, top_k: in
         jd_vector = transform_text(vectorizer, jd_text)
         tfidf_scores = cosine_similarities(resume_matrix, jd_vector)
     
-    results = []
+    # Extract skills - prefer from entities if available
+    resume_skills_list = _resolve_resume_skills(resume_texts, resume_entities_list, skills_vocab)
     
-    for idx, (filename, resume_text, tfidf_score, entities) in enumerate(
-        zip(resume_filenames, resume_texts, tfidf_scores, resume_entities_list)
-    ):
-        # Extract skills - prefer from entities if available
-        if entities and entities.skills:
-            resume_skills = list(entities.skills.keys())
-        else:
-            resume_skills = extract_skills(resume_text, skills_vocab)
-        
-        resume_skills_set = set(resume_skills)
-        
-        skill_score = skill_overlap_score(jd_skills_set, resume_skills_set)
-        final_score = combine_scores(tfidf_score, skill_score)
-        explainability = build_explainability(jd_skills, resume_skills)
-        
+    # Score arrays aligned by resume (the fallback matrix drops empty texts,
+    # so only the first len(tfidf_scores) resumes are scored)
+    num_scored = min(len(resume_filenames), len(tfidf_scores))
+    tfidf_arr = np.asarray(tfidf_scores[:num_scored], dtype=np.float64)
+    skill_arr = np.fromiter(
+        (skill_overlap_score(jd_skills_set, set(resume_skills)) for resume_skills in resume_skills_list[:num_scored]),
+        dtype=np.float64,
+        count=num_scored
+    )
+    final_arr = combine_score_arrays(tfidf_arr, skill_arr)
+    
+    # Rank by final score, then TF-IDF (both descending; stable for ties)
+    order = np.lexsort((-tfidf_arr, -final_arr))
+    if top_k is not None:
+        order = order[:top_k]
+    
+    # Only the kept rows are rounded and turned into result dicts
+    results = []
+    for rank, (i, tfidf_score, skill_score, final_score) in enumerate(zip(
+        order.tolist(),
+        np.round(tfidf_arr[order], 4).tolist(),
+        np.round(skill_arr[order], 4).tolist(),
+        np.round(final_arr[order], 4).tolist()
+    ), start=1):
+        explainability = build_explainability(jd_skills, resume_skills_list[i])
         results.append({
-            "filename": filename,
-            "tfidf_score_raw": tfidf_score,
-            "skill_score_raw": skill_score,
-            "final_score_raw": final_score,
+            "filename": resume_filenames[i],
             "explainability": {
                 "matched_skills": explainability["matched_skills"],
                 "missing_skills": explainability["missing_skills"]
-            }
+            },
+            "rank": rank,
+            "tfidf_score": tfidf_score,
+            "skill_score": skill_score,
+            "final_score": final_score
         })
     
-    results.sort(key=lambda x: (x["final_score_raw"], x["tfidf_score_raw"]), reverse=True)
-    
-    for rank, result in enumerate(results, start=1):
-        result["rank"] = rank
-        result["tfidf_score"] = round(result["tfidf_score_raw"], 4)
-        result["skill_score"] = round(result["skill_score_raw"], 4)
-        result["final_score"] = round(result["final_score_raw"], 4)
-        del result["tfidf_score_raw"]
-        del result["skill_score_raw"]
-        del result["final_score_raw"]
-    
-    if top_k is not None:
-        results = results[:top_k]
-    
     ranking_json = outputs_dir / "ranking_results.json"
     ranking_csv = outputs_dir / "ranking_results.csv"
     with recorder.stage(STAGE_DB_WRITES):
-        ranking_json.write_text(json.dumps(results, indent=2), encoding='utf-8')
+        ranking_json.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
     
     with open(ranking_csv, 'w', newline='', encoding='utf-8') as f:
         if results:
             fieldnames = ["rank", "filename", "tfidf_score", "skill_score", "final_score"]
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for result in results:
-                writer.writerow({
-                    "rank": result["rank"],
-                    "filename": result["filename"],
-                    "tfidf_score": result["tfidf_score"],
-                    "skill_score": result["skill_score"],
-                    "final_score": result["final_score"]
-                })
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(map(itemgetter(*fieldnames), results))
     
     ranking_summary = {
         "collection_id": collection_id,
@@ -213,7 +291,7 @@ def rank_collection(company_id: str, collection_id: str, jd_text: str, top_k: in
     
     summary_file = reports_dir / "ranking_summary.json"
     with recorder.stage(STAGE_DB_WRITES):
-        summary_file.write_text(json.dumps(ranking_summary, indent=2), encoding='utf-8')
+        summary_file.write_bytes(orjson.dumps(ranking_summary, option=orjson.OPT_INDENT_2))
     
     artifacts_dir = ensure_artifacts_dir(collection_root)
     
@@ -232,13 +310,16 @@ def rank_collection(company_id: str, collection_id: str, jd_text: str, top_k: in
     save_rank_config(artifacts_dir, rank_config)
     
     meta_file = collection_root / "collection_meta.json"
-    meta = json.loads(meta_file.read_text()) if meta_file.exists() else {}
+    try:
+        meta = orjson.loads(meta_file.read_bytes())
+    except FileNotFoundError:
+        meta = {}
     meta.update({
         "ranking_status": "completed",
         "ranked_at": datetime.now(UTC).isoformat()
     })
     with recorder.stage(STAGE_DB_WRITES):
-        meta_file.write_text(json.dumps(meta, indent=2), encoding='utf-8')
+        meta_file.write_bytes(orjson.dumps(meta, option=orjson.OPT_INDENT_2))
     
     if recorder.to_samples_dict():
         save_latency_report(reports_dir, recorder, label="phase3_ranking", filename="latency_report_rank.json")
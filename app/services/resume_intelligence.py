@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import Dict, Optional
 
 from app.utils.experience import compute_experience_signals
@@ -14,11 +15,16 @@ from app.utils.section_parser import parse_sections, sections_to_dict
 
 logger = logging.getLogger(__name__)
 
+# Entity fields where spaCy results are merged into the rule-based ones
+_SPACY_ENTITY_FIELDS = ("organizations", "roles", "locations")
+
 
 def extract_resume_intelligence(
     text: str,
     filename: str,
     recorder: Optional[LatencyRecorder] = None,
+    spacy_entities: Optional[Dict] = None,
+    spacy_ms: float = 0.0,
 ) -> Dict:
     """
     Parse sections, extract entities, and compute experience signals.
@@ -27,6 +33,10 @@ def extract_resume_intelligence(
         text: Resume plain text.
         filename: Source filename for logging.
         recorder: Optional latency recorder.
+        spacy_entities: spaCy entities already computed for ``text`` (e.g. by a
+            batched ``nlp.pipe`` pass); extracted here when omitted.
+        spacy_ms: This document's share of the batched spaCy time, added to
+            the recorded NER latency.
 
     Returns:
         Dict with ``sections``, ``entities``, and ``experience`` keys.
@@ -40,21 +50,20 @@ def extract_resume_intelligence(
         sections_dict = sections_to_dict(sections, boundaries=boundaries)
 
         if recorder:
-            with recorder.stage(STAGE_NER):
-                rule_entities = extract_rule_based_entities(text)
+            start = time.perf_counter()
+            rule_entities = extract_rule_based_entities(text)
+            if spacy_entities is None:
                 spacy_entities = extract_spacy_entities(text)
+            recorder.record(STAGE_NER, (time.perf_counter() - start) * 1000 + spacy_ms)
         else:
             rule_entities = extract_rule_based_entities(text)
-            spacy_entities = extract_spacy_entities(text)
+            if spacy_entities is None:
+                spacy_entities = extract_spacy_entities(text)
 
         entities_dict = rule_entities.to_dict()
-        entities_dict["organizations"].extend(spacy_entities["organizations"])
-        entities_dict["roles"].extend(spacy_entities["roles"])
-        entities_dict["locations"].extend(spacy_entities["locations"])
-
-        entities_dict["organizations"] = sorted(list(set(entities_dict["organizations"])))
-        entities_dict["roles"] = sorted(list(set(entities_dict["roles"])))
-        entities_dict["locations"] = sorted(list(set(entities_dict["locations"])))
+        # Union and sort in one step per field (no extend/list(set()) round-trip)
+        for key in _SPACY_ENTITY_FIELDS:
+            entities_dict[key] = sorted({*entities_dict[key], *spacy_entities[key]})
 
         entities_dict = normalize_entities(entities_dict)
         normalized_entities = ExtractedEntities.from_dict(entities_dict)
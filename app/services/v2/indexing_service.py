@@ -1,7 +1,6 @@
 """Offline per-candidate indexing pipeline (v2)."""
 from __future__ import annotations
 
-import hashlib
 import logging
 import re
 import uuid
@@ -16,6 +15,7 @@ from sqlalchemy.orm import Session
 from app.api.routes.v2.helpers import job_storage_path
 from app.models.tables import Candidate, CandidateIndex
 from app.utils.chunker import chunk_resume
+from app.utils.hashing import compute_sha256
 from app.utils.model_cache import ModelCache
 from app.utils.skill_normalizer import SkillNormalizer
 from app.utils.skills import SKILLS, extract_skills
@@ -148,7 +148,7 @@ async def index_candidate(candidate_id: str, db: Session) -> None:
         candidate.processed_text_path = str(processed_path)
 
         step = "duplicate_detection"
-        content_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        content_hash = compute_sha256(text)
         existing = db.execute(
             select(Candidate).where(
                 Candidate.job_id == candidate.job_id,
@@ -20,7 +20,7 @@ from app.services.v2.skill_coverage_service import apply_implied_by_map, load_sk
 from app.utils.chunker import chunk_text
 from app.utils.model_cache import ModelCache
 from app.utils.skill_normalizer import SkillNormalizer
-from app.utils.skills import SKILLS, extract_skills
+from app.utils.skills import SKILLS, extract_jd_skills
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +33,7 @@ def _extract_jd_skills(jd_text: str) -> set[str]:
         for e in entities
         if e.get("entity_group") == "MISC" and e.get("word", "").strip()
     ]
-    keyword_skills = extract_skills(jd_text, SKILLS)
+    keyword_skills = extract_jd_skills(jd_text, SKILLS)
     raw_skills = sorted({s for s in misc_skills + keyword_skills if s and len(s) > 1})
     normalizer = SkillNormalizer()
     return set(normalizer.normalize(raw_skills))
@@ -1,8 +1,15 @@
 from pathlib import Path
-import pickle
-import json
+import orjson
+import joblib
+import numpy as np
 import scipy.sparse
 
+# zlib level for the vectorizer artifact (its vocabulary dict dominates the size)
+VECTORIZER_COMPRESS_LEVEL = 3
+
+# CSR component arrays stored as separate .npy files so they can be memory-mapped
+SPARSE_MATRIX_PARTS = ("data", "indices", "indptr", "shape")
+
 def ensure_artifacts_dir(collection_root: Path) -> Path:
     """
     Creates artifacts directory.
@@ -19,7 +26,7 @@ def ensure_artifacts_dir(collection_root: Path) -> Path:
 
 def save_vectorizer(artifacts_dir: Path, vectorizer) -> Path:
     """
-    Saves vectorizer using pickle.
+    Saves vectorizer using joblib (zlib-compressed, ndarray-aware pickling).
     
     Args:
         artifacts_dir: Artifacts directory
@@ -29,24 +36,58 @@ def save_vectorizer(artifacts_dir: Path, vectorizer) -> Path:
         Path to saved vectorizer
     """
     vectorizer_file = artifacts_dir / "tfidf_vectorizer.pkl"
-    with open(vectorizer_file, 'wb') as f:
-        pickle.dump(vectorizer, f, protocol=pickle.HIGHEST_PROTOCOL)
+    joblib.dump(vectorizer, vectorizer_file, compress=VECTORIZER_COMPRESS_LEVEL)
     return vectorizer_file
 
+def load_vectorizer(artifacts_dir: Path):
+    """
+    Loads a vectorizer saved by save_vectorizer.
+    
+    Args:
+        artifacts_dir: Artifacts directory
+        
+    Returns:
+        Fitted TF-IDF vectorizer
+    """
+    return joblib.load(artifacts_dir / "tfidf_vectorizer.pkl")
+
 def save_sparse_matrix(artifacts_dir: Path, matrix: scipy.sparse.csr_matrix) -> Path:
     """
-    Saves sparse matrix.
+    Saves sparse matrix as its raw CSR arrays (one .npy file each).
     
     Args:
         artifacts_dir: Artifacts directory
         matrix: Sparse matrix
         
     Returns:
-        Path to saved matrix
+        Path to saved matrix directory
+    """
+    matrix_dir = artifacts_dir / "resume_matrix"
+    matrix_dir.mkdir(exist_ok=True)
+    matrix = scipy.sparse.csr_matrix(matrix)
+    parts = (matrix.data, matrix.indices, matrix.indptr, np.asarray(matrix.shape, dtype=np.int64))
+    for name, array in zip(SPARSE_MATRIX_PARTS, parts):
+        np.save(matrix_dir / f"{name}.npy", array)
+    return matrix_dir
+
+def load_sparse_matrix(artifacts_dir: Path) -> scipy.sparse.csr_matrix:
+    """
+    Loads a matrix saved by save_sparse_matrix with its arrays memory-mapped.
+    
+    Pages are read on demand rather than the whole matrix up front; the
+    returned matrix is read-only.
+    
+    Args:
+        artifacts_dir: Artifacts directory
+        
+    Returns:
+        Sparse matrix
     """
-    matrix_file = artifacts_dir / "resume_matrix.npz"
-    scipy.sparse.save_npz(matrix_file, matrix)
-    return matrix_file
+    matrix_dir = artifacts_dir / "resume_matrix"
+    data, indices, indptr, shape = (
+        np.load(matrix_dir / f"{name}.npy", mmap_mode='r') for name in SPARSE_MATRIX_PARTS
+    )
+    return scipy.sparse.csr_matrix((data, indices, indptr), shape=tuple(int(n) for n in shape), copy=False)
 
 def save_resume_index(artifacts_dir: Path, filenames: list[str]) -> Path:
     """
@@ -60,7 +101,7 @@ def save_resume_index(artifacts_dir: Path, filenames: list[str]) -> Path:
         Path to saved index
     """
     index_file = artifacts_dir / "resume_index.json"
-    index_file.write_text(json.dumps(filenames, indent=2), encoding='utf-8')
+    index_file.write_bytes(orjson.dumps(filenames, option=orjson.OPT_INDENT_2))
     return index_file
 
 def save_rank_config(artifacts_dir: Path, config: dict) -> Path:
@@ -75,5 +116,5 @@ def save_rank_config(artifacts_dir: Path, config: dict) -> Path:
         Path to saved config
     """
     config_file = artifacts_dir / "rank_config.json"
-    config_file.write_text(json.dumps(config, indent=2), encoding='utf-8')
+    config_file.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
     return config_file
\ No newline at end of file
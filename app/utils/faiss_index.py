@@ -1,13 +1,32 @@
 """Utility for managing FAISS vector index."""
-import json
 import logging
+import os
 from pathlib import Path
 from typing import Dict, List, Tuple
 import numpy as np
+import orjson
 import faiss
+from app.core.errors import ReportNotFoundError
+from app.utils.io_reports import read_json_file
 
 logger = logging.getLogger(__name__)
 
+# Index type by collection size (vectors = resume chunks): exact flat search
+# below HNSW_MIN_VECTORS, HNSW graph over int8 scalar-quantized vectors (1 byte
+# per dim) up to IVFPQ_MIN_VECTORS, then IVF-PQ (1 byte per 4 dims)
+HNSW_MIN_VECTORS = 5_000
+IVFPQ_MIN_VECTORS = 100_000
+HNSW_NEIGHBORS = 32
+HNSW_EF_CONSTRUCTION = 200
+HNSW_EF_SEARCH = 64
+IVFPQ_NBITS = 8
+IVFPQ_NPROBE = 16
+
+# Indexes are memory-mapped read-only (flat codes and IVF lists), so a loaded
+# index costs no parse and its pages are shared through the page cache.
+# IO_FLAG_MMAP_IFC is left out: combined with these it breaks reading IVF lists
+INDEX_READ_FLAGS = faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+
 
 def create_faiss_index(dimension: int = 384) -> faiss.Index:
     """
@@ -25,6 +44,51 @@ def create_faiss_index(dimension: int = 384) -> faiss.Index:
     return index
 
 
+def _create_index_for_size(embeddings: np.ndarray) -> tuple[faiss.Index, dict]:
+    """
+    Create (and train, if needed) an L2 index suited to the number of vectors.
+    
+    All types search with L2 distance over normalized vectors, so retrieval
+    scores keep the same meaning; HNSW and IVF-PQ trade exactness for
+    sub-linear queries and quantized storage (int8 codes for HNSW, PQ codes
+    for IVF-PQ).
+    
+    Returns:
+        Tuple of (empty index ready for ``add``, config recorded in metadata)
+    """
+    n, d = embeddings.shape
+    if n < HNSW_MIN_VECTORS:
+        return create_faiss_index(d), {"index_type": "IndexFlatL2"}
+    
+    if n < IVFPQ_MIN_VECTORS:
+        index = faiss.IndexHNSWSQ(d, faiss.ScalarQuantizer.QT_8bit, HNSW_NEIGHBORS)
+        index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+        index.hnsw.efSearch = HNSW_EF_SEARCH
+        # Training only fits the per-dimension int8 range
+        index.train(embeddings)
+        return index, {
+            "index_type": "IndexHNSWSQ",
+            "sq_type": "QT_8bit",
+            "hnsw_m": HNSW_NEIGHBORS,
+            "ef_construction": HNSW_EF_CONSTRUCTION,
+            "ef_search": HNSW_EF_SEARCH,
+        }
+    
+    nlist = int(np.sqrt(n))
+    m = d // 4
+    quantizer = faiss.IndexFlatL2(d)
+    index = faiss.IndexIVFPQ(quantizer, d, nlist, m, IVFPQ_NBITS)
+    index.train(embeddings)
+    index.nprobe = IVFPQ_NPROBE
+    return index, {
+        "index_type": "IndexIVFPQ",
+        "nlist": nlist,
+        "pq_m": m,
+        "pq_nbits": IVFPQ_NBITS,
+        "nprobe": IVFPQ_NPROBE,
+    }
+
+
 def build_index(
     embeddings: np.ndarray,
     resume_mapping: Dict[int, str],
@@ -43,19 +107,22 @@ def build_index(
         meta_path: Path to save index metadata JSON
     """
     # Normalize embeddings for cosine similarity with L2 distance
+    embeddings = np.ascontiguousarray(embeddings, dtype='float32')
     faiss.normalize_L2(embeddings)
     
-    # Create and populate index
-    index = create_faiss_index(embeddings.shape[1])
-    index.add(embeddings.astype('float32'))
+    # Create (train) and populate index in one add
+    index, index_config = _create_index_for_size(embeddings)
+    index.add(embeddings)
     
-    # Save index
+    # Save index via a temp file + rename: readers may have the old file
+    # memory-mapped, and truncating it in place would fault their pages
     index_path.parent.mkdir(parents=True, exist_ok=True)
-    faiss.write_index(index, str(index_path))
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    faiss.write_index(index, str(tmp_path))
+    os.replace(tmp_path, index_path)
     
     # Save resume mapping
-    with open(mapping_path, 'w') as f:
-        json.dump(resume_mapping, f, indent=2)
+    mapping_path.write_bytes(orjson.dumps(resume_mapping, option=orjson.OPT_NON_STR_KEYS))
     
     # Save metadata
     from datetime import datetime, UTC
@@ -63,17 +130,16 @@ def build_index(
         "dimension": embeddings.shape[1],
         "num_vectors": embeddings.shape[0],
         "build_timestamp": datetime.now(UTC).isoformat(),
-        "index_type": "IndexFlatL2"
+        **index_config
     }
-    with open(meta_path, 'w') as f:
-        json.dump(metadata, f, indent=2)
+    meta_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
     
-    logger.info(f"Built FAISS index with {embeddings.shape[0]} vectors")
+    logger.info(f"Built FAISS {index_config['index_type']} with {embeddings.shape[0]} vectors")
 
 
 def load_index(index_path: Path) -> faiss.Index:
     """
-    Load FAISS index from disk.
+    Load FAISS index from disk (memory-mapped, read-only).
     
     Args:
         index_path: Path to FAISS index file
@@ -83,7 +149,7 @@ def load_index(index_path: Path) -> faiss.Index:
     """
     if not index_path.exists():
         raise ValueError(f"Index file not found: {index_path}")
-    return faiss.read_index(str(index_path))
+    return faiss.read_index(str(index_path), INDEX_READ_FLAGS)
 
 
 def load_resume_mapping(mapping_path: Path) -> Dict[int, str]:
@@ -98,8 +164,7 @@ def load_resume_mapping(mapping_path: Path) -> Dict[int, str]:
     """
     if not mapping_path.exists():
         raise ValueError(f"Mapping file not found: {mapping_path}")
-    with open(mapping_path, 'r') as f:
-        mapping = json.load(f)
+    mapping = orjson.loads(mapping_path.read_bytes())
     # Convert string keys to int (JSON keys are strings)
     return {int(k): v for k, v in mapping.items()}
 
@@ -133,13 +198,16 @@ def get_index_metadata(meta_path: Path) -> dict:
     """
     Load index metadata.
     
+    Parsed metadata is cached until the file changes (see ``read_json_file``);
+    the returned dict is shared and must not be mutated.
+    
     Args:
         meta_path: Path to metadata JSON
         
     Returns:
         Metadata dictionary
     """
-    if not meta_path.exists():
+    try:
+        return read_json_file(meta_path)
+    except ReportNotFoundError:
         return {}
-    with open(meta_path, 'r') as f:
-        return json.load(f)
@@ -1,4 +1,6 @@
 from pathlib import Path
+import os
+import shutil
 from app.core.config import COLLECTIONS_ROOT
 
 
@@ -13,6 +15,51 @@ def resolve_collection_path(company_id: str, collection_id: str) -> Path:
     return base
 
 
+def dir_has_entries(path: Path, suffix: str | None = None) -> bool:
+    """
+    Check whether a directory has at least one entry (optionally with a suffix).
+    
+    Uses os.scandir, which stops at the first match instead of listing
+    the whole directory. Missing directories count as empty.
+    """
+    try:
+        with os.scandir(path) as it:
+            if suffix is None:
+                return next(it, None) is not None
+            return any(entry.name.endswith(suffix) for entry in it)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
+def prefetch_files(paths) -> int:
+    """
+    Ask the kernel to start reading files into the page cache.
+    
+    Issues POSIX_FADV_WILLNEED per file, which queues asynchronous readahead
+    and returns immediately, so later reads are served from memory. A no-op
+    on platforms without posix_fadvise.
+    
+    Returns:
+        Number of files hinted
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return 0
+    hinted = 0
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            hinted += 1
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    return hinted
+
+
 def create_collection_dirs(base_path: Path):
     """Create collection directory structure"""
     (base_path / "input" / "raw").mkdir(parents=True, exist_ok=True)
@@ -39,8 +86,7 @@ def safe_write_file(target_path: Path, file_stream):
     # Write to temp file first
     tmp_path = target_path.with_suffix('.tmp')
     with open(tmp_path, 'wb') as f:
-        content = file_stream.read()
-        f.write(content)
+        shutil.copyfileobj(file_stream, f, length=1 << 20)
     
     # Atomic rename
     tmp_path.replace(target_path)
@@ -1,13 +1,91 @@
 import hashlib
+from pathlib import Path
 
-def compute_sha256(text: str) -> str:
+try:
+    import blake3
+except ImportError:  # pragma: no cover - optional dependency
+    blake3 = None
+
+# Text above this many characters is encoded and hashed in slices of this size,
+# so hashing never holds a full UTF-8 copy of a large (e.g. OCR) resume
+HASH_ENCODE_CHUNK_CHARS = 1 << 20
+
+def compute_sha256(text: str | bytes) -> str:
     """
     Compute SHA-256 hash of text content.
     
+    Content hashes are only used for duplicate detection, so the digest is
+    created with ``usedforsecurity=False``; hashlib dispatches to OpenSSL,
+    whose SHA-256 uses the CPU's SHA extensions (SHA-NI / ARMv8 SHA2) when
+    present.
+    
     Args:
-        text: Extracted text content
+        text: Extracted text content (or its UTF-8 bytes, if already encoded)
         
     Returns:
         str: Hexadecimal hash string
     """
-    return hashlib.sha256(text.encode('utf-8')).hexdigest()
\ No newline at end of file
+    return compute_sha256_digest(text).hex()
+
+
+def compute_sha256_digest(text: str | bytes) -> bytes:
+    """
+    Compute the raw 32-byte SHA-256 digest of text content.
+    
+    Preferred for in-memory indexes: the key is half the size of the hex
+    string and needs no encoding step. Long text is encoded slice by slice;
+    the digest equals that of the whole UTF-8 encoding.
+    
+    Args:
+        text: Extracted text content (or its UTF-8 bytes, if already encoded)
+        
+    Returns:
+        bytes: 32-byte digest
+    """
+    if not isinstance(text, str):
+        return hashlib.sha256(text, usedforsecurity=False).digest()
+    if len(text) <= HASH_ENCODE_CHUNK_CHARS:
+        return hashlib.sha256(text.encode('utf-8'), usedforsecurity=False).digest()
+    h = hashlib.sha256(usedforsecurity=False)
+    for start in range(0, len(text), HASH_ENCODE_CHUNK_CHARS):
+        h.update(text[start:start + HASH_ENCODE_CHUNK_CHARS].encode('utf-8'))
+    return h.digest()
+
+
+def compute_file_sha256_digest(path: Path) -> bytes:
+    """
+    Compute the raw 32-byte SHA-256 digest of a file's bytes.
+    
+    Uses hashlib.file_digest, which reads in large blocks and hashes with the
+    GIL released, so several files can be hashed in parallel threads.
+    
+    Args:
+        path: File to hash
+        
+    Returns:
+        bytes: 32-byte digest
+    """
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, lambda: hashlib.sha256(usedforsecurity=False)).digest()
+
+
+def compute_file_fingerprint(path: Path) -> bytes:
+    """
+    Compute a fast digest of a file's bytes for in-process comparison.
+    
+    Uses BLAKE3 (SIMD, memory-mapped read) when the optional ``blake3``
+    package is installed, otherwise SHA-256. The algorithm therefore depends on
+    the environment: only compare fingerprints computed in the same process,
+    and use the SHA-256 helpers for anything persisted.
+    
+    Args:
+        path: File to hash
+        
+    Returns:
+        bytes: 32-byte digest
+    """
+    if blake3 is None:
+        return compute_file_sha256_digest(path)
+    hasher = blake3.blake3()
+    hasher.update_mmap(path)
+    return hasher.digest()
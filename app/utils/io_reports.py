@@ -1,10 +1,28 @@
+from functools import lru_cache
 from pathlib import Path
+import asyncio
 import json
+import mmap
+import orjson
+from app.core.errors import ReportNotFoundError
+
+# Parsed reports kept in memory; entries are keyed by (path, mtime_ns, size)
+REPORT_CACHE_SIZE = 256
+
+# Per-collection report path tables (small entries, so this can be generous)
+PATH_TABLE_CACHE_SIZE = 2048
+
+# Files above this are memory-mapped and parsed in place rather than read into bytes
+MMAP_THRESHOLD_BYTES = 1 << 20
 
 def read_json_file(path: Path) -> dict | list:
     """
     Read JSON file safely.
     
+    Parsed content is cached until the file's mtime or size changes, so a
+    repeat read costs one stat. The returned object is shared between
+    callers and must not be mutated.
+    
     Args:
         path: Path to JSON file
         
@@ -12,16 +30,66 @@ def read_json_file(path: Path) -> dict | list:
         Parsed JSON content
         
     Raises:
-        ValueError: If file not found or invalid JSON
+        ReportNotFoundError: If file not found
+        ValueError: If invalid JSON
     """
-    if not path.exists():
-        raise ValueError("Report not found")
+    try:
+        st = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        raise ReportNotFoundError("Report not found")
+    
+    return _load_json_cached(str(path), st.st_mtime_ns, st.st_size)
+
+@lru_cache(maxsize=REPORT_CACHE_SIZE)
+def _load_json_cached(path_str: str, mtime_ns: int, size: int) -> dict | list:
+    try:
+        if size > MMAP_THRESHOLD_BYTES:
+            with open(path_str, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                with memoryview(mm) as view:
+                    return _parse_json(view)
+        return _parse_json(Path(path_str).read_bytes())
+    except FileNotFoundError:
+        raise ReportNotFoundError("Report not found")
+
+def _parse_json(data: bytes | memoryview) -> dict | list:
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        pass
     
+    # orjson rejects NaN/Infinity, which json.dump writes by default
     try:
-        return json.loads(path.read_text(encoding='utf-8'))
-    except json.JSONDecodeError:
+        return json.loads(bytes(data))
+    except (json.JSONDecodeError, UnicodeDecodeError, RecursionError):
         raise ValueError("Invalid JSON report")
 
+def _read_json_batch(paths: list[Path]) -> list[dict | list | None]:
+    results = []
+    for path in paths:
+        try:
+            results.append(read_json_file(path))
+        except ValueError:
+            results.append(None)
+    return results
+
+async def read_json_files(paths: list[Path]) -> list[dict | list | None]:
+    """
+    Read several optional JSON reports off the event loop in one submission.
+    
+    The whole batch runs in a single worker-thread hop: with the mtime cache
+    most reads are a single stat, so per-file thread dispatch would cost more
+    than the reads themselves.
+    
+    Args:
+        paths: Paths to JSON files
+        
+    Returns:
+        Parsed contents in the same order (None for missing or invalid files)
+    """
+    return await asyncio.to_thread(_read_json_batch, paths)
+
 def read_text_file(path: Path) -> str:
     """
     Read text file safely.
@@ -33,17 +101,21 @@ def read_text_file(path: Path) -> str:
         File content
         
     Raises:
-        ValueError: If file not found
+        ReportNotFoundError: If file not found
     """
     if not path.exists():
-        raise ValueError("Report not found")
+        raise ReportNotFoundError("Report not found")
     
     return path.read_text(encoding='utf-8')
 
+@lru_cache(maxsize=PATH_TABLE_CACHE_SIZE)
 def get_report_paths(collection_root: Path) -> dict:
     """
     Get dictionary of expected report paths.
     
+    Memoized per collection root; the returned dict is shared and must
+    not be mutated.
+    
     Args:
         collection_root: Collection root directory
         
@@ -51,13 +123,13 @@ def get_report_paths(collection_root: Path) -> dict:
         Dictionary mapping report names to paths
     """
     return {
-        "validation": collection_root / "reports" / "validation_report.json",
-        "duplicates": collection_root / "reports" / "duplicate_report.json",
-        "ranking_summary": collection_root / "reports" / "ranking_summary.json",
-        "latency": collection_root / "reports" / "latency_report.json",
-        "latency_rag": collection_root / "reports" / "latency_report_rag.json",
-        "latency_rank": collection_root / "reports" / "latency_report_rank.json",
-        "ranking_json": collection_root / "outputs" / "ranking_results.json",
-        "ranking_csv": collection_root / "outputs" / "ranking_results.csv",
+        "validation": collection_root.joinpath("reports", "validation_report.json"),
+        "duplicates": collection_root.joinpath("reports", "duplicate_report.json"),
+        "ranking_summary": collection_root.joinpath("reports", "ranking_summary.json"),
+        "latency": collection_root.joinpath("reports", "latency_report.json"),
+        "latency_rag": collection_root.joinpath("reports", "latency_report_rag.json"),
+        "latency_rank": collection_root.joinpath("reports", "latency_report_rank.json"),
+        "ranking_json": collection_root.joinpath("outputs", "ranking_results.json"),
+        "ranking_csv": collection_root.joinpath("outputs", "ranking_results.csv"),
         "meta": collection_root / "collection_meta.json"
     }
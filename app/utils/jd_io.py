@@ -30,6 +30,36 @@ def load_jd_text(collection_root: Path) -> str:
     return jd_file.read_text(encoding="utf-8", errors="ignore").strip()
 
 
+# Upper bound on uploaded JD files, which are read fully into memory
+MAX_JD_FILE_BYTES = 5 * 1024 * 1024
+
+
+def jd_file_path(collection_root: Path, filename: str) -> Path:
+    """
+    Target path for an uploaded JD: collection_root/input/jd.<ext>
+
+    Raises:
+        ValueError: if the extension is not .pdf, .docx or .txt
+    """
+    suffix = Path(filename).suffix.lower()
+    if suffix not in {".pdf", ".docx", ".txt"}:
+        raise ValueError("Unsupported JD file type. Allowed: .pdf, .docx, .txt")
+    return collection_root / "input" / f"jd{suffix}"
+
+
+def save_jd_bytes(collection_root: Path, filename: str, data: bytes) -> Path:
+    """
+    Save uploaded JD bytes into collection_root/input/.
+
+    Returns:
+        Path to saved JD file
+    """
+    jd_path = jd_file_path(collection_root, filename)
+    jd_path.parent.mkdir(parents=True, exist_ok=True)
+    jd_path.write_bytes(data)
+    return jd_path
+
+
 def save_jd_file(
     collection_root: Path,
     filename: str,
@@ -46,14 +76,8 @@ def save_jd_file(
     Returns:
         Path to saved JD file
     """
-    input_dir = collection_root / "input"
-    input_dir.mkdir(parents=True, exist_ok=True)
-
-    suffix = Path(filename).suffix.lower()
-    if suffix not in {".pdf", ".docx", ".txt"}:
-        raise ValueError("Unsupported JD file type. Allowed: .pdf, .docx, .txt")
-
-    jd_path = input_dir / f"jd{suffix}"
+    jd_path = jd_file_path(collection_root, filename)
+    jd_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Copy stream -> disk (safe for big files, doesn't load entire file in memory)
     with open(jd_path, "wb") as out:
@@ -1,7 +1,6 @@
 """Per-stage latency measurement with p50 / p95 / p99 aggregation."""
 from __future__ import annotations
 
-import json
 import time
 from collections import defaultdict
 from contextlib import contextmanager
@@ -9,6 +8,8 @@ from datetime import datetime, UTC
 from pathlib import Path
 from typing import Any, DefaultDict, Iterator, Optional
 
+import orjson
+
 # Canonical stage names used across the pipeline
 STAGE_TEXT_EXTRACTION = "text_extraction"
 STAGE_OCR = "ocr"
@@ -129,8 +130,8 @@ def load_samples_sidecar(reports_dir: Path) -> dict[str, list[float]]:
     if not path.exists():
         return {}
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+        return orjson.loads(path.read_bytes())
+    except orjson.JSONDecodeError:
         return {}
 
 
@@ -149,12 +150,11 @@ def save_latency_report(
     combined.merge(recorder)
     # Update cumulative raw samples for accurate percentiles across runs
     all_samples = combined.to_samples_dict()
-    _samples_sidecar_path(reports_dir).write_text(
-        json.dumps(all_samples, indent=2), encoding="utf-8"
-    )
+    # The sidecar grows with every run and is only read back here: keep it compact
+    _samples_sidecar_path(reports_dir).write_bytes(orjson.dumps(all_samples))
     report_path = reports_dir / filename
     report = combined.summary(label=label)
-    report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    report_path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
     return report_path
 
 
@@ -163,8 +163,8 @@ def load_latency_report(reports_dir: Path, filename: str = "latency_report.json"
     if not path.exists():
         return None
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+        return orjson.loads(path.read_bytes())
+    except orjson.JSONDecodeError:
         return None
 
 
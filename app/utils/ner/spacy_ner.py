@@ -4,12 +4,16 @@ spaCy-based NER extraction for organizations, roles, and locations.
 Uses lightweight spaCy model (en_core_web_sm) for controlled extraction.
 """
 import logging
+import re
+import threading
 from typing import List, Set, Optional
 
 logger = logging.getLogger(__name__)
 
 # Global spaCy model (lazy loaded)
 _nlp = None
+# Serializes loading so a background preload and a first caller load the model once
+_nlp_lock = threading.Lock()
 
 
 def _get_spacy_model():
@@ -21,18 +25,22 @@ def _get_spacy_model():
     """
     global _nlp
     
-    if _nlp is None:
-        try:
-            import spacy
-            # Load small English model, disable parser and lemmatizer for speed
-            _nlp = spacy.load("en_core_web_sm", disable=["parser", "lemmatizer"])
-            logger.info("spaCy model loaded successfully")
-        except OSError:
-            logger.warning("spaCy model 'en_core_web_sm' not found. Install with: python -m spacy download en_core_web_sm")
-            _nlp = None
-        except Exception as e:
-            logger.error(f"Failed to load spaCy model: {e}")
-            _nlp = None
+    if _nlp is not None:
+        return _nlp
+    
+    with _nlp_lock:
+        if _nlp is None:
+            try:
+                import spacy
+                # Load small English model, disable parser and lemmatizer for speed
+                _nlp = spacy.load("en_core_web_sm", disable=["parser", "lemmatizer"])
+                logger.info("spaCy model loaded successfully")
+            except OSError:
+                logger.warning("spaCy model 'en_core_web_sm' not found. Install with: python -m spacy download en_core_web_sm")
+                _nlp = None
+            except Exception as e:
+                logger.error(f"Failed to load spaCy model: {e}")
+                _nlp = None
     
     return _nlp
 
@@ -217,6 +225,80 @@ def extract_locations_from_doc(doc) -> List[str]:
     return sorted(locations)
 
 
+# Role patterns matched against raw text alongside spaCy token heuristics
+_ROLE_PATTERNS = [
+    re.compile(r"\b(Senior|Junior|Lead|Principal|Staff|Associate)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b"),
+    re.compile(r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(Engineer|Developer|Architect|Manager|Analyst|Scientist|Specialist)\b"),
+    re.compile(r"\b(Software|Backend|Frontend|Full\s+Stack|DevOps|Data|ML|AI)\s+(Engineer|Developer|Architect)\b"),
+]
+
+# Words that make a preceding title-cased token a role ("Platform Engineer")
+_ROLE_NOUNS = {"engineer", "developer", "manager", "analyst", "architect", "scientist", "specialist"}
+
+
+def _fallback_entities(text: str) -> dict:
+    return {
+        "organizations": extract_organizations(text),
+        "roles": extract_roles_titles(text),
+        "locations": extract_locations(text)
+    }
+
+
+def spacy_entities_from_doc(doc, text: str) -> dict:
+    """
+    Extract organizations, roles and locations from an already-processed doc.
+    
+    Args:
+        doc: spaCy Doc for ``text``
+        text: Original text (used for regex role patterns)
+        
+    Returns:
+        Dict with keys: organizations, roles, locations
+    """
+    orgs = set()
+    locations = set()
+    
+    for ent in doc.ents:
+        if ent.label_ == "ORG":
+            org_name = ent.text.strip()
+            if len(org_name) >= 3:  # min_length
+                orgs.add(org_name.lower())
+        elif ent.label_ in ["GPE", "LOC"]:
+            loc_name = ent.text.strip()
+            if len(loc_name) >= 2:
+                locations.add(loc_name.lower())
+    
+    # Extract roles (uses regex + spaCy token analysis)
+    roles = set()
+    
+    # Regex-based role patterns
+    for pattern in _ROLE_PATTERNS:
+        for match in pattern.findall(text):
+            if isinstance(match, tuple):
+                role = ' '.join(m for m in match if m).strip()
+            else:
+                role = match.strip()
+            
+            if role and len(role) > 3 and _is_valid_role(role):
+                roles.add(role.lower())
+    
+    # Use spaCy tokens for role detection (from pre-processed doc)
+    for token in doc:
+        if token.is_title and len(token.text) > 3:
+            if token.i + 1 < len(doc):
+                next_token = doc[token.i + 1]
+                if next_token.text.lower() in _ROLE_NOUNS:
+                    role = f"{token.text} {next_token.text}".lower()
+                    if _is_valid_role(role):
+                        roles.add(role)
+    
+    return {
+        "organizations": sorted(orgs),
+        "roles": sorted(roles),
+        "locations": sorted(locations)
+    }
+
+
 def extract_spacy_entities(text: str) -> dict:
     """
     Extract all spaCy-based entities.
@@ -232,73 +314,40 @@ def extract_spacy_entities(text: str) -> dict:
     nlp = _get_spacy_model()
     if nlp is None:
         # Fallback to individual functions if model not available
-        return {
-            "organizations": extract_organizations(text),
-            "roles": extract_roles_titles(text),
-            "locations": extract_locations(text)
-        }
+        return _fallback_entities(text)
     
     try:
         # Single pass: process text once
-        doc = nlp(text)
-        
-        # Extract all entities in one pass
-        orgs = set()
-        locations = set()
-        
-        for ent in doc.ents:
-            if ent.label_ == "ORG":
-                org_name = ent.text.strip()
-                if len(org_name) >= 3:  # min_length
-                    orgs.add(org_name.lower())
-            elif ent.label_ in ["GPE", "LOC"]:
-                loc_name = ent.text.strip()
-                if len(loc_name) >= 2:
-                    locations.add(loc_name.lower())
-        
-        # Extract roles (uses regex + spaCy token analysis)
-        roles = set()
-        import re
-        
-        # Regex-based role patterns
-        role_patterns = [
-            r"\b(Senior|Junior|Lead|Principal|Staff|Associate)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b",
-            r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(Engineer|Developer|Architect|Manager|Analyst|Scientist|Specialist)\b",
-            r"\b(Software|Backend|Frontend|Full\s+Stack|DevOps|Data|ML|AI)\s+(Engineer|Developer|Architect)\b"
-        ]
-        
-        for pattern in role_patterns:
-            matches = re.findall(pattern, text)
-            for match in matches:
-                if isinstance(match, tuple):
-                    role = ' '.join(m for m in match if m).strip()
-                else:
-                    role = match.strip()
-                
-                if role and len(role) > 3 and _is_valid_role(role):
-                    roles.add(role.lower())
-        
-        # Use spaCy tokens for role detection (from pre-processed doc)
-        for token in doc:
-            if token.is_title and len(token.text) > 3:
-                if token.i + 1 < len(doc):
-                    next_token = doc[token.i + 1]
-                    if next_token.text.lower() in ["engineer", "developer", "manager", "analyst", 
-                                                   "architect", "scientist", "specialist"]:
-                        role = f"{token.text} {next_token.text}".lower()
-                        if _is_valid_role(role):
-                            roles.add(role)
-        
-        return {
-            "organizations": sorted(orgs),
-            "roles": sorted(roles),
-            "locations": sorted(locations)
-        }
+        return spacy_entities_from_doc(nlp(text), text)
     except Exception as e:
         logger.warning(f"spaCy single-pass extraction failed: {e}, falling back to individual functions")
         # Fallback to original method
-        return {
-            "organizations": extract_organizations(text),
-            "roles": extract_roles_titles(text),
-            "locations": extract_locations(text)
-        }
+        return _fallback_entities(text)
+
+
+def pipe_spacy_entities(texts: List[str], batch_size: int = 64) -> List[dict]:
+    """
+    Extract spaCy-based entities for many texts with one ``nlp.pipe`` pass.
+    
+    Batching lets spaCy minibatch the tokenizer and NER model across
+    documents instead of paying per-call overhead for each resume.
+    
+    Args:
+        texts: Input texts
+        batch_size: Documents per spaCy minibatch
+        
+    Returns:
+        One entities dict per text, in order
+    """
+    nlp = _get_spacy_model()
+    if nlp is None:
+        return [_fallback_entities(text) for text in texts]
+    
+    try:
+        return [
+            spacy_entities_from_doc(doc, text)
+            for text, doc in zip(texts, nlp.pipe(texts, batch_size=batch_size))
+        ]
+    except Exception as e:
+        logger.warning(f"spaCy batch extraction failed: {e}, extracting documents individually")
+        return [extract_spacy_entities(text) for text in texts]
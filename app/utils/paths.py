@@ -1,5 +1,31 @@
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 import app.core.config as config
+from app.core.errors import CollectionNotFoundError
+
+# Bounded caches for resolved roots and confirmed-existing collections
+PATH_CACHE_MAXSIZE = 4096
+# Seconds a positive existence check is trusted (deleted collections 404 within this)
+PATH_CACHE_TTL_SECONDS = 30.0
+
+_resolved_roots: "OrderedDict[tuple, Path]" = OrderedDict()
+_existing_roots: "OrderedDict[Path, float]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _cache_put(cache: OrderedDict, key, value) -> None:
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > PATH_CACHE_MAXSIZE:
+        cache.popitem(last=False)
+
+
+def invalidate_collection_cache(collection_root: Path) -> None:
+    """Forget a cached existence check (call after deleting a collection)."""
+    with _cache_lock:
+        _existing_roots.pop(collection_root, None)
 
 def get_collection_root(company_id: str, collection_id: str) -> Path:
     """
@@ -15,25 +41,48 @@ def get_collection_root(company_id: str, collection_id: str) -> Path:
     Raises:
         ValueError: If path traversal detected
     """
+    # Keyed on the root too, so tests that swap COLLECTIONS_ROOT don't see stale entries
+    key = (config.COLLECTIONS_ROOT, company_id, collection_id)
+    with _cache_lock:
+        cached = _resolved_roots.get(key)
+    if cached is not None:
+        return cached
+    
     collection_root = config.COLLECTIONS_ROOT / company_id / collection_id
     
     # Validate containment (prevent path traversal)
     try:
         resolved = collection_root.resolve()
         resolved.relative_to(config.COLLECTIONS_ROOT.resolve())
-        return resolved
     except ValueError:
         raise ValueError("Collection path invalid")
+    
+    with _cache_lock:
+        _cache_put(_resolved_roots, key, resolved)
+    return resolved
 
 def assert_collection_exists(collection_root: Path) -> None:
     """
     Assert that collection exists.
     
+    Positive results are cached for PATH_CACHE_TTL_SECONDS; misses always
+    hit the filesystem so newly created collections are visible at once.
+    
     Args:
         collection_root: Collection root path
         
     Raises:
-        ValueError: If collection not found
+        CollectionNotFoundError: If collection not found
     """
+    now = time.monotonic()
+    with _cache_lock:
+        checked_at = _existing_roots.get(collection_root)
+    if checked_at is not None and now - checked_at < PATH_CACHE_TTL_SECONDS:
+        return
+    
     if not collection_root.exists():
-        raise ValueError("Collection not found")
\ No newline at end of file
+        invalidate_collection_cache(collection_root)
+        raise CollectionNotFoundError("Collection not found")
+    
+    with _cache_lock:
+        _cache_put(_existing_roots, collection_root, now)
\ No newline at end of file
@@ -1,3 +1,5 @@
+import numpy as np
+
 def combine_scores(tfidf_score: float, skill_score: float, w_tfidf: float = 0.7, w_skill: float = 0.3) -> float:
     """
     Combine scoring components into final score.
@@ -14,6 +16,22 @@ def combine_scores(tfidf_score: float, skill_score: float, w_tfidf: float = 0.7,
     final_score = (w_tfidf * tfidf_score) + (w_skill * skill_score)
     return max(0.0, min(1.0, final_score))
 
+def combine_score_arrays(tfidf_scores: np.ndarray, skill_scores: np.ndarray,
+                         w_tfidf: float = 0.7, w_skill: float = 0.3) -> np.ndarray:
+    """
+    Vectorized combine_scores over aligned score arrays.
+    
+    Args:
+        tfidf_scores: TF-IDF cosine similarity scores
+        skill_scores: Skill overlap scores
+        w_tfidf: Weight for TF-IDF score
+        w_skill: Weight for skill score
+        
+    Returns:
+        Weighted combined scores (clamped to [0, 1])
+    """
+    return np.clip((w_tfidf * tfidf_scores) + (w_skill * skill_scores), 0.0, 1.0)
+
 def build_explainability(jd_skills: list[str], resume_skills: list[str]) -> dict:
     """
     Build explainability payload.
@@ -43,20 +43,30 @@ SECTION_PATTERNS = {
     ]
 }
 
+# All heading patterns as one anchored alternation, sections in SECTION_PATTERNS
+# order, so a single match per line finds the first section that applies
+_SECTION_HEADING_RE = re.compile(
+    "|".join(
+        f"(?P<{section}>{'|'.join(patterns)})"
+        for section, patterns in SECTION_PATTERNS.items()
+    ),
+    re.IGNORECASE,
+)
+
 
 def _normalize_text(text: str) -> str:
     """Normalize text for section matching."""
     return text.strip()
 
 
-def _find_section_boundaries(text: str) -> Dict[str, List[tuple]]:
+def _find_section_boundaries(lines: List[str]) -> Dict[str, List[tuple]]:
     """
     Find all section headings and their line positions.
     
     Returns:
         Dict mapping section name to list of (line_index, heading_text) tuples
     """
-    lines = text.split('\n')
+    heading_match = _SECTION_HEADING_RE.match
     boundaries = {section: [] for section in SECTION_PATTERNS.keys()}
     boundaries["other"] = []
     
@@ -65,16 +75,11 @@ def _find_section_boundaries(text: str) -> Dict[str, List[tuple]]:
         if not line_stripped:
             continue
         
-        # Check each section pattern
-        matched = False
-        for section, patterns in SECTION_PATTERNS.items():
-            for pattern in patterns:
-                if re.match(pattern, line_stripped, re.IGNORECASE):
-                    boundaries[section].append((idx, line_stripped))
-                    matched = True
-                    break
-            if matched:
-                break
+        # Check all section patterns in one match
+        match = heading_match(line_stripped)
+        matched = match is not None
+        if matched:
+            boundaries[match.lastgroup].append((idx, line_stripped))
         
         # If no section matched and line looks like a heading (short, uppercase, or title case)
         if not matched and len(line_stripped) < 50:
@@ -85,9 +90,8 @@ def _find_section_boundaries(text: str) -> Dict[str, List[tuple]]:
     return boundaries
 
 
-def _extract_section_content(text: str, start_line: int, end_line: int) -> str:
+def _extract_section_content(lines: List[str], start_line: int, end_line: int) -> str:
     """Extract content between two line indices."""
-    lines = text.split('\n')
     if start_line >= len(lines):
         return ""
     
@@ -127,8 +131,8 @@ def parse_sections(text: str, return_boundaries: bool = False) -> Union[ResumeSe
         )
     
     # Find all section boundaries
-    boundaries = _find_section_boundaries(text)
     lines = text.split('\n')
+    boundaries = _find_section_boundaries(lines)
     
     # Build section content
     sections_content = {
@@ -170,7 +174,7 @@ def parse_sections(text: str, return_boundaries: bool = False) -> Union[ResumeSe
             
             # Extract content (skip the heading line itself)
             content_start = line_idx + 1
-            content = _extract_section_content(text, content_start, next_start)
+            content = _extract_section_content(lines, content_start, next_start)
             
             if content:
                 sections_content[section_name].append(content)
@@ -9,6 +9,7 @@ from typing import List
 import numpy as np
 from sklearn.metrics.pairwise import cosine_similarity
 
+import app.core.config as config
 from app.utils.model_cache import ModelCache
 
 logger = logging.getLogger(__name__)
@@ -48,6 +49,7 @@ class SkillNormalizer:
         model = ModelCache.get_instance().get_minilm()
         self._canonical_embeddings = model.encode(
             self._canonical_skills,
+            batch_size=config.EMBEDDING_BATCH_SIZE,
             convert_to_numpy=True,
             show_progress_bar=False,
         )
@@ -66,19 +68,30 @@ class SkillNormalizer:
         if not raw_skills:
             return []
 
+        skills = [skill for skill in (raw.lower().strip() for raw in raw_skills) if skill]
+        if not skills:
+            return []
+
+        # One batched encode for every distinct input instead of one call per skill
         model = ModelCache.get_instance().get_minilm()
+        unique_skills = list(dict.fromkeys(skills))
+        embeddings = model.encode(
+            unique_skills,
+            batch_size=config.EMBEDDING_BATCH_SIZE,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        embedding_by_skill = {skill: embeddings[i:i + 1] for i, skill in enumerate(unique_skills)}
+
         result: List[str] = []
         seen: set[str] = set()
         taxonomy_updated = False
 
-        for raw in raw_skills:
-            skill = raw.lower().strip()
-            if not skill:
-                continue
-
-            canonical = self._map_skill(skill, model)
+        for skill in skills:
+            embedding = embedding_by_skill[skill]
+            canonical = self._map_skill(skill, embedding)
             if canonical not in self._canonical_skills:
-                self._add_canonical(canonical, model)
+                self._add_canonical(canonical, embedding)
                 taxonomy_updated = True
 
             if canonical not in seen:
@@ -90,20 +103,18 @@ class SkillNormalizer:
 
         return result
 
-    def _add_canonical(self, skill: str, model) -> None:
-        embedding = model.encode([skill], convert_to_numpy=True, show_progress_bar=False)
+    def _add_canonical(self, skill: str, embedding: np.ndarray) -> None:
         self._canonical_skills.append(skill)
         if self._canonical_embeddings is None or self._canonical_embeddings.size == 0:
             self._canonical_embeddings = embedding
         else:
             self._canonical_embeddings = np.vstack([self._canonical_embeddings, embedding])
 
-    def _map_skill(self, skill: str, model) -> str:
+    def _map_skill(self, skill: str, embedding: np.ndarray) -> str:
         if not self._canonical_skills:
             return skill
 
         self._ensure_embeddings()
-        embedding = model.encode([skill], convert_to_numpy=True, show_progress_bar=False)
         similarities = cosine_similarity(embedding, self._canonical_embeddings)[0]
         best_idx = int(np.argmax(similarities))
         if float(similarities[best_idx]) > SIMILARITY_THRESHOLD:
@@ -1,4 +1,13 @@
 import re
+from functools import lru_cache
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
+# Job descriptions whose extracted skills are kept for re-ranking the same JD
+JD_SKILLS_CACHE_SIZE = 128
 
 # Alias map for punctuated skills
 ALIASES = {
@@ -51,10 +60,49 @@ def normalize_text(text: str) -> str:
     text = re.sub(r'\s+', ' ', text)
     return text.strip()
 
+@lru_cache(maxsize=8)
+def _skill_matcher(skills_vocab: tuple[str, ...]):
+    """
+    Build (once per vocabulary) a matcher over normalized skill forms.
+    
+    With pyahocorasick installed this is a single automaton that scans a text in
+    O(len(text) + matches); otherwise one precompiled pattern per skill.
+    
+    Args:
+        skills_vocab: Skill keywords
+        
+    Returns:
+        ahocorasick.Automaton mapping each skill to (skill, is_multi_word),
+        or a list of (skill, compiled pattern) pairs
+    """
+    normalized_skills = {normalize_text(skill) for skill in skills_vocab}
+    normalized_skills.discard('')
+    
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for skill in normalized_skills:
+            automaton.add_word(skill, (skill, ' ' in skill))
+        automaton.make_automaton()
+        return automaton
+    
+    patterns = []
+    for skill in sorted(normalized_skills):
+        if ' ' in skill:
+            # For multi-word skills, use substring matching
+            patterns.append((skill, re.compile(re.escape(skill))))
+        else:
+            # For single-token skills, use word boundary matching
+            patterns.append((skill, re.compile(r'\b' + re.escape(skill) + r'\b')))
+    return patterns
+
 def extract_skills(text: str, skills_vocab: list[str]) -> list[str]:
     """
     Extract skills from text using vocabulary matching.
     
+    Multi-word skills match as substrings, single-token skills only on word
+    boundaries. The matcher for a vocabulary is built once and reused for every
+    text (the JD and all resumes).
+    
     Args:
         text: Input text
         skills_vocab: List of skill keywords
@@ -63,23 +111,50 @@ def extract_skills(text: str, skills_vocab: list[str]) -> list[str]:
         Sorted list of unique matched skills
     """
     normalized = normalize_text(text)
-    matched_skills = set()
+    matcher = _skill_matcher(tuple(skills_vocab))
     
-    for skill in skills_vocab:
-        skill_normalized = normalize_text(skill)
-        
-        # For multi-word skills, use substring matching
-        if ' ' in skill_normalized:
-            if skill_normalized in normalized:
-                matched_skills.add(skill_normalized)
-        else:
-            # For single-token skills, use word boundary matching
-            pattern = r'\b' + re.escape(skill_normalized) + r'\b'
-            if re.search(pattern, normalized):
-                matched_skills.add(skill_normalized)
+    if ahocorasick is None:
+        return sorted(skill for skill, pattern in matcher if pattern.search(normalized))
+    
+    if len(matcher) == 0:
+        return []
+    
+    # Normalized text is word characters separated by single spaces, so a
+    # word boundary is a space or either end of the text
+    matched_skills = set()
+    last = len(normalized) - 1
+    for end, (skill, multi_word) in matcher.iter(normalized):
+        if skill in matched_skills:
+            continue
+        start = end - len(skill) + 1
+        if multi_word or (
+            (start == 0 or normalized[start - 1] == ' ')
+            and (end == last or normalized[end + 1] == ' ')
+        ):
+            matched_skills.add(skill)
     
     return sorted(matched_skills)
 
+@lru_cache(maxsize=JD_SKILLS_CACHE_SIZE)
+def _extract_jd_skills_cached(jd_text: str, skills_vocab: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(extract_skills(jd_text, list(skills_vocab)))
+
+def extract_jd_skills(jd_text: str, skills_vocab: list[str]) -> list[str]:
+    """
+    Extract skills from a job description, memoized per (JD text, vocabulary).
+    
+    The same JD is scored against every resume and re-ranked repeatedly
+    (top-k tuning, pagination), so its skills are only extracted once.
+    
+    Args:
+        jd_text: Job description text
+        skills_vocab: List of skill keywords
+        
+    Returns:
+        Sorted list of unique matched skills
+    """
+    return list(_extract_jd_skills_cached(jd_text, tuple(skills_vocab)))
+
 def skill_overlap_score(jd_skills: set[str], resume_skills: set[str]) -> float:
     """
     Compute skill overlap score.
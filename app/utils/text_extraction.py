@@ -1,6 +1,9 @@
+from io import BytesIO
 from pathlib import Path
 import logging
-from typing import Optional
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import BinaryIO, Optional, Union
 from docx import Document
 
 from app.services.ocr_service import extract_pdf_resume
@@ -48,6 +51,36 @@ def extract_text(
         raise Exception(f"Failed to extract text from {file_path.name}") from exc
 
 
+# Formats extract_text_from_bytes can handle; PDFs go through OCR, which needs a file
+BYTES_EXTRACTABLE_SUFFIXES = {".txt", ".docx"}
+
+
+def extract_text_from_bytes(data: bytes, filename: str) -> str:
+    """
+    Extract plain text from an in-memory TXT or DOCX file.
+
+    Args:
+        data: Raw file bytes.
+        filename: Original filename (used for the extension).
+
+    Returns:
+        Extracted text (empty string if none found).
+
+    Raises:
+        ValueError: If the extension is not in BYTES_EXTRACTABLE_SUFFIXES.
+        Exception: If the content is unreadable.
+    """
+    suffix = Path(filename).suffix.lower()
+    if suffix not in BYTES_EXTRACTABLE_SUFFIXES:
+        raise ValueError(f"Unsupported file type for in-memory extraction: {suffix}")
+    try:
+        if suffix == ".txt":
+            return data.decode("utf-8", errors="ignore").strip()
+        return _docx_text_extract(BytesIO(data))
+    except Exception as exc:
+        raise Exception(f"Failed to extract text from {filename}") from exc
+
+
 def _extract_pdf_direct_only(
     file_path: Path,
     recorder: Optional[LatencyRecorder] = None,
@@ -79,12 +112,79 @@ def _extract_docx(file_path: Path, recorder: Optional[LatencyRecorder] = None) -
         raise Exception(f"DOCX extraction error: {exc}") from exc
 
 
-def _docx_text_extract(file_path: Path) -> str:
-    doc = Document(file_path)
-    text = [paragraph.text.strip() for paragraph in doc.paragraphs if paragraph.text.strip()]
+# WordprocessingML namespace and the run children that carry text, mapped the
+# way python-docx's Paragraph.text renders them
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_BODY = f"{_W}body"
+_W_P = f"{_W}p"
+_W_R = f"{_W}r"
+_W_HYPERLINK = f"{_W}hyperlink"
+_W_T = f"{_W}t"
+_W_BR = f"{_W}br"
+_W_TYPE = f"{_W}type"
+_RUN_CHAR_TAGS = {
+    f"{_W}tab": "\t",
+    f"{_W}ptab": "\t",
+    f"{_W}cr": "\n",
+    f"{_W}noBreakHyphen": "-",
+}
+
+
+def _docx_text_extract(source: Union[Path, BinaryIO]) -> str:
+    try:
+        return _docx_text_from_xml(source)
+    except (KeyError, ET.ParseError, zipfile.BadZipFile, ValueError):
+        # Unusual packages (e.g. Strict OOXML namespaces) go through python-docx
+        doc = Document(source)
+        text = [paragraph.text.strip() for paragraph in doc.paragraphs if paragraph.text.strip()]
+        return " ".join(text).strip()
+
+
+def _docx_text_from_xml(source: Union[Path, BinaryIO]) -> str:
+    """
+    Read body paragraph text straight from ``word/document.xml``.
+
+    Produces the same text as joining python-docx ``doc.paragraphs`` (top-level
+    body paragraphs, including hyperlink runs) without building its object
+    model or loading styles and parts that are never used. ``source`` is a
+    path or a seekable binary file object, as ``zipfile.ZipFile`` accepts.
+    """
+    with zipfile.ZipFile(source) as package:
+        root = ET.fromstring(package.read("word/document.xml"))
+    body = root.find(_W_BODY)
+    if body is None:
+        raise ValueError("DOCX has no WordprocessingML body")
+
+    text = []
+    for paragraph in body.iterfind(_W_P):
+        parts = []
+        for child in paragraph:
+            if child.tag == _W_R:
+                _append_run_text(child, parts)
+            elif child.tag == _W_HYPERLINK:
+                for run in child.iterfind(_W_R):
+                    _append_run_text(run, parts)
+        paragraph_text = "".join(parts).strip()
+        if paragraph_text:
+            text.append(paragraph_text)
     return " ".join(text).strip()
 
 
+def _append_run_text(run: ET.Element, parts: list[str]) -> None:
+    for element in run:
+        tag = element.tag
+        if tag == _W_T:
+            if element.text:
+                parts.append(element.text)
+        elif tag == _W_BR:
+            if element.get(_W_TYPE, "textWrapping") == "textWrapping":
+                parts.append("\n")
+        else:
+            char = _RUN_CHAR_TAGS.get(tag)
+            if char:
+                parts.append(char)
+
+
 def _extract_txt(file_path: Path, recorder: Optional[LatencyRecorder] = None) -> str:
     if recorder:
         with recorder.stage(STAGE_TEXT_EXTRACTION):
@@ -7,8 +7,10 @@ This module provides improved TF-IDF vectorization that:
 - Boosts skill-related tokens
 """
 from typing import Dict, List, Optional
+import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.preprocessing import normalize
 import scipy.sparse
 
 from app.utils.section_parser import ResumeSections, sections_to_dict
@@ -65,10 +67,10 @@ def _compute_skill_boost_factor(resume_text: str, jd_text: str, skills_vocab: Li
     Returns:
         Boost factor (1.0 = no boost, >1.0 = boosted)
     """
-    from app.utils.skills import extract_skills
+    from app.utils.skills import extract_jd_skills, extract_skills
     
     resume_skills = set(extract_skills(resume_text, skills_vocab))
-    jd_skills = set(extract_skills(jd_text, skills_vocab))
+    jd_skills = set(extract_jd_skills(jd_text, skills_vocab))
     
     if not jd_skills:
         return 1.0
@@ -274,6 +276,70 @@ def compute_section_aware_similarity(resume_vectors: Dict[str, scipy.sparse.csr_
     return base_similarity
 
 
+def compute_section_aware_similarities(resume_sections_list: List[ResumeSections],
+                                       vectorizers: Dict[str, TfidfVectorizer],
+                                       jd_vectors: Dict[str, scipy.sparse.csr_matrix],
+                                       resume_texts: Optional[List[str]] = None,
+                                       jd_text: str = "",
+                                       skills_vocab: Optional[List[str]] = None) -> np.ndarray:
+    """
+    Batched compute_section_aware_similarity for a whole collection.
+    
+    Each weighted section of all resumes is transformed in one vectorizer call
+    and scored against the JD with one sparse matrix-vector product over
+    L2-normalized rows, instead of one transform and cosine per resume.
+    
+    Args:
+        resume_sections_list: List of ResumeSections objects
+        vectorizers: Dict of fitted vectorizers per section
+        jd_vectors: Dict of section vectors for JD
+        resume_texts: Resume texts, aligned with resume_sections_list (for skill boost)
+        jd_text: Job description text (for skill boost calculation)
+        skills_vocab: Optional list of skills for boosting
+        
+    Returns:
+        Array of weighted similarity scores [0, 1], one per resume
+    """
+    if skills_vocab is None:
+        skills_vocab = SKILLS
+    
+    num_resumes = len(resume_sections_list)
+    total_score = np.zeros(num_resumes)
+    total_weight = 0.0
+    section_dicts = [sections_to_dict(sections) for sections in resume_sections_list]
+    
+    for section_name in ["experience", "skills", "projects"]:
+        if section_name not in SECTION_WEIGHTS:
+            continue
+        
+        weight = SECTION_WEIGHTS[section_name]
+        if weight == 0.0:
+            continue
+        
+        if section_name in vectorizers and section_name in jd_vectors:
+            section_matrix = vectorizers[section_name].transform(
+                [section_dict.get(section_name, "") for section_dict in section_dicts]
+            )
+            # Cosine similarity of unit rows is a plain dot product (zero rows stay zero)
+            normalize(section_matrix, norm='l2', copy=False)
+            jd_vec = normalize(jd_vectors[section_name], norm='l2')
+            similarity = (section_matrix @ jd_vec.T).toarray().ravel()
+            
+            total_score += weight * similarity
+            total_weight += weight
+    
+    base_similarity = total_score / total_weight if total_weight > 0 else total_score
+    
+    # Apply skill boost POST-cosine (safer, reversible)
+    if resume_texts is not None and jd_text:
+        for i, resume_text in enumerate(resume_texts):
+            if resume_text:
+                skill_boost = _compute_skill_boost_factor(resume_text, jd_text, skills_vocab)
+                base_similarity[i] = min(base_similarity[i] * skill_boost, 1.0)
+    
+    return base_similarity
+
+
 def build_combined_resume_text(sections: ResumeSections) -> str:
     """
     Build combined resume text from weighted sections.
@@ -1,5 +1,5 @@
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.preprocessing import normalize
 import scipy.sparse
 
 def build_tfidf_vectorizer() -> TfidfVectorizer:
@@ -70,6 +70,9 @@ def cosine_similarities(resume_matrix: scipy.sparse.csr_matrix, jd_vector: scipy
     """
     Returns cosine similarity per resume.
     
+    Rows are L2-normalized in place (a no-op up to rounding for TF-IDF output,
+    which is already unit-normed), so the cosine is one sparse mat-vec product.
+    
     Args:
         resume_matrix: Sparse matrix of resume vectors
         jd_vector: Sparse vector of JD
@@ -77,5 +80,7 @@ def cosine_similarities(resume_matrix: scipy.sparse.csr_matrix, jd_vector: scipy
     Returns:
         List of cosine similarities (same order as matrix rows)
     """
-    similarities = cosine_similarity(jd_vector, resume_matrix)
-    return similarities[0].tolist()
\ No newline at end of file
+    normalize(resume_matrix, norm='l2', axis=1, copy=False)
+    jd_unit = normalize(jd_vector, norm='l2')
+    similarities = resume_matrix @ jd_unit.T
+    return similarities.toarray().ravel().tolist()
\ No newline at end of file
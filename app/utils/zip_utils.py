@@ -1,7 +1,27 @@
+import os
+import shutil
 import zipfile
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path, PurePosixPath
 from app.core.logger import logger
 
+try:
+    from stream_unzip import stream_unzip, TruncatedDataError
+    STREAM_UNZIP_AVAILABLE = True
+except ImportError:
+    stream_unzip = None
+    TruncatedDataError = None
+    STREAM_UNZIP_AVAILABLE = False
+
+# Half the cores: extraction mixes decompression (GIL released by zlib) and file I/O
+EXTRACT_MAX_WORKERS = max(2, (os.cpu_count() or 2) // 2)
+
+# Read size when streaming an archive through stream_unzip
+STREAM_CHUNK_SIZE = 1 << 16
+
+# Buffer for copying member bytes to disk
+COPY_BUFFER_SIZE = 1 << 20
+
 
 def is_valid_zip(zip_path: Path) -> bool:
     """Verify ZIP integrity"""
@@ -38,4 +58,185 @@ def extract_zip_safe(zip_path: Path, target_dir: Path):
                     target.write(source.read())
             except Exception as e:
                 logger.warning(f"Failed to extract {member}: {e}")
-                continue
\ No newline at end of file
+                continue
+
+
+def _safe_member_path(target_dir: Path, member: str) -> Path | None:
+    """
+    Map a member name under target_dir without touching the filesystem.
+
+    Absolute, drive and parent (..) components are dropped the way
+    ZipFile.extract does, then the result is checked with commonpath
+    to block Zip Slip.
+
+    Returns:
+        Target path, or None if the member is unsafe or names no file
+    """
+    parts = [
+        p for p in PurePosixPath(member.replace("\\", "/")).parts
+        if p not in ("", ".", "..", "/") and not p.endswith(":")
+    ]
+    if not parts:
+        return None
+    root = os.path.normpath(target_dir)
+    member_path = os.path.normpath(os.path.join(root, *parts))
+    if os.path.commonpath([root, member_path]) != root:
+        return None
+    return Path(member_path)
+
+
+def _extract_batch(
+    zip_source: Path | zipfile.ZipFile,
+    items: list[tuple[str, Path]],
+) -> list[str]:
+    """
+    Write a slice of (member, target path) pairs.
+
+    For a path, each worker opens its own ZipFile handle. An already-open
+    ZipFile is shared: CPython serializes reads of the underlying file
+    through the instance lock, while decompression and writes overlap.
+
+    Parent directories already exist, so each member costs one open and
+    one copy. The success path has no per-member exception handling: if
+    an entry raises, it is recorded as failed (its partial file removed)
+    and the loop resumes after it.
+
+    Returns:
+        Members that failed to extract
+    """
+    failed = []
+    if isinstance(zip_source, zipfile.ZipFile):
+        zf = zip_source
+    else:
+        zf = zipfile.ZipFile(zip_source, 'r')
+    try:
+        start = 0
+        while start < len(items):
+            index = start
+            try:
+                for index in range(start, len(items)):
+                    member, target = items[index]
+                    with zf.open(member) as source, open(target, 'wb') as dest:
+                        shutil.copyfileobj(source, dest, COPY_BUFFER_SIZE)
+                break
+            except Exception as e:
+                member, target = items[index]
+                logger.warning(f"Failed to extract {member}: {e}")
+                target.unlink(missing_ok=True)
+                failed.append(member)
+                start = index + 1
+    finally:
+        if zf is not zip_source:
+            zf.close()
+    return failed
+
+
+def extract_members_parallel(
+    zip_source: Path | zipfile.ZipFile,
+    members: list[str],
+    target_dir: Path,
+    max_workers: int | None = None
+) -> list[str]:
+    """
+    Extract the given ZIP members concurrently with a thread pool.
+
+    Target paths are validated against Zip Slip and every distinct parent
+    directory is created once, up front, instead of per member.
+
+    Args:
+        zip_source: Path to ZIP archive on disk, or an open ZipFile
+        members: Member names to extract (already filtered)
+        target_dir: Extraction root
+        max_workers: Thread count (defaults to half the CPU cores)
+
+    Returns:
+        Members that failed to extract (including unsafe paths)
+    """
+    if not members:
+        return []
+
+    failed = []
+    items = []
+    for member in members:
+        target = _safe_member_path(target_dir, member)
+        if target is None:
+            logger.warning(f"Skipping unsafe path: {member}")
+            failed.append(member)
+            continue
+        items.append((member, target))
+    if not items:
+        return failed
+
+    # Create each distinct parent once, shallowest first, so workers never mkdir
+    target_dir.mkdir(parents=True, exist_ok=True)
+    for parent in sorted({target.parent for _, target in items}, key=lambda p: len(p.parts)):
+        parent.mkdir(parents=True, exist_ok=True)
+
+    workers = min(max_workers or EXTRACT_MAX_WORKERS, len(items))
+    batches = [items[i::workers] for i in range(workers)]
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="unzip") as pool:
+        futures = [pool.submit(_extract_batch, zip_source, batch) for batch in batches]
+        for future in as_completed(futures):
+            failed.extend(future.result())
+    return failed
+
+
+def stream_extract(zip_stream, target_dir: Path, skip=None) -> tuple[int, list[str]]:
+    """
+    Extract a ZIP in a single sequential pass using local file headers.
+
+    Unlike zipfile, this never seeks to the central directory, so it can
+    decode archives written by streaming zippers or with a damaged
+    central directory. Members are written as their bytes are decoded.
+
+    Args:
+        zip_stream: Binary file object positioned at the start of the archive
+        target_dir: Extraction root
+        skip: Optional predicate; members for which it returns True are drained and skipped
+
+    Returns:
+        Tuple of (extracted count, skipped member names)
+
+    Raises:
+        RuntimeError: If stream-unzip is not installed
+        ValueError: If the archive ends before its central directory (truncated upload)
+    """
+    if stream_unzip is None:
+        raise RuntimeError("stream-unzip is not installed")
+
+    def zipped_chunks():
+        while chunk := zip_stream.read(STREAM_CHUNK_SIZE):
+            yield chunk
+
+    target_dir.mkdir(parents=True, exist_ok=True)
+    extracted = 0
+    skipped = []
+    writing = None
+    try:
+        for raw_name, _size, unzipped_chunks in stream_unzip(zipped_chunks()):
+            member = raw_name.decode("utf-8", errors="replace")
+            member_path = None
+            if not member.endswith("/") and not (skip and skip(member)):
+                member_path = _safe_member_path(target_dir, member)
+            if member_path is None:
+                # Each member must be fully consumed before the next is yielded
+                for _ in unzipped_chunks:
+                    pass
+                if not member.endswith("/"):
+                    skipped.append(member)
+                continue
+            member_path.parent.mkdir(parents=True, exist_ok=True)
+            writing = member_path
+            with open(member_path, "wb") as target:
+                for chunk in unzipped_chunks:
+                    target.write(chunk)
+            writing = None
+            extracted += 1
+    except TruncatedDataError:
+        # The upload was cut short: members after this point (and possibly the
+        # one being written) are missing, so the archive is rejected as a whole
+        if writing is not None:
+            writing.unlink(missing_ok=True)
+        raise ValueError(f"ZIP archive is truncated (ends after {extracted} complete members)")
+    return extracted, skipped
@@ -1,39 +1,48 @@
 """
-Single-resume processing worker.
+Single-resume processing workers.
 
-Invoked by the Phase-2 multiprocessing pool (or sequentially for small batches).
+Invoked by Phase 2: ``extract_resume_file`` runs on a thread pool for every
+file, the caller dedupes by content hash, then ``persist_resume_batch`` runs
+NER and writes for the unique resumes in one batch.
 Uses smart OCR gating for PDFs and never raises unhandled exceptions.
 """
 from __future__ import annotations
 
-import json
 import logging
+import time
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
+
+import app.core.config as config
 from app.models.enums import ExtractionState, ResumeStatus
 from app.services.ocr_service import extract_pdf_resume
 from app.services.resume_intelligence import extract_resume_intelligence
-from app.utils.hashing import compute_sha256
+from app.utils.hashing import compute_sha256_digest
 from app.utils.latency_tracker import LatencyRecorder, STAGE_DB_WRITES
+from app.utils.ner.spacy_ner import pipe_spacy_entities
 from app.utils.text_extraction import extract_text
 from app.utils.validation import validate_text
 
 logger = logging.getLogger(__name__)
 
 
-def process_resume_file(args: Tuple[Path, Path, Dict]) -> Dict[str, Any]:
+def extract_resume_file(resume_file: Path) -> Dict[str, Any]:
     """
-    Process one resume file: extract text, validate, dedupe, persist artifacts.
+    Extract, validate and hash one resume (first, parallel stage of Phase 2).
+
+    Duplicate detection is left to the parent, which walks results in file
+    order so the same input always yields the same duplicate report.
 
     Args:
-        args: ``(resume_file, processed_dir, shared_hash_registry)``
+        resume_file: Path to the resume
 
     Returns:
-        Result dict including filename, status, reason, content_hash, extraction
-        metadata, and latency samples.
+        Result dict including filename, status, reason, content_hash (raw
+        SHA-256 digest bytes), extraction metadata and latency samples; OK
+        results also carry ``text``.
     """
-    resume_file, processed_dir, shared_hash_registry = args
     filename = resume_file.name
     result: Dict[str, Any] = {
         "filename": filename,
@@ -43,6 +52,7 @@ def process_resume_file(args: Tuple[Path, Path, Dict]) -> Dict[str, Any]:
         "duplicate_of": None,
         "latency_samples": None,
         "extraction": None,
+        "text": None,
     }
     recorder = LatencyRecorder()
 
@@ -63,44 +73,9 @@ def process_resume_file(args: Tuple[Path, Path, Dict]) -> Dict[str, Any]:
                 result["status"] = ResumeStatus.EMPTY
                 result["reason"] = "No extractable text (file may be image-based, corrupted, or empty)"
         elif status == ResumeStatus.OK:
-            content_hash = compute_sha256(text)
-            result["content_hash"] = content_hash
-
-            if content_hash in shared_hash_registry:
-                result["status"] = ResumeStatus.DUPLICATE
-                result["reason"] = f"Duplicate of {shared_hash_registry[content_hash]}"
-                result["duplicate_of"] = shared_hash_registry[content_hash]
-            else:
-                shared_hash_registry[content_hash] = filename
-                result["status"] = ResumeStatus.OK
-
-                output_file = processed_dir / f"{resume_file.name}.txt"
-                with recorder.stage(STAGE_DB_WRITES):
-                    output_file.write_text(text, encoding="utf-8")
-
-                try:
-                    intelligence = extract_resume_intelligence(text, filename, recorder=recorder)
-                    base_name = output_file.stem
-                    sections_file = processed_dir / f"{base_name}_sections.json"
-                    entities_file = processed_dir / f"{base_name}_entities.json"
-                    experience_file = processed_dir / f"{base_name}_experience.json"
-                    with recorder.stage(STAGE_DB_WRITES):
-                        sections_file.write_text(
-                            json.dumps(intelligence["sections"], indent=2),
-                            encoding="utf-8",
-                        )
-                        entities_file.write_text(
-                            json.dumps(intelligence["entities"], indent=2),
-                            encoding="utf-8",
-                        )
-                        experience_file.write_text(
-                            json.dumps(intelligence["experience"], indent=2),
-                            encoding="utf-8",
-                        )
-                except Exception as exc:
-                    logger.warning("Failed to extract intelligence for %s: %s", filename, exc)
-                    result["status"] = ResumeStatus.FAILED
-                    result["reason"] = f"Intelligence extraction failed: {exc}"
+            result["content_hash"] = compute_sha256_digest(text)
+            result["status"] = ResumeStatus.OK
+            result["text"] = text
         else:
             result["status"] = status
             result["reason"] = "Validation failed"
@@ -127,6 +102,92 @@ def process_resume_file(args: Tuple[Path, Path, Dict]) -> Dict[str, Any]:
     return result
 
 
+def persist_resume_batch(args: Tuple[List[Tuple[str, str]], Path]) -> List[Dict[str, Any]]:
+    """
+    Write unique resumes' text and intelligence artifacts (second Phase 2 stage).
+
+    spaCy NER for the whole batch runs as one ``nlp.pipe`` pass (minibatched by
+    ``SPACY_BATCH_SIZE``) before the per-resume parsing and writes.
+
+    Args:
+        args: ``([(filename, text), ...], processed_dir)``
+
+    Returns:
+        One dict per resume, in order, with ``status`` (OK, or FAILED if
+        intelligence extraction failed), ``reason`` and latency samples.
+    """
+    items, processed_dir = args
+    start = time.perf_counter()
+    spacy_batch = pipe_spacy_entities(
+        [text for _, text in items], batch_size=config.SPACY_BATCH_SIZE
+    )
+    # Each resume is charged an equal share of the batched NER time
+    spacy_ms = (time.perf_counter() - start) * 1000 / max(1, len(items))
+    return [
+        _persist_resume(filename, text, processed_dir, spacy_entities, spacy_ms)
+        for (filename, text), spacy_entities in zip(items, spacy_batch)
+    ]
+
+
+def _persist_resume(
+    filename: str,
+    text: str,
+    processed_dir: Path,
+    spacy_entities: Dict[str, Any],
+    spacy_ms: float,
+) -> Dict[str, Any]:
+    result: Dict[str, Any] = {
+        "status": ResumeStatus.OK,
+        "reason": None,
+        "latency_samples": None,
+    }
+    recorder = LatencyRecorder()
+
+    output_file = processed_dir / f"{filename}.txt"
+    try:
+        with recorder.stage(STAGE_DB_WRITES):
+            output_file.write_bytes(text.encode("utf-8"))
+
+        try:
+            intelligence = extract_resume_intelligence(
+                text,
+                filename,
+                recorder=recorder,
+                spacy_entities=spacy_entities,
+                spacy_ms=spacy_ms,
+            )
+            base_name = output_file.stem
+            sections_file = processed_dir / f"{base_name}_sections.json"
+            entities_file = processed_dir / f"{base_name}_entities.json"
+            experience_file = processed_dir / f"{base_name}_experience.json"
+            with recorder.stage(STAGE_DB_WRITES):
+                # Compact orjson output: bytes go straight to disk with no
+                # intermediate str or pretty-print whitespace
+                sections_file.write_bytes(_dump_json(intelligence["sections"]))
+                entities_file.write_bytes(_dump_json(intelligence["entities"]))
+                experience_file.write_bytes(_dump_json(intelligence["experience"]))
+        except Exception as exc:
+            logger.warning("Failed to extract intelligence for %s: %s", filename, exc)
+            result["status"] = ResumeStatus.FAILED
+            result["reason"] = f"Intelligence extraction failed: {exc}"
+
+    except KeyboardInterrupt:
+        logger.warning("Processing interrupted for %s", filename)
+        raise
+    except Exception as exc:
+        result["status"] = ResumeStatus.FAILED
+        result["reason"] = f"Processing failed: {exc}"
+        logger.error("Failed to process %s: %s", filename, exc, exc_info=True)
+
+    result["latency_samples"] = recorder.to_samples_dict()
+    return result
+
+
+def _dump_json(data: Dict[str, Any]) -> bytes:
+    # json.dumps accepted non-str keys by stringifying them; keep that behaviour
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+
 def _extract_resume_text(
     file_path: Path,
     recorder: LatencyRecorder,
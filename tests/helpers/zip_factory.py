@@ -52,3 +52,22 @@ def make_empty_zip(tmp_path: Path) -> Path:
     
     return zip_path
 
+
+def make_truncated_zip(tmp_path: Path, files: dict[str, bytes]) -> Path:
+    """
+    Creates a ZIP whose upload was cut short: every member is complete but the
+    central directory is missing.
+    
+    Args:
+        tmp_path: Temporary directory path
+        files: Mapping of filename to content bytes
+        
+    Returns:
+        Path to truncated ZIP file
+    """
+    zip_path = make_zip_with_files(tmp_path, files)
+    with zipfile.ZipFile(zip_path, 'r') as zf:
+        central_dir_offset = zf.start_dir
+    truncated_path = tmp_path / "truncated.zip"
+    truncated_path.write_bytes(zip_path.read_bytes()[:central_dir_offset])
+    return truncated_path
@@ -1,6 +1,6 @@
 import pytest
 from pathlib import Path
-from tests.helpers.zip_factory import make_zip_with_files, make_invalid_zip, make_empty_zip
+from tests.helpers.zip_factory import make_zip_with_files, make_invalid_zip, make_empty_zip, make_truncated_zip
 from tests.helpers.sample_texts import RESUME_TEXT_MATCH, RESUME_TEXT_PARTIAL
 import app.core.config as config
 
@@ -56,6 +56,31 @@ def test_create_collection_invalid_zip_returns_400(client, tmp_path, company_id)
     # Assert
     assert response.status_code == 400
 
+def test_create_collection_truncated_zip_returns_400(client, tmp_path, company_id):
+    """Test that a truncated ZIP is rejected even when its members can be stream-decoded."""
+    pytest.importorskip("stream_unzip")
+    
+    # Arrange
+    files = {
+        "resume1.txt": RESUME_TEXT_MATCH.encode('utf-8'),
+        "resume2.txt": RESUME_TEXT_PARTIAL.encode('utf-8')
+    }
+    truncated_zip = make_truncated_zip(tmp_path, files)
+    
+    # Act
+    with open(truncated_zip, 'rb') as f:
+        response = client.post(
+            "/collections/create",
+            data={"company_id": company_id},
+            files={"zip_file": ("test.zip", f, "application/zip")}
+        )
+    
+    # Assert
+    assert response.status_code == 400
+    assert "truncated" in response.json()["detail"]
+    company_root = config.COLLECTIONS_ROOT / company_id
+    assert not company_root.exists() or not any(company_root.iterdir())
+
 def test_create_collection_empty_zip_returns_400(client, tmp_path, company_id):
     """Test that empty ZIP returns 400."""
     # Arrange
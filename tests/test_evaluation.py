@@ -0,0 +1,82 @@
+import asyncio
+import json
+import app.services.evaluation_service as evaluation_service
+from app.models.evaluation_schemas import EvaluationRecord, EvaluationMetrics
+from app.services.evaluation_service import EvaluationBatcher, save_evaluation_record
+
+def _make_record(index: int, faithfulness: float) -> EvaluationRecord:
+    return EvaluationRecord(
+        collection_id="c1",
+        question_id=f"q{index}",
+        question="Who knows Python?",
+        retrieved_resumes=["resume1.txt"],
+        retrieved_chunks=["Python developer"],
+        answer="resume1",
+        metrics=EvaluationMetrics(faithfulness=faithfulness, context_recall=0.5, answer_relevance=0.5),
+        auto_fail=faithfulness < 0.85,
+        timestamp=f"2024-01-0{index + 1}T00:00:00Z"
+    )
+
+def test_evaluation_records_newest_first_with_total(client, temp_collections_root, company_id):
+    """Test that records endpoint returns the newest `limit` records and the full total."""
+    # Arrange
+    (temp_collections_root / company_id / "c1").mkdir(parents=True)
+    for i in range(4):
+        save_evaluation_record(company_id, "c1", _make_record(i, 0.9))
+
+    # Act
+    response = client.get(
+        "/collections/c1/rag/evaluation/records",
+        params={"company_id": company_id, "limit": 2}
+    )
+
+    # Assert
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 4
+    assert [r["question_id"] for r in data["records"]] == ["q3", "q2"]
+
+def test_evaluation_summary_includes_legacy_records(client, temp_collections_root, company_id):
+    """Test that per-record JSON files are migrated into the log and summarized."""
+    # Arrange
+    eval_dir = temp_collections_root / company_id / "c1" / "rag" / "evaluations"
+    eval_dir.mkdir(parents=True)
+    legacy = _make_record(0, 0.5)
+    (eval_dir / "q0.json").write_text(json.dumps(legacy.model_dump()))
+    (eval_dir / "q9.json").write_text("{not json")
+    save_evaluation_record(company_id, "c1", _make_record(1, 1.0))
+
+    # Act
+    response = client.get(
+        "/collections/c1/rag/evaluation/summary",
+        params={"company_id": company_id}
+    )
+
+    # Assert
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_questions"] == 2
+    assert data["failure_rate"] == 0.5
+    assert abs(data["avg_metrics"]["faithfulness"] - 0.75) < 1e-9
+    assert not (eval_dir / "q0.json").exists()
+    assert (eval_dir / "q9.json.bad").read_text() == "{not json"
+
+def test_evaluation_batcher_coalesces_concurrent_queries(monkeypatch):
+    """Test that queries submitted together are scored in one batch, in order."""
+    # Arrange
+    calls = []
+    def fake_batch(rows):
+        calls.append(rows)
+        return [{"faithfulness": float(i), "context_recall": 0.0, "answer_relevance": 0.0} for i in range(len(rows))]
+    monkeypatch.setattr(evaluation_service, "evaluate_rag_batch", fake_batch)
+    batcher = EvaluationBatcher(max_size=8, max_wait=0.05)
+
+    # Act
+    async def run():
+        return await asyncio.gather(*(batcher.submit(f"q{i}", "a", ["ctx"]) for i in range(3)))
+    scores = asyncio.run(run())
+
+    # Assert
+    assert len(calls) == 1
+    assert [row[0] for row in calls[0]] == ["q0", "q1", "q2"]
+    assert [s["faithfulness"] for s in scores] == [0.0, 1.0, 2.0]
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+import app.utils.faiss_index as faiss_index
+
+
+@pytest.mark.parametrize("num_vectors, expected_type", [
+    (200, "IndexFlatL2"),
+    (1_000, "IndexHNSWSQ"),
+    (3_000, "IndexIVFPQ"),
+])
+def test_build_and_load_each_index_tier(tmp_path, monkeypatch, num_vectors, expected_type):
+    """Each size tier builds, saves, and loads back (memory-mapped) for search."""
+    # Shrink the tier thresholds so every index type is built from a small collection
+    monkeypatch.setattr(faiss_index, "HNSW_MIN_VECTORS", 500)
+    monkeypatch.setattr(faiss_index, "IVFPQ_MIN_VECTORS", 2_000)
+    
+    rng = np.random.default_rng(0)
+    embeddings = rng.random((num_vectors, 32), dtype=np.float32)
+    mapping = {i: f"resume_{i}.pdf" for i in range(num_vectors)}
+    index_path = tmp_path / "index.faiss"
+    mapping_path = tmp_path / "mapping.json"
+    meta_path = tmp_path / "meta.json"
+    
+    faiss_index.build_index(embeddings, mapping, index_path, mapping_path, meta_path)
+    
+    index = faiss_index.load_index(index_path)
+    assert type(index).__name__ == expected_type
+    assert index.ntotal == num_vectors
+    assert faiss_index.get_index_metadata(meta_path)["index_type"] == expected_type
+    assert faiss_index.load_resume_mapping(mapping_path)[0] == "resume_0.pdf"
+    
+    distances, indices = faiss_index.search_index(index, embeddings[0], k=5)
+    assert len(indices) == 5
+    assert 0 in indices.tolist()
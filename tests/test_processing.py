@@ -146,3 +146,55 @@ def test_process_collection_duplicate_detection(client, tmp_path, company_id):
     duplicate_report = collection_root / "reports" / "duplicate_report.json"
     dup_report = json.loads(duplicate_report.read_text())
     assert len(dup_report["duplicates"]) == 1
+
+def test_process_collection_rerun_reuses_unchanged_files(client, created_collection_id, company_id, monkeypatch):
+    """Test that re-processing an unchanged collection skips extraction and keeps the report."""
+    # Arrange
+    client.post(f"/collections/{created_collection_id}/process", json={"company_id": company_id})
+    collection_root = config.COLLECTIONS_ROOT / company_id / created_collection_id
+    first_report = json.loads((collection_root / "reports" / "validation_report.json").read_text())
+    
+    import app.services.processing_service as processing_service
+    def fail_extract(path):
+        raise AssertionError(f"unchanged file re-extracted: {path}")
+    monkeypatch.setattr(processing_service, "extract_resume_file", fail_extract)
+    
+    # Act
+    response = client.post(f"/collections/{created_collection_id}/process", json={"company_id": company_id})
+    
+    # Assert
+    assert response.status_code == 200
+    second_report = json.loads((collection_root / "reports" / "validation_report.json").read_text())
+    assert second_report == first_report
+    assert (collection_root / "artifacts" / "processing_cache.json").exists()
+
+def test_process_collection_rerun_reuses_same_named_files_in_subdirs(client, tmp_path, company_id, monkeypatch):
+    """Test that same-named files in different folders keep separate cache entries."""
+    # Arrange
+    files = {
+        "team_a/cv.txt": RESUME_TEXT_MATCH.encode('utf-8'),
+        "team_b/cv.txt": RESUME_TEXT_PARTIAL.encode('utf-8')
+    }
+    zip_path = make_zip_with_files(tmp_path, files)
+    with open(zip_path, 'rb') as f:
+        create_response = client.post(
+            "/collections/create",
+            data={"company_id": company_id},
+            files={"zip_file": ("test.zip", f, "application/zip")}
+        )
+    collection_id = create_response.json()["collection_id"]
+    client.post(f"/collections/{collection_id}/process", json={"company_id": company_id})
+    collection_root = config.COLLECTIONS_ROOT / company_id / collection_id
+    
+    import app.services.processing_service as processing_service
+    def fail_extract(path):
+        raise AssertionError(f"unchanged file re-extracted: {path}")
+    monkeypatch.setattr(processing_service, "extract_resume_file", fail_extract)
+    
+    # Act
+    response = client.post(f"/collections/{collection_id}/process", json={"company_id": company_id})
+    
+    # Assert
+    assert response.status_code == 200
+    cache = json.loads((collection_root / "artifacts" / "processing_cache.json").read_text())
+    assert sorted(cache) == ["team_a/cv.txt", "team_b/cv.txt"]
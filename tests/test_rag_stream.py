@@ -0,0 +1,48 @@
+"""Tests for RAG SSE chunk batching."""
+import asyncio
+
+from app.api.routes.collections_rag import ChunkBroadcast
+
+
+def test_read_batch_flushes_error_in_its_own_frame():
+    async def run():
+        chunks = ChunkBroadcast()
+        await chunks.append("partial ")
+        await chunks.append("answer")
+        await chunks.append("Error: LLM request failed")
+        await chunks.close()
+
+        # Generous linger: everything is already buffered, only the error splits the frame
+        frames = []
+        cursor = 0
+        while True:
+            last_id, text, done = await chunks.read_batch(cursor, timeout=1.0, linger=1.0)
+            if last_id >= 0:
+                frames.append(text)
+                cursor = last_id + 1
+            if done:
+                return frames
+
+    frames = asyncio.run(run())
+    assert frames == ["partial answer", "Error: LLM request failed"]
+
+
+def test_read_batch_stops_lingering_at_late_error():
+    async def run():
+        chunks = ChunkBroadcast()
+        await chunks.append("partial answer")
+
+        async def fail_soon():
+            await asyncio.sleep(0.01)
+            await chunks.append("Error: LLM request failed")
+            await chunks.append("ignored tail")
+
+        producer = asyncio.create_task(fail_soon())
+        first = await chunks.read_batch(0, timeout=1.0, linger=0.5)
+        second = await chunks.read_batch(first[0] + 1, timeout=1.0, linger=0.5)
+        await producer
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == (0, "partial answer", False)
+    assert second == (1, "Error: LLM request failed", False)
@@ -70,7 +70,7 @@ def test_rank_success_returns_outputs(client, processed_collection_id, company_i
     vectorizer = collection_root / "artifacts" / "tfidf_vectorizer.pkl"
     assert vectorizer.exists()
     
-    matrix = collection_root / "artifacts" / "resume_matrix.npz"
+    matrix = collection_root / "artifacts" / "resume_matrix" / "data.npy"
     assert matrix.exists()
     
     index = collection_root / "artifacts" / "resume_index.json"
@@ -93,3 +93,24 @@ def test_outputs_endpoint_flags_files(client, ranked_collection_id, company_id):
     assert "outputs" in data
     assert data["outputs"]["ranking_results.json"] is True
     assert data["outputs"]["ranking_results.csv"] is True
+
+def test_report_stream_emits_ndjson_sections(client, ranked_collection_id, company_id):
+    """Test that streaming report emits one section per line, then ranking rows."""
+    # Act
+    response = client.get(
+        f"/collections/{ranked_collection_id}/report/stream",
+        params={
+            "company_id": company_id,
+            "include_results": True
+        }
+    )
+    
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    
+    sections = [line["section"] for line in lines]
+    assert sections[:5] == ["meta", "validation_report", "duplicate_report", "ranking_summary", "latency"]
+    assert lines[3]["data"] is not None
+    assert sections.count("ranking_results") > 0